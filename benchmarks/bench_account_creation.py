@@ -0,0 +1,61 @@
+# PasswordGenerate/benchmarks/bench_account_creation.py
+#
+# Compara o fluxo antigo de criação de conta (register_master_password seguido de
+# login_with_master_password) com o fluxo combinado register_and_login.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_account_creation
+
+import os
+import tempfile
+import time
+
+from src.config.cipher_manager import CipherManager
+from src.config.kdf import Pbkdf2Kdf
+from src.database.repositories.repository import PasswordRepository
+from src.database.repositories.repository_config import ConfigRepository
+from src.database.services.security_service import SecurityService
+
+MASTER_PASSWORD = "senha-mestra-de-benchmark"
+KDF = Pbkdf2Kdf()  # Parâmetros fixos, para que a calibração não entre na medição
+
+class CountingCipherManager(CipherManager):
+    """CipherManager que conta quantas derivações de chave foram feitas."""
+
+    def __init__(self):
+        super().__init__()
+        self.derive_count = 0
+
+    def _derive_key(self, master_password: str, salt: bytes, kdf=None) -> bytes:
+        self.derive_count += 1
+        return super()._derive_key(master_password, salt, kdf)
+
+def _new_service(db_dir: str, db_name: str) -> tuple[SecurityService, CountingCipherManager]:
+    db_path = os.path.join(db_dir, db_name)
+    cipher_manager = CountingCipherManager()
+    service = SecurityService(PasswordRepository(db_path), ConfigRepository(db_path), cipher_manager)
+    return service, cipher_manager
+
+def run_legacy_flow(db_dir: str) -> tuple[int, float]:
+    service, cipher_manager = _new_service(db_dir, "legacy.db")
+    start = time.perf_counter()
+    assert service.register_master_password(MASTER_PASSWORD, KDF)
+    assert service.login_with_master_password(MASTER_PASSWORD)
+    return cipher_manager.derive_count, time.perf_counter() - start
+
+def run_combined_flow(db_dir: str) -> tuple[int, float]:
+    service, cipher_manager = _new_service(db_dir, "combined.db")
+    start = time.perf_counter()
+    assert service.register_and_login(MASTER_PASSWORD, KDF)
+    return cipher_manager.derive_count, time.perf_counter() - start
+
+def main():
+    with tempfile.TemporaryDirectory() as db_dir:
+        legacy_count, legacy_time = run_legacy_flow(db_dir)
+        combined_count, combined_time = run_combined_flow(db_dir)
+
+    print(f"register + login:   {legacy_count} derivação(ões), {legacy_time * 1000:.1f} ms")
+    print(f"register_and_login: {combined_count} derivação(ões), {combined_time * 1000:.1f} ms")
+    assert legacy_count == 2, "o fluxo antigo deveria derivar a chave duas vezes"
+    assert combined_count == 1, "o fluxo combinado deveria derivar a chave uma única vez"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# PasswordGenerate/benchmarks/bench_agent.py
+#
+# Compara o custo de obter uma senha sem e com o agente do cofre:
+# - sem agente: cada processo cria o SecurityService e faz o login completo
+#   (derivação da senha mestra com a KDF calibrada para esta máquina);
+# - com agente: requisição 'get' pelo socket Unix, com a conexão reaproveitada
+#   e com uma conexão nova por requisição.
+# O agente roda em uma thread deste processo, com um cofre temporário.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_agent [requisições]
+
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from src.agent.client import AgentClient
+from src.agent.server import VaultAgent
+from src.cli import open_service
+
+ENTRY_COUNT = 1000
+LOGIN_ROUNDS = 3
+MASTER_PASSWORD = "benchmark-master-password"
+
+def _start_agent(service, socket_path: str) -> tuple[VaultAgent, threading.Thread]:
+    agent = VaultAgent(service, socket_path, idle_timeout=0)
+    ready = threading.Event()
+    thread = threading.Thread(target=asyncio.run, args=(agent.serve(on_ready=ready.set),), daemon=True)
+    thread.start()
+    ready.wait()
+    return agent, thread
+
+def _per_request_us(count: int, fn) -> float:
+    start = time.perf_counter()
+    for index in range(count):
+        fn(index)
+    return (time.perf_counter() - start) / count * 1e6
+
+def main():
+    request_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as work_dir, contextlib.redirect_stdout(io.StringIO()):
+        db_path = os.path.join(work_dir, "agent.db")
+        service = open_service(db_path)
+        service.register_and_login(MASTER_PASSWORD)
+        service.save_password_entries_bulk((f"site-{i}", f"senha-{i}") for i in range(ENTRY_COUNT))
+        service.logout()
+
+        login_times = []
+        for round_number in range(LOGIN_ROUNDS):
+            start = time.perf_counter()
+            cold_service = open_service(db_path)
+            cold_service.login_with_master_password(MASTER_PASSWORD)
+            assert cold_service.retrieve_password_by_name(f"site-{round_number}") == f"senha-{round_number}"
+            login_times.append(time.perf_counter() - start)
+            cold_service.shutdown()
+
+        agent_service = open_service(db_path)
+        agent_service.login_with_master_password(MASTER_PASSWORD)
+        socket_path = os.path.join(work_dir, "agent.sock")
+        agent, thread = _start_agent(agent_service, socket_path)
+
+        client = AgentClient(socket_path)
+        persistent_us = _per_request_us(request_count, lambda i: client.get(f"site-{i % ENTRY_COUNT}"))
+        search_us = _per_request_us(request_count, lambda i: client.search(f"site-{i % 100}", limit=10))
+
+        def get_with_new_connection(i):
+            with contextlib.closing(AgentClient(socket_path)) as fresh_client:
+                fresh_client.get(f"site-{i % ENTRY_COUNT}")
+        fresh_us = _per_request_us(request_count // 5, get_with_new_connection)
+
+        client.stop()
+        client.close()
+        thread.join()
+
+    print(f"Sem agente (login + get):        {statistics.median(login_times) * 1000:10.1f} ms")
+    print(f"Agente, get (conexão mantida):   {persistent_us:10.1f} µs")
+    print(f"Agente, search (conexão mantida):{search_us:10.1f} µs")
+    print(f"Agente, get (conexão nova):      {fresh_us:10.1f} µs")
+
+if __name__ == "__main__":
+    main()
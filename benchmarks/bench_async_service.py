@@ -0,0 +1,88 @@
+# PasswordGenerate/benchmarks/bench_async_service.py
+#
+# Mede consultas concorrentes ao cofre a partir de um loop asyncio:
+# - SecurityService síncrono chamado direto no loop (bloqueia o loop a cada consulta);
+# - uma chamada run_in_executor por consulta, no executor padrão do loop;
+# - AsyncSecurityService, que agrupa as consultas de um mesmo ciclo do loop.
+# Para cada modo: consultas por segundo e o maior atraso observado por uma tarefa
+# que tenta acordar a cada 1 ms (quanto o loop ficou sem responder).
+# O cofre é criado em um diretório temporário.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_async_service [consultas]
+
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.cli import open_service
+from src.config.kdf import Pbkdf2Kdf
+from src.database.services.async_security_service import AsyncSecurityService
+
+ENTRY_COUNT = 20000
+CONCURRENCY = 200  # Consultas em andamento ao mesmo tempo
+TICK = 0.001
+
+async def _max_loop_lag(stop: asyncio.Event) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        worst = max(worst, time.perf_counter() - start - TICK)
+    return worst
+
+async def _measure(names: list[str], lookup) -> tuple[float, float]:
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_max_loop_lag(stop))
+    await asyncio.sleep(0)
+    queue = iter(names)
+
+    async def worker():
+        for name in queue:
+            assert await lookup(name) is not None
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return len(names) / elapsed, await lag_task
+
+async def run(service, names: list[str]) -> list[tuple[str, float, float]]:
+    loop = asyncio.get_running_loop()
+
+    async def blocking(name):
+        return service.retrieve_password_by_name(name)
+
+    async def per_call_executor(name):
+        return await loop.run_in_executor(None, service.retrieve_password_by_name, name)
+
+    results = [("SecurityService no loop", *await _measure(names, blocking)),
+               ("run_in_executor por consulta", *await _measure(names, per_call_executor))]
+    async with AsyncSecurityService(service) as async_service:
+        results.append(("AsyncSecurityService", *await _measure(names, async_service.retrieve_password_by_name)))
+        batches = async_service.read_batches
+    results.append((f"  ({batches} SELECTs agrupados para {len(names)} consultas)", 0, 0))
+    return results
+
+def main():
+    lookup_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as work_dir, contextlib.redirect_stdout(io.StringIO()):
+        service = open_service(os.path.join(work_dir, "async.db"))
+        service.register_and_login("benchmark-master-password", Pbkdf2Kdf(iterations=1000))
+        service.save_password_entries_bulk(((f"site-{i}", f"senha-{i}") for i in range(ENTRY_COUNT)),
+                                           keep_rows=False)
+        names = [f"site-{random.randrange(ENTRY_COUNT)}" for _ in range(lookup_count)]
+        results = asyncio.run(run(service, names))
+        service.shutdown()
+
+    for title, per_second, lag in results:
+        if per_second:
+            print(f"{title:32} {per_second:10,.0f} consultas/s   maior atraso do loop: {lag * 1000:7.2f} ms")
+        else:
+            print(title)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# PasswordGenerate/benchmarks/bench_kdf_calibration.py
+#
+# Calibra cada KDF disponível para o tempo de desbloqueio desejado e mede o
+# resultado, comparando com o PBKDF2 fixo em 480.000 iterações dos cofres antigos.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_kdf_calibration [alvo_ms]
+
+import sys
+
+from src.config.kdf import (DEFAULT_TARGET_MS, Pbkdf2Kdf, available_kdf_names, calibrate_kdf,
+                            measure_kdf)
+
+def main():
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TARGET_MS
+
+    legacy = Pbkdf2Kdf()
+    print(f"{'legado':<10} {legacy!r:<60} {measure_kdf(legacy, rounds=3) * 1000:8.1f} ms")
+
+    for name in available_kdf_names():
+        kdf = calibrate_kdf(name, target_ms)
+        elapsed_ms = measure_kdf(kdf, rounds=3) * 1000
+        print(f"{name:<10} {kdf!r:<60} {elapsed_ms:8.1f} ms (alvo {target_ms:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# PasswordGenerate/benchmarks/bench_lock_unlock.py
+#
+# Compara o tempo de "voltar a usar" o cofre, até o resultado da primeira busca:
+# - logout + login: o índice de nomes é descartado e reconstruído a partir do banco;
+# - lock + desbloqueio: o índice (só metadados) é mantido e apenas conferido.
+# A KDF usada é rápida de propósito, para isolar o custo além da derivação da
+# senha mestra (que é o mesmo nos dois casos). O cofre fica em um diretório temporário.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_lock_unlock [entradas]
+
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from src.cli import open_service
+from src.config.kdf import Pbkdf2Kdf
+
+ROUNDS = 5
+MASTER_PASSWORD = "benchmark-master-password"
+
+def _time_to_first_search(service, close_session) -> float:
+    close_session()
+    start = time.perf_counter()
+    service.login_with_master_password(MASTER_PASSWORD)
+    service.search_password_names("site-42")
+    return time.perf_counter() - start
+
+def main():
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as work_dir, contextlib.redirect_stdout(io.StringIO()):
+        service = open_service(os.path.join(work_dir, "lock.db"))
+        service.build_index_on_login = True  # Como na interface
+        service.register_and_login(MASTER_PASSWORD, Pbkdf2Kdf(iterations=1000))
+        service.save_password_entries_bulk(((f"site-{i}", f"senha-{i}") for i in range(entry_count)),
+                                           keep_rows=False)
+        service.search_password_names("site-1")
+
+        results = {}
+        for title, close_session in (("logout + login", service.logout), ("lock + desbloqueio", service.lock)):
+            results[title] = statistics.median(_time_to_first_search(service, close_session) for _ in range(ROUNDS))
+        service.shutdown()
+
+    print(f"{entry_count} entradas, até a primeira busca (mediana de {ROUNDS}, sem o custo da KDF):")
+    for title, elapsed in results.items():
+        print(f"  {title:20} {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
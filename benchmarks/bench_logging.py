@@ -0,0 +1,51 @@
+# PasswordGenerate/benchmarks/bench_logging.py
+#
+# Mede o custo do log no caminho quente (retrieve_password_by_name) com o log
+# desligado (padrão), em INFO e em DEBUG. A saída do log vai para um buffer em
+# memória, para não medir o terminal. O cofre é criado em um diretório temporário.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_logging [consultas]
+
+import io
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.cli import open_service
+from src.config.kdf import Pbkdf2Kdf
+from src.config.log_config import ROOT_LOGGER_NAME, configure_logging
+
+ENTRY_COUNT = 5000
+LEVELS = (None, "INFO", "DEBUG")
+
+def main():
+    lookup_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    random.seed(1)
+    names = [f"site-{random.randrange(ENTRY_COUNT)}" for _ in range(lookup_count)]
+    log_output = io.StringIO()
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        service = open_service(os.path.join(work_dir, "logging.db"))
+        service.register_and_login("benchmark-master-password", Pbkdf2Kdf(iterations=1000))
+        service.save_password_entries_bulk(((f"site-{i}", f"senha-{i}") for i in range(ENTRY_COUNT)),
+                                           keep_rows=False)
+        for level in LEVELS:
+            if level:
+                configure_logging(level, stream=log_output)
+            else:
+                root.setLevel(logging.WARNING)  # Sem configuração: só o NullHandler recebe avisos
+            start = time.perf_counter()
+            for name in names:
+                service.retrieve_password_by_name(name)
+            results.append((level or "desligado", lookup_count / (time.perf_counter() - start)))
+        service.shutdown()
+
+    for title, per_second in results:
+        print(f"log {title:10} {per_second:10,.0f} consultas/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# PasswordGenerate/benchmarks/bench_name_search.py
+#
+# Mede o índice de nomes usado na busca enquanto o usuário digita: tempo de
+# construção para 100 mil nomes e tempo por tecla de buscas por prefixo,
+# substring e aproximadas (com erro de digitação).
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_name_search
+
+import random
+import time
+
+from src.database.services.search_index import NameIndex
+
+NAME_COUNT = 100000
+ROUNDS = 20
+SITES = ("github", "gmail", "banco", "netflix", "amazon", "empresa", "intranet", "servidor",
+         "producao", "homologacao", "aws", "azure", "google", "slack", "spotify", "steam")
+USERS = ("ana", "bruno", "carla", "diego", "eduarda", "felipe", "admin", "deploy")
+
+def main():
+    rng = random.Random(42)
+    names = {f"{rng.choice(SITES)}.{rng.choice(SITES)} ({rng.choice(USERS)}{i})" for i in range(NAME_COUNT)}
+
+    index = NameIndex()
+    start = time.perf_counter()
+    index.build((name, "2026-01-01 00:00:00") for name in names)
+    print(f"Construção do índice ({len(index)} nomes): {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    # Cada consulta simula as teclas digitadas, uma busca por tecla
+    for query in ("github.slack (ana1", "slack (die", "netflx", "homologacao.spotfy"):
+        keystrokes = [query[:size] for size in range(1, len(query) + 1)]
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            for text in keystrokes:
+                results = index.search(text)
+        per_keystroke = (time.perf_counter() - start) / (ROUNDS * len(keystrokes))
+        print(f"'{query}': {per_keystroke * 1000:.3f} ms por tecla, {len(results)} resultados "
+              f"(primeiro: {results[0] if results else '-'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# PasswordGenerate/benchmarks/bench_parallel_decrypt.py
+#
+# Compara a descriptografia serial de tokens Fernet (um decrypt_password_bytes por vez)
+# com SecurityService.decrypt_entries, que distribui os blocos em um pool de threads.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_parallel_decrypt [quantidade]
+
+import os
+import sys
+import tempfile
+import time
+
+from src.config.kdf import Pbkdf2Kdf
+from src.database.models.model import PasswordEntry
+from src.database.repositories.repository import PasswordRepository
+from src.database.repositories.repository_config import ConfigRepository
+from src.database.services.security_service import SecurityService
+
+ROUNDS = 3
+
+def main():
+    token_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_path = os.path.join(db_dir, "decrypt.db")
+        service = SecurityService(PasswordRepository(db_path), ConfigRepository(db_path))
+        assert service.register_and_login("senha-mestra", Pbkdf2Kdf(1000))
+        fernet_instance = service._current_fernet_instance
+        cipher_manager = service.cipher_manager
+
+        entries = [PasswordEntry(id=i, name=f"entrada-{i}",
+                                 encrypted_password=cipher_manager.encrypt_password_bytes(fernet_instance, f"segredo-{i}"))
+                   for i in range(token_count)]
+
+        serial_time = parallel_time = float("inf")
+        for _ in range(ROUNDS):  # Melhor de ROUNDS execuções, para reduzir o ruído
+            start = time.perf_counter()
+            serial = [cipher_manager.decrypt_password_bytes(fernet_instance, entry.encrypted_password) for entry in entries]
+            serial_time = min(serial_time, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            parallel = [password for _, password in service.decrypt_entries(entries)]
+            parallel_time = min(parallel_time, time.perf_counter() - start)
+
+        service.shutdown()
+
+    assert serial == parallel
+    print(f"{token_count} tokens Fernet, {service.decrypt_workers} threads")
+    print(f"serial:   {serial_time * 1000:8.1f} ms ({token_count / serial_time:10.0f} tokens/s)")
+    print(f"paralelo: {parallel_time * 1000:8.1f} ms ({token_count / parallel_time:10.0f} tokens/s)")
+
+if __name__ == "__main__":
+    main()
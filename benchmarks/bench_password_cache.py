@@ -0,0 +1,54 @@
+# PasswordGenerate/benchmarks/bench_password_cache.py
+#
+# Mede retrieve_password_by_name com consultas concentradas em poucas entradas
+# (distribuição de Zipf sobre um conjunto "quente"), sem cache e com o cache de
+# senhas descriptografadas em alguns tamanhos, mostrando a taxa de acertos.
+# O cofre é criado em um diretório temporário.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_password_cache [consultas]
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.cli import open_service
+from src.config.kdf import Pbkdf2Kdf
+from src.database.services.password_cache import DecryptedPasswordCache
+
+ENTRY_COUNT = 20000
+HOT_ENTRIES = 500
+CACHE_SIZES = (0, 32, 128, 512)
+
+def main():
+    lookup_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    random.seed(1)
+    hot_names = [f"site-{i}" for i in random.sample(range(ENTRY_COUNT), HOT_ENTRIES)]
+    weights = [1 / rank for rank in range(1, HOT_ENTRIES + 1)]
+    names = random.choices(hot_names, weights, k=lookup_count)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir, contextlib.redirect_stdout(io.StringIO()):
+        service = open_service(os.path.join(work_dir, "cache.db"))
+        service.register_and_login("benchmark-master-password", Pbkdf2Kdf(iterations=1000))
+        service.save_password_entries_bulk(((f"site-{i}", f"senha-{i}") for i in range(ENTRY_COUNT)),
+                                           keep_rows=False)
+        for cache_size in CACHE_SIZES:
+            service.password_cache = DecryptedPasswordCache(cache_size) if cache_size else None
+            start = time.perf_counter()
+            for name in names:
+                service.retrieve_password_by_name(name)
+            elapsed = time.perf_counter() - start
+            stats = service.password_cache.stats() if cache_size else None
+            results.append((cache_size, lookup_count / elapsed, stats))
+        service.shutdown()
+
+    for cache_size, per_second, stats in results:
+        title = f"cache de {cache_size} senhas" if cache_size else "sem cache"
+        hit_rate = f"acertos: {stats['hit_rate']:6.1%}" if stats else ""
+        print(f"{title:22} {per_second:10,.0f} consultas/s   {hit_rate}")
+
+if __name__ == "__main__":
+    main()
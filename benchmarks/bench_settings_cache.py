@@ -0,0 +1,52 @@
+# PasswordGenerate/benchmarks/bench_settings_cache.py
+#
+# Conta os SELECTs em 'app_settings' feitos durante uma sessão típica
+# (login seguido de várias gravações) e mede o custo de get_setting com o cache.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_settings_cache
+
+import os
+import tempfile
+import time
+
+from src.config.kdf import Pbkdf2Kdf
+from src.database.repositories.repository import PasswordRepository
+from src.database.repositories.repository_config import ConfigRepository
+from src.database.services.security_service import SecurityService, MASTER_SALT_SETTING_KEY
+
+ENTRY_COUNT = 200
+LOOKUP_COUNT = 100000
+
+def main():
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_path = os.path.join(db_dir, "settings.db")
+        service = SecurityService(PasswordRepository(db_path), ConfigRepository(db_path))
+        assert service.register_and_login("senha-mestra", Pbkdf2Kdf(1000))
+        service.logout()  # Nova sessão: o cache começa vazio
+
+        settings_selects = []
+        conn = service.config_repo._get_connection()
+        conn.set_trace_callback(
+            lambda sql: settings_selects.append(sql) if sql.lstrip().upper().startswith("SELECT")
+            and "app_settings" in sql else None)
+
+        assert service.is_master_password_set()
+        assert service.login_with_master_password("senha-mestra")
+        for i in range(ENTRY_COUNT):
+            assert service.save_password_entry(f"entrada-{i}", "segredo")
+        entry = service.get_all_password_entries_metadata()[0]
+        assert service.update_password_entry(entry.id, "novo-segredo")
+
+        start = time.perf_counter()
+        for _ in range(LOOKUP_COUNT):
+            service.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
+        elapsed = time.perf_counter() - start
+
+        conn.set_trace_callback(None)
+        service.shutdown()
+
+    print(f"SELECTs em app_settings na sessão: {len(settings_selects)}")
+    print(f"get_setting com cache: {elapsed / LOOKUP_COUNT * 1e9:.0f} ns por chamada")
+    assert len(settings_selects) == 1, "as configurações deveriam ser lidas do disco uma única vez por sessão"
+
+if __name__ == "__main__":
+    main()
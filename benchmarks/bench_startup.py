@@ -0,0 +1,77 @@
+# PasswordGenerate/benchmarks/bench_startup.py
+#
+# Mede a abertura da aplicação em processos novos (importações frias):
+# - os módulos mais caros de 'import main_app', segundo 'python -X importtime';
+# - o tempo até a primeira janela (processo iniciado -> MainWindow exibida),
+#   comparado com a construção de todas as telas de uma vez, como antes.
+# Sem display, usa a plataforma 'offscreen' do Qt. O banco é criado em um
+# diretório temporário, para não tocar no cofre real.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_startup [rodadas]
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+TOP_MODULES = 15
+
+# Executado no processo filho, a partir de um diretório temporário (o banco fica em ./data)
+FIRST_WINDOW_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import main_app
+window = main_app.MainWindow()
+if {eager}:
+    window.welcome_screen, window.create_login_screen, window.login_screen, window.options_screen
+window.show()
+app.processEvents()
+print(f"RESULT {{time.perf_counter() - start}}")
+"""
+
+def _child_env() -> dict:
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+def _import_breakdown(root: str, work_dir: str) -> list[tuple[int, int, str]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, {root!r}); "
+                             "import main_app"], cwd=work_dir, env=_child_env(), capture_output=True, text=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return modules
+
+def _time_to_first_window(root: str, work_dir: str, eager: bool) -> float:
+    script = FIRST_WINDOW_SCRIPT.format(root=root, eager=eager)
+    result = subprocess.run([sys.executable, "-c", script], cwd=work_dir, env=_child_env(),
+                            capture_output=True, text=True, check=True)
+    line = next(line for line in result.stdout.splitlines() if line.startswith("RESULT "))
+    return float(line.split()[1])
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    root = os.path.abspath(".")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        modules = _import_breakdown(root, work_dir)
+        total_us = next(cumulative for cumulative, _, name in modules if name.strip() == "main_app")
+        print(f"'import main_app': {total_us / 1000:.1f} ms; módulos mais caros (acumulado / próprio):")
+        for cumulative_us, self_us, name in sorted(modules, reverse=True)[:TOP_MODULES]:
+            print(f"  {cumulative_us / 1000:7.1f} ms {self_us / 1000:7.1f} ms  {name}")
+
+        _time_to_first_window(root, work_dir, eager=False)  # Cria o banco e aquece o cache de disco
+        for title, eager in (("telas sob demanda", False), ("todas as telas na abertura", True)):
+            times = [_time_to_first_window(root, work_dir, eager) for _ in range(rounds)]
+            print(f"Primeira janela ({title}): mediana de {statistics.median(times) * 1000:.0f} ms "
+                  f"em {rounds} rodadas")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# PasswordGenerate/benchmarks/bench_token_storage.py
+#
+# Compara o armazenamento dos tokens Fernet em texto base64 (esquema versão 2)
+# com os bytes brutos em BLOB (versão 3): tamanho do banco após VACUUM e vazão
+# de leitura + descriptografia de todas as entradas.
+# Execute a partir da raiz do projeto:  python -m benchmarks.bench_token_storage [quantidade]
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from src.config.cipher_manager import CipherManager
+from src.database.migrations import migrate, SCHEMA_VERSION
+
+TEXT_TOKENS_VERSION = 2  # Última versão do esquema com 'encrypted_password' em TEXT
+
+def _build_text_vault(db_path: str, row_count: int, cipher_manager: CipherManager, fernet_instance):
+    conn = sqlite3.connect(db_path)
+    migrate(conn, TEXT_TOKENS_VERSION)
+    conn.execute("INSERT INTO key_epochs (salt) VALUES (?)", (os.urandom(16).hex(),))
+    with conn:
+        conn.executemany(
+            "INSERT INTO password_entries (name, encrypted_password, key_epoch_id, updated_at) "
+            "VALUES (?, ?, 1, CURRENT_TIMESTAMP)",
+            ((f"entrada-{i}", cipher_manager.encrypt_password(fernet_instance, f"segredo-{i:08d}"))
+             for i in range(row_count)))
+    conn.execute("VACUUM")
+    conn.close()
+
+def _read_and_decrypt(db_path: str, decrypt, fernet_instance) -> tuple[float, list]:
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    passwords = [decrypt(fernet_instance, row[0])
+                 for row in conn.execute("SELECT encrypted_password FROM password_entries ORDER BY id")]
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed, passwords
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    cipher_manager = CipherManager()
+    fernet_instance = cipher_manager.get_fernet_from_key(CipherManager.bytes_to_token(os.urandom(32)))
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_path = os.path.join(db_dir, "tokens.db")
+        _build_text_vault(db_path, row_count, cipher_manager, fernet_instance)
+        text_size = os.path.getsize(db_path)
+        text_time, text_passwords = _read_and_decrypt(db_path, cipher_manager.decrypt_password, fernet_instance)
+
+        conn = sqlite3.connect(db_path)
+        start = time.perf_counter()
+        migrate(conn, SCHEMA_VERSION)
+        migration_time = time.perf_counter() - start
+        conn.execute("VACUUM")
+        conn.close()
+        blob_size = os.path.getsize(db_path)
+        blob_time, blob_passwords = _read_and_decrypt(db_path, cipher_manager.decrypt_password_bytes, fernet_instance)
+
+    assert text_passwords == blob_passwords
+    print(f"{row_count} entradas; migração TEXT -> BLOB em {migration_time * 1000:.0f} ms")
+    print(f"TEXT: {text_size / 1024 / 1024:7.2f} MiB, leitura + descriptografia "
+          f"{text_time * 1000:7.1f} ms ({row_count / text_time:9.0f} entradas/s)")
+    print(f"BLOB: {blob_size / 1024 / 1024:7.2f} MiB, leitura + descriptografia "
+          f"{blob_time * 1000:7.1f} ms ({row_count / blob_time:9.0f} entradas/s)")
+    print(f"Redução do banco: {(1 - blob_size / text_size) * 100:.1f}%")
+
+if __name__ == "__main__":
+    main()
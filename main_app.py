@@ -7,11 +7,11 @@ from PyQt6.QtCore import Qt
 from src.database.repositories.repository import PasswordRepository
 from src.database.repositories.repository_config import ConfigRepository
 from src.database.services.security_service import SecurityService
+from src.gui.session_manager import SessionManager
+from src.config.log_config import configure_logging
 
-from src.gui.welcome_screen import WelcomeScreen
-from src.gui.create_login_screen import CreateLoginScreen
-from src.gui.login_screen import LoginScreen
-from src.gui.options_screen import OptionsScreen
+# As telas (e os módulos que cada uma importa) são criadas sob demanda, na primeira
+# navegação até elas: a janela abre construindo apenas a tela inicial
 
 class MainWindow(QMainWindow):
     """
@@ -31,30 +31,20 @@ class MainWindow(QMainWindow):
             config_repository=self.config_repo
         )
 
-        # ... O resto do arquivo permanece exatamente o mesmo ...
+        # Bloqueio explícito, bloqueio automático e logout da sessão
+        self.session_manager = SessionManager(self.security_service, parent=self)
+        self.session_manager.is_busy = self._has_background_work
+        self.session_manager.stop_background_work = self._stop_background_work
+        self.session_manager.locked.connect(self._on_session_locked)
+        self.session_manager.logged_out.connect(self._on_logged_out)
+
         # QStackedWidget para gerenciar as diferentes telas
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
-
-        # Criar instâncias das telas e adicioná-las ao QStackedWidget
-        self.welcome_screen = WelcomeScreen()
-        self.create_login_screen = CreateLoginScreen(self.security_service)
-        self.login_screen = LoginScreen(self.security_service)
-        self.options_screen = OptionsScreen(self.security_service)
-
-        self.stacked_widget.addWidget(self.welcome_screen)
-        self.stacked_widget.addWidget(self.create_login_screen)
-        self.stacked_widget.addWidget(self.login_screen)
-        self.stacked_widget.addWidget(self.options_screen)
-
-        # Conectar sinais de navegação das telas
-        self.welcome_screen.create_account_requested.connect(self.show_create_login_screen)
-        self.welcome_screen.login_requested.connect(self.show_login_screen)
-        self.create_login_screen.login_success.connect(self.show_options_screen)
-        self.create_login_screen.back_to_welcome.connect(self.show_welcome_screen)
-        self.login_screen.login_success.connect(self.show_options_screen)
-        self.login_screen.back_to_welcome.connect(self.show_welcome_screen)
-        self.options_screen.logout_requested.connect(self.show_welcome_screen)
+        self._welcome_screen = None
+        self._create_login_screen = None
+        self._login_screen = None
+        self._options_screen = None
 
         # Determinar qual tela mostrar inicialmente
         if self.security_service.is_master_password_set():
@@ -62,6 +52,47 @@ class MainWindow(QMainWindow):
         else:
             self.show_welcome_screen()
 
+    @property
+    def welcome_screen(self):
+        if self._welcome_screen is None:
+            from src.gui.welcome_screen import WelcomeScreen
+            self._welcome_screen = WelcomeScreen()
+            self._welcome_screen.create_account_requested.connect(self.show_create_login_screen)
+            self._welcome_screen.login_requested.connect(self.show_login_screen)
+            self.stacked_widget.addWidget(self._welcome_screen)
+        return self._welcome_screen
+
+    @property
+    def create_login_screen(self):
+        if self._create_login_screen is None:
+            from src.gui.create_login_screen import CreateLoginScreen
+            self._create_login_screen = CreateLoginScreen(self.security_service)
+            self._create_login_screen.login_success.connect(self.show_options_screen)
+            self._create_login_screen.back_to_welcome.connect(self.show_welcome_screen)
+            self.stacked_widget.addWidget(self._create_login_screen)
+        return self._create_login_screen
+
+    @property
+    def login_screen(self):
+        if self._login_screen is None:
+            from src.gui.login_screen import LoginScreen
+            self._login_screen = LoginScreen(self.security_service)
+            self._login_screen.login_success.connect(self.show_options_screen)
+            self._login_screen.back_to_welcome.connect(self.show_welcome_screen)
+            self.stacked_widget.addWidget(self._login_screen)
+        return self._login_screen
+
+    @property
+    def options_screen(self):
+        if self._options_screen is None:
+            # A mais pesada: importa os serviços de importação/exportação, o gerador e a tabela
+            from src.gui.options_screen import OptionsScreen
+            self._options_screen = OptionsScreen(self.security_service)
+            self._options_screen.logout_requested.connect(self.logout)
+            self._options_screen.lock_requested.connect(self.lock)
+            self.stacked_widget.addWidget(self._options_screen)
+        return self._options_screen
+
     def show_welcome_screen(self):
         self.stacked_widget.setCurrentWidget(self.welcome_screen)
 
@@ -73,13 +104,54 @@ class MainWindow(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.login_screen)
         self.login_screen.clear_fields()
 
+    def _has_background_work(self) -> bool:
+        return self._options_screen is not None and self._options_screen.has_background_work()
+
+    def _stop_background_work(self):
+        if self._options_screen is not None:
+            self._options_screen.stop_background_work()
+
+    def lock(self):
+        # A recifragem não impede o bloqueio (nem o automático): é interrompida e retomada depois
+        if self._has_background_work():
+            QMessageBox.warning(self, "Aguarde", "Aguarde o término da operação em andamento para bloquear o cofre.")
+            return
+        self.session_manager.lock()
+
+    def logout(self):
+        if self._has_background_work():
+            QMessageBox.warning(self, "Aguarde", "Aguarde o término da operação em andamento para sair.")
+            return
+        self.session_manager.logout()
+
+    def _on_session_locked(self):
+        """Limpa a tela de opções e volta ao login; o desbloqueio reaproveita o índice de busca."""
+        if self._options_screen is not None:
+            self._options_screen.clear_session_state()
+        self.show_login_screen()
+
+    def _on_logged_out(self):
+        if self._options_screen is not None:
+            self._options_screen.clear_session_state()
+        self.show_welcome_screen()
+
     def show_options_screen(self):
         self.stacked_widget.setCurrentWidget(self.options_screen)
+        self.session_manager.session_started()
         QMessageBox.information(self, "Login Bem-Sucedido", "Você está logado!")
+        self.options_screen.resume_pending_reencryption()
+
+    def shutdown(self):
+        """Encerra os trabalhos em segundo plano e fecha as conexões com o banco."""
+        if self._options_screen is not None:
+            self._options_screen.reencryption_service.shutdown()  # Interrompe a recifragem; ela continua no próximo login
+        self.security_service.shutdown()  # Encerra o executor e fecha as conexões com o banco
 
 
 if __name__ == "__main__":
+    configure_logging()  # Desligado sem a variável MY_VOULT_LOG (ver src/config/log_config.py)
     app = QApplication(sys.argv)
     window = MainWindow()
+    app.aboutToQuit.connect(window.shutdown)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
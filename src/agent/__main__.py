@@ -0,0 +1,77 @@
+# PasswordGenerate/src/agent/__main__.py
+#
+# Inicia o agente do cofre em primeiro plano:
+#
+#   python -m src.agent [--db ARQUIVO] [--socket CAMINHO] [--idle-timeout SEGUNDOS] [--locked]
+#                       [--cache-size N] [--cache-ttl SEGUNDOS]
+#
+# Sem --locked, pede a senha mestra (ou a lê de MY_VOULT_MASTER_PASSWORD) e já
+# inicia desbloqueado. Na saída padrão é impressa a linha para exportar o caminho
+# do socket, como no ssh-agent; o log vai para a saída de erro.
+
+import argparse
+import asyncio
+import signal
+import sys
+
+from src.agent.protocol import DEFAULT_IDLE_TIMEOUT, SOCKET_ENV, default_socket_path
+from src.cli import CliError, open_service, read_master_password
+from src.config.log_config import configure_logging
+from src.database.services.password_cache import DEFAULT_CACHE_TTL, DecryptedPasswordCache
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.agent",
+                                     description="Agente que mantém o cofre desbloqueado para outros processos.")
+    parser.add_argument("--db", help="Arquivo do banco (padrão: o mesmo da aplicação).")
+    parser.add_argument("--socket", help=f"Caminho do socket, em um diretório privado (0700) do usuário "
+                                         f"(padrão: ${SOCKET_ENV} ou o diretório de runtime).")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Segundos sem requisições até bloquear o cofre (0 desativa).")
+    parser.add_argument("--locked", action="store_true", help="Inicia bloqueado; desbloqueie com 'unlock'.")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="Senhas descriptografadas mantidas em cache (0 desativa; contadores em 'status').")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL,
+                        help="Segundos que cada senha pode ficar no cache.")
+    args = parser.parse_args(argv)
+    configure_logging()  # Desligado sem MY_VOULT_LOG; o log vai para a saída de erro
+    socket_path = args.socket or default_socket_path()
+
+    from src.agent.server import VaultAgent
+
+    service = open_service(args.db)
+    service.build_index_on_login = True  # O agente atende muitas buscas: o índice compensa
+    if args.cache_size > 0:
+        service.password_cache = DecryptedPasswordCache(args.cache_size, args.cache_ttl)
+    if not service.is_master_password_set():
+        print("Erro: Nenhum cofre encontrado. Crie um com 'python -m src.cli init'.", file=sys.stderr)
+        return 1
+    if not args.locked:
+        try:
+            master_password = read_master_password()
+        except CliError as e:
+            print(f"Erro: {e}", file=sys.stderr)
+            return 1
+        if not service.login_with_master_password(master_password):
+            print("Erro: Senha mestra incorreta.", file=sys.stderr)
+            return 1
+
+    agent = VaultAgent(service, socket_path, args.idle_timeout)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, agent.stop)
+        await agent.serve(on_ready=lambda: print(f"{SOCKET_ENV}={socket_path}; export {SOCKET_ENV};",
+                                                 flush=True))
+
+    try:
+        asyncio.run(run())
+    except (RuntimeError, OSError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    finally:
+        service.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# PasswordGenerate/src/agent/client.py
+
+import os
+import socket
+
+from src.agent.protocol import (ERROR_BAD_PASSWORD, MAX_MESSAGE_SIZE, SOCKET_ENV, decode_message, encode_message,
+                                peer_uid, verify_private_path)
+from src.config.log_config import get_logger
+
+logger = get_logger("agent")
+
+class AgentError(Exception):
+    """Resposta de erro do agente; 'code' é um dos códigos ERROR_* do protocolo."""
+
+    def __init__(self, code: str, message: str = None):
+        super().__init__(message or code)
+        self.code = code
+
+class AgentClient:
+    """
+    Cliente síncrono do agente do cofre (usado pela linha de comando e pela interface).
+    Mantém uma única conexão aberta com o socket, reaproveitada entre requisições.
+    Antes de enviar qualquer coisa, confere que o socket e o diretório dele são privados
+    do usuário e que o processo do outro lado é do mesmo usuário (PermissionError se não).
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._socket = None
+        self._reader = None
+
+    def _connect(self):
+        if self._socket is None:
+            verify_private_path(os.path.dirname(os.path.abspath(self.socket_path)), directory=True)
+            verify_private_path(self.socket_path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+                uid = peer_uid(sock)
+                if uid is not None and uid != os.getuid():
+                    raise PermissionError(f"O agente em '{self.socket_path}' pertence a outro usuário.")
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+            self._reader = sock.makefile("rb")
+
+    def close(self):
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+        self._socket = self._reader = None
+
+    def request(self, op: str, **params):
+        """Envia uma requisição e retorna o 'result' da resposta; levanta AgentError em caso de erro."""
+        self._connect()
+        try:
+            self._socket.sendall(encode_message({"op": op, **params}))
+            line = self._reader.readline(MAX_MESSAGE_SIZE)
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError("O agente encerrou a conexão.")
+        response = decode_message(line)
+        if not response.get("ok"):
+            raise AgentError(response.get("error", "error"), response.get("message"))
+        return response.get("result")
+
+    def status(self) -> dict:
+        return self.request("status")
+
+    def unlock(self, master_password: str) -> bool:
+        """Desbloqueia o agente; retorna False se a senha mestra estiver errada."""
+        try:
+            self.request("unlock", master_password=master_password)
+        except AgentError as e:
+            if e.code == ERROR_BAD_PASSWORD:
+                return False
+            raise
+        return True
+
+    def lock(self):
+        self.request("lock")
+
+    def get(self, name: str) -> str:
+        return self.request("get", name=name)
+
+    def search(self, query: str, limit: int = 50) -> list[str]:
+        return self.request("search", query=query, limit=limit)
+
+    def generate(self, count: int = 1, **options) -> list[str]:
+        """Gera senhas no agente; 'options' são as de generator_engine.policy_from_options."""
+        return self.request("generate", count=count, **options)
+
+    def stop(self):
+        self.request("stop")
+
+def connect_agent(socket_path: str = None) -> AgentClient | None:
+    """
+    Retorna um cliente conectado ao agente em 'socket_path' (padrão: $MY_VOULT_AGENT_SOCK),
+    ou None se não houver agente. Sem a variável, nenhum caminho padrão é tentado.
+    """
+    socket_path = socket_path or os.environ.get(SOCKET_ENV)
+    if not socket_path or not hasattr(socket, "AF_UNIX"):
+        return None
+    client = AgentClient(socket_path)
+    try:
+        client.status()
+    except PermissionError as e:
+        logger.warning("Agente ignorado: %s", e)
+        client.close()
+        return None
+    except (OSError, ValueError):
+        client.close()
+        return None
+    return client
@@ -0,0 +1,70 @@
+# PasswordGenerate/src/agent/protocol.py
+#
+# Protocolo do agente do cofre: cada requisição e cada resposta é um objeto JSON
+# em uma única linha (terminada em '\n'), trocado por um socket Unix local.
+#
+#   requisição: {"op": "get", "name": "github"}
+#   resposta:   {"ok": true, "result": "..."}  ou  {"ok": false, "error": "locked", "message": "..."}
+
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+
+SOCKET_ENV = "MY_VOULT_AGENT_SOCK"  # Caminho do socket do agente, como o SSH_AUTH_SOCK do ssh-agent
+DEFAULT_IDLE_TIMEOUT = 15 * 60  # Segundos sem requisições até o agente bloquear o cofre
+MAX_MESSAGE_SIZE = 1024 * 1024  # Maior linha aceita pelo agente e pelo cliente
+
+# Limites de 'generate': uma única requisição não pode ocupar o agente por muito tempo
+MAX_GENERATE_COUNT = 1000
+MAX_GENERATE_LENGTH = 1024
+MAX_GENERATE_WORDS = 64
+MAX_SEPARATOR_LENGTH = 16
+
+# Códigos de erro das respostas
+ERROR_LOCKED = "locked"  # Cofre bloqueado: é preciso enviar 'unlock' com a senha mestra
+ERROR_NOT_FOUND = "not_found"
+ERROR_BAD_PASSWORD = "bad_password"
+ERROR_BAD_REQUEST = "bad_request"
+
+def default_socket_path() -> str:
+    """
+    Onde o agente cria o socket sem --socket: $MY_VOULT_AGENT_SOCK, ou o diretório de
+    runtime do usuário, ou um diretório privado (0700) dentro do diretório temporário.
+    Os clientes não usam este caminho: só conectam ao indicado em $MY_VOULT_AGENT_SOCK.
+    """
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"my_voult-{os.getuid()}")
+    return os.path.join(runtime_dir, "my_voult-agent.sock")
+
+def verify_private_path(path: str, directory: bool = False):
+    """
+    Confere que 'path' (o socket, ou o diretório dele) pertence ao usuário atual e que
+    nenhum outro usuário tem acesso (0600/0700): assim, outro usuário não pode ter criado
+    o socket no lugar do agente. Levanta PermissionError se não for o caso.
+    """
+    info = os.lstat(path)
+    expected_type = stat.S_ISDIR if directory else stat.S_ISSOCK
+    if not expected_type(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        kind = "O diretório do socket" if directory else "O socket"
+        raise PermissionError(f"{kind} '{path}' não é privado do usuário atual.")
+
+def peer_uid(sock: socket.socket) -> int | None:
+    """Uid do processo do outro lado do socket (SO_PEERCRED), ou None onde o sistema não informa."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def decode_message(line: bytes) -> dict:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("A mensagem deve ser um objeto JSON.")
+    return message
@@ -0,0 +1,241 @@
+# PasswordGenerate/src/agent/server.py
+
+import asyncio
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from src.agent.protocol import (DEFAULT_IDLE_TIMEOUT, ERROR_BAD_PASSWORD, ERROR_BAD_REQUEST, ERROR_LOCKED,
+                                ERROR_NOT_FOUND, MAX_GENERATE_COUNT, MAX_GENERATE_LENGTH, MAX_GENERATE_WORDS,
+                                MAX_MESSAGE_SIZE, MAX_SEPARATOR_LENGTH, decode_message, encode_message, peer_uid,
+                                verify_private_path)
+from src.database.services.security_service import SecurityService
+from src.config.log_config import get_logger
+
+logger = get_logger("agent")
+
+class RequestError(Exception):
+    """Erro de uma requisição, devolvido ao cliente como {"ok": false, "error": code}."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+class VaultAgent:
+    """
+    Agente local do cofre, no espírito do ssh-agent: mantém a sessão desbloqueada
+    (as chaves de dados) em memória e atende requisições 'get', 'search' e 'generate'
+    de outros processos do mesmo usuário por um socket Unix, com asyncio.
+    As chaves nunca saem do agente: os clientes recebem apenas as senhas pedidas.
+    Nada bloqueia o loop: a derivação da senha mestra ('unlock') roda no executor de KDF
+    do serviço, e o SQLite, a descriptografia e a geração de senhas ('get', 'search',
+    'lock', 'generate', esta com limites de quantidade e tamanho) em uma thread própria
+    do agente, que mantém a conexão com o banco.
+    Após 'idle_timeout' segundos sem requisições, o cofre é bloqueado.
+    """
+
+    def __init__(self, security_service: SecurityService, socket_path: str,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.security_service = security_service
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout  # 0 desativa o bloqueio automático
+        self.last_activity = time.monotonic()
+        self._server = None
+        self._stopped = None
+        self._clients = {}  # Tarefa de cada conexão aberta -> StreamWriter
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-db")
+        self._handlers = {
+            "status": self._op_status,
+            "unlock": self._op_unlock,
+            "lock": self._op_lock,
+            "get": self._op_get,
+            "search": self._op_search,
+            "generate": self._op_generate,
+            "stop": self._op_stop,
+        }
+
+    @property
+    def unlocked(self) -> bool:
+        return self.security_service.active_data_key() is not None
+
+    async def serve(self, on_ready: Callable[[], None] = None):
+        """
+        Atende requisições até 'stop' (ou cancelamento), removendo o socket ao final.
+        'on_ready' é chamado assim que o socket passa a aceitar conexões.
+        """
+        self._stopped = asyncio.Event()
+        socket_dir = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        verify_private_path(socket_dir, directory=True)  # Outro usuário não pode trocar o socket
+        self._remove_stale_socket()
+        previous_umask = os.umask(0o177)  # Socket criado com permissão 0600: apenas o dono conecta
+        try:
+            self._server = await asyncio.start_unix_server(self._handle_client, self.socket_path,
+                                                           limit=MAX_MESSAGE_SIZE)
+        finally:
+            os.umask(previous_umask)
+        idle_task = asyncio.create_task(self._lock_when_idle())
+        logger.info("Ouvindo em '%s'.", self.socket_path)
+        if on_ready:
+            on_ready()
+        try:
+            async with self._server:
+                await self._stopped.wait()
+        finally:
+            idle_task.cancel()
+            self._server.close()
+            # Fecha as conexões ainda abertas: cada tarefa termina ao ler o fim do fluxo
+            for writer in self._clients.values():
+                writer.close()
+            if self._clients:
+                await asyncio.wait(list(self._clients), timeout=1)
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            await self._run(self.security_service.logout)
+            self._executor.shutdown()
+            logger.info("Agente encerrado.")
+
+    def stop(self):
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _run(self, function: Callable, *args):
+        """Executa uma operação do serviço (SQLite, descriptografia) na thread do agente."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _remove_stale_socket(self):
+        """Remove o socket de um agente que não está mais rodando; recusa iniciar se ele responder."""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise RuntimeError(f"Já existe um agente ouvindo em '{self.socket_path}'.")
+        finally:
+            probe.close()
+
+    async def _lock_when_idle(self):
+        while True:
+            remaining = self.idle_timeout - (time.monotonic() - self.last_activity) if self.idle_timeout else 60
+            if remaining <= 0:
+                if self.unlocked:
+                    await self._run(self.security_service.lock)
+                    logger.info("Cofre bloqueado por inatividade.")
+                remaining = self.idle_timeout
+            await asyncio.sleep(remaining)
+
+    @staticmethod
+    def _peer_is_owner(writer: asyncio.StreamWriter) -> bool:
+        """Confere, onde o sistema permite (SO_PEERCRED), que o cliente é do mesmo usuário."""
+        sock = writer.get_extra_info("socket")
+        uid = peer_uid(sock) if sock is not None else None
+        return uid is None or uid == os.getuid()  # Sem credenciais do par: vale a permissão 0600 do socket
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if not self._peer_is_owner(writer):
+            logger.warning("Conexão de outro usuário recusada.")
+            writer.close()
+            return
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    break  # Linha maior que MAX_MESSAGE_SIZE: a conexão é encerrada
+                if not line:
+                    break
+                writer.write(encode_message(await self._dispatch(line)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self._clients[task]
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> dict:
+        try:
+            try:
+                request = decode_message(line)
+            except ValueError:
+                raise RequestError(ERROR_BAD_REQUEST, "Requisição não é um objeto JSON válido.")
+            handler = self._handlers.get(request.get("op"))
+            if handler is None:
+                raise RequestError(ERROR_BAD_REQUEST, f"Operação desconhecida: {request.get('op')!r}.")
+            self.last_activity = time.monotonic()
+            return {"ok": True, "result": await handler(request)}
+        except RequestError as e:
+            return {"ok": False, "error": e.code, "message": str(e)}
+        except (TypeError, ValueError, KeyError) as e:
+            return {"ok": False, "error": ERROR_BAD_REQUEST, "message": str(e)}
+
+    def _require_unlocked(self):
+        if not self.unlocked:
+            raise RequestError(ERROR_LOCKED, "Cofre bloqueado: envie 'unlock' com a senha mestra.")
+
+    async def _op_status(self, request: dict) -> dict:
+        password_cache = self.security_service.password_cache
+        return {"unlocked": self.unlocked, "db_path": os.path.realpath(self.security_service.repo.db_path),
+                "idle_timeout": self.idle_timeout, "pid": os.getpid(),
+                "cache": password_cache.stats() if password_cache is not None else None}
+
+    async def _op_unlock(self, request: dict) -> bool:
+        if self.unlocked:
+            return True
+        # A derivação da senha mestra leva centenas de ms: roda no executor de KDF do serviço
+        future = self.security_service.login_with_master_password_async(str(request["master_password"]))
+        if not await asyncio.wrap_future(future):
+            raise RequestError(ERROR_BAD_PASSWORD, "Senha mestra incorreta.")
+        return True
+
+    async def _op_lock(self, request: dict) -> bool:
+        await self._run(self.security_service.lock)
+        return True
+
+    async def _op_get(self, request: dict) -> str:
+        self._require_unlocked()
+        password = await self._run(self.security_service.retrieve_password_by_name, str(request["name"]))
+        if password is None:
+            raise RequestError(ERROR_NOT_FOUND, f"Senha '{request['name']}' não encontrada.")
+        return password
+
+    async def _op_search(self, request: dict) -> list[str]:
+        self._require_unlocked()
+        return await self._run(self.security_service.search_password_names, str(request["query"]),
+                               int(request.get("limit", 50)))
+
+    async def _op_generate(self, request: dict) -> list[str]:
+        from src.password_generate.generator_engine import policy_from_options
+
+        count = _bounded_int(request, "count", MAX_GENERATE_COUNT, default=1)
+        length = _bounded_int(request, "length", MAX_GENERATE_LENGTH)
+        words = _bounded_int(request, "words", MAX_GENERATE_WORDS)
+        separator = str(request.get("separator", "-"))
+        if len(separator) > MAX_SEPARATOR_LENGTH:
+            raise RequestError(ERROR_BAD_REQUEST, f"'separator' aceita no máximo {MAX_SEPARATOR_LENGTH} caracteres.")
+        policy = policy_from_options(length, request.get("classes"), bool(request.get("exclude_look_alikes")),
+                                     words, separator)
+        return await self._run(policy.generate_many, count)
+
+    async def _op_stop(self, request: dict) -> bool:
+        asyncio.get_running_loop().call_soon(self.stop)  # Depois de responder ao cliente
+        return True
+
+def _bounded_int(request: dict, key: str, maximum: int, default: int = None) -> int | None:
+    """Lê um inteiro opcional da requisição, recusando valores fora do intervalo [1, maximum]."""
+    value = request.get(key, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RequestError(ERROR_BAD_REQUEST, f"'{key}' deve ser um número inteiro.")
+    if not 1 <= value <= maximum:
+        raise RequestError(ERROR_BAD_REQUEST, f"'{key}' deve estar entre 1 e {maximum}.")
+    return value
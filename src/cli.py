@@ -0,0 +1,299 @@
+# PasswordGenerate/src/cli.py
+#
+# Interface de linha de comando do cofre, para scripts e jobs sem display.
+# Não importa o PyQt6: cada comando carrega apenas os serviços de que precisa.
+#
+#   python -m src.cli [--db ARQUIVO] <comando> [argumentos]
+#
+# A senha mestra vem da variável de ambiente MY_VOULT_MASTER_PASSWORD, da entrada
+# padrão (primeira linha, quando não é um terminal) ou de um prompt sem eco.
+# Com um agente do cofre rodando para o mesmo banco (python -m src.agent) e indicado
+# em MY_VOULT_AGENT_SOCK, 'get' e 'search' são respondidos por ele sem pedir a senha
+# mestra (exceto com --no-agent); os demais comandos sempre abrem o cofre localmente.
+# Somente o resultado do comando vai para a saída padrão; mensagens e o log dos
+# serviços vão para a saída de erro.
+
+import argparse
+import contextlib
+import csv
+import getpass
+import os
+import sys
+
+from src.config.log_config import configure_logging
+
+MASTER_PASSWORD_ENV = "MY_VOULT_MASTER_PASSWORD"
+LIST_PAGE_SIZE = 500
+
+class CliError(Exception):
+    """Falha de um comando: a mensagem vai para a saída de erro e o processo sai com código 1."""
+
+def _read_secret(prompt: str) -> str:
+    """Lê um segredo do terminal (sem eco) ou, em scripts, da próxima linha da entrada padrão."""
+    if sys.stdin.isatty():
+        return getpass.getpass(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise CliError(f"Entrada padrão encerrada ao ler: {prompt.strip()}")
+    return line.rstrip("\r\n")
+
+def open_service(db_path: str = None):
+    """SecurityService sobre o banco informado (ou o padrão), sem sessão aberta."""
+    from src.database.repositories.repository import PasswordRepository
+    from src.database.repositories.repository_config import ConfigRepository
+    from src.database.services.security_service import SecurityService
+
+    return SecurityService(PasswordRepository(db_path), ConfigRepository(db_path),
+                           build_index_on_login=False)  # Cada processo faz poucas buscas
+
+def read_master_password() -> str:
+    """Senha mestra de MY_VOULT_MASTER_PASSWORD, da entrada padrão ou de um prompt sem eco."""
+    return os.environ.get(MASTER_PASSWORD_ENV) or _read_secret("Senha mestra: ")
+
+def _connect_agent(args):
+    """Cliente do agente em execução para o mesmo banco, ou None (sem agente ou com --no-agent)."""
+    if args.no_agent:
+        return None
+    from src.agent.client import connect_agent
+    from src.config.path_config import DB_FILE_PATH
+
+    agent = connect_agent()
+    if agent is not None and agent.status()["db_path"] != os.path.realpath(args.db or DB_FILE_PATH):
+        agent.close()
+        return None
+    return agent
+
+def _unlocked_agent(args):
+    """Como _connect_agent, mas apenas se o agente estiver com o cofre desbloqueado."""
+    agent = _connect_agent(args)
+    if agent is not None and not agent.status()["unlocked"]:
+        agent.close()
+        return None
+    return agent
+
+def _unlock(args):
+    """Abre o cofre com a senha mestra e retorna o SecurityService com a sessão aberta."""
+    service = open_service(args.db)
+    if not service.is_master_password_set():
+        raise CliError("Nenhum cofre encontrado. Crie um com o comando 'init'.")
+    if not service.login_with_master_password(read_master_password()):
+        raise CliError("Senha mestra incorreta.")
+    return service
+
+def cmd_init(args, out) -> int:
+    service = open_service(args.db)
+    if service.is_master_password_set():
+        raise CliError("O cofre já existe.")
+    master_password = read_master_password()
+    if sys.stdin.isatty() and not os.environ.get(MASTER_PASSWORD_ENV):
+        if getpass.getpass("Confirme a senha mestra: ") != master_password:
+            raise CliError("As senhas não conferem.")
+    if not master_password:
+        raise CliError("A senha mestra não pode ser vazia.")
+    if not service.register_and_login(master_password):
+        raise CliError("Não foi possível criar o cofre.")
+    print("Cofre criado.", file=sys.stderr)
+    return 0
+
+def cmd_unlock(args, out) -> int:
+    agent = _connect_agent(args)
+    if agent is None:
+        _unlock(args)
+        print("Senha mestra correta; cofre desbloqueado.", file=sys.stderr)
+        return 0
+    with contextlib.closing(agent):
+        if not agent.status()["unlocked"] and not agent.unlock(read_master_password()):
+            raise CliError("Senha mestra incorreta.")
+    print("Agente desbloqueado.", file=sys.stderr)
+    return 0
+
+def cmd_lock(args, out) -> int:
+    agent = _connect_agent(args)
+    if agent is None:
+        raise CliError("Nenhum agente em execução para este cofre.")
+    with contextlib.closing(agent):
+        agent.lock()
+    print("Agente bloqueado.", file=sys.stderr)
+    return 0
+
+def cmd_get(args, out) -> int:
+    agent = _unlocked_agent(args)
+    if agent is not None:
+        from src.agent.client import AgentError
+        from src.agent.protocol import ERROR_NOT_FOUND
+
+        with contextlib.closing(agent):
+            try:
+                print(agent.get(args.name), file=out)
+                return 0
+            except AgentError as e:
+                if e.code != ERROR_NOT_FOUND:
+                    raise CliError(str(e))
+                suggestions = agent.search(args.name, limit=5)
+        hint = f" Você quis dizer: {', '.join(suggestions)}?" if suggestions else ""
+        raise CliError(f"Senha '{args.name}' não encontrada.{hint}")
+
+    service = _unlock(args)
+    password = service.retrieve_password_by_name(args.name)
+    if password is None:
+        suggestions = service.search_password_names(args.name, limit=5)
+        hint = f" Você quis dizer: {', '.join(suggestions)}?" if suggestions else ""
+        raise CliError(f"Senha '{args.name}' não encontrada.{hint}")
+    print(password, file=out)
+    return 0
+
+def cmd_add(args, out) -> int:
+    service = _unlock(args)
+    if args.generate:
+        from src.password_generate.generator_engine import generate
+        password = generate()
+        print(password, file=out)
+    else:
+        password = _read_secret(f"Senha para '{args.name}': ")
+        if not password:
+            raise CliError("A senha não pode ser vazia.")
+    if not service.save_password_entry(args.name, password, overwrite=args.overwrite):
+        raise CliError(f"O nome '{args.name}' já existe (use --overwrite para substituir) ou ocorreu um erro.")
+    print(f"Senha '{args.name}' salva.", file=sys.stderr)
+    return 0
+
+def cmd_list(args, out) -> int:
+    service = _unlock(args)
+    after_name, remaining = None, args.limit
+    while remaining is None or remaining > 0:
+        page_size = LIST_PAGE_SIZE if remaining is None else min(LIST_PAGE_SIZE, remaining)
+        page = service.get_password_entries_metadata_page(after_name, page_size)
+        for entry in page:
+            print(entry.name, file=out)
+        if len(page) < page_size:
+            break
+        after_name = page[-1].name
+        if remaining is not None:
+            remaining -= len(page)
+    return 0
+
+def cmd_search(args, out) -> int:
+    agent = _unlocked_agent(args)
+    if agent is not None:
+        with contextlib.closing(agent):
+            names = agent.search(args.query, limit=args.limit)
+    else:
+        names = _unlock(args).search_password_names(args.query, limit=args.limit)
+    for name in names:
+        print(name, file=out)
+    return 0 if names else 1
+
+def cmd_import(args, out) -> int:
+    from src.database.services.import_service import ImportService
+
+    service = _unlock(args)
+    try:
+        report = ImportService(service).import_file(args.file)
+    except (OSError, ValueError, csv.Error) as e:  # csv.Error: CSV malformado (ex.: campo grande demais)
+        raise CliError(f"Não foi possível importar '{args.file}': {e}")
+    if report is None:
+        raise CliError("Sessão encerrada durante a importação.")
+    print(f"{report.inserted} importada(s), {report.duplicates} já existente(s), {report.failed} com erro.",
+          file=out)
+    return 0 if not report.failed else 1
+
+def cmd_export(args, out) -> int:
+    from src.database.services.export_service import ExportService
+
+    service = _unlock(args)
+    export_service = ExportService(service)
+    try:
+        if args.plaintext:
+            count = export_service.export_plaintext_csv(args.file, confirm_plaintext=True)
+        else:
+            count = export_service.export_encrypted_archive(args.file, incremental=args.incremental)
+    except (OSError, PermissionError, ValueError) as e:
+        raise CliError(f"Não foi possível exportar para '{args.file}': {e}")
+    print(f"{count} senha(s) exportada(s) para '{args.file}'.", file=out)
+    return 0
+
+def cmd_generate(args, out) -> int:
+    from src.password_generate.generator_engine import policy_from_options
+
+    try:
+        policy = policy_from_options(args.length, args.classes.split(",") if args.classes else None,
+                                     args.no_look_alikes, args.words, args.separator)
+    except ValueError as e:
+        raise CliError(str(e))
+    for password in policy.generate_many(args.count):
+        print(password, file=out)
+    if args.entropy:
+        print(f"Entropia: {policy.entropy_bits():.1f} bits por senha.", file=sys.stderr)
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Gerenciador de senhas pela linha de comando.")
+    parser.add_argument("--db", help="Arquivo do banco (padrão: o mesmo da aplicação).")
+    parser.add_argument("--no-agent", action="store_true", help="Não usa o agente do cofre, mesmo se estiver rodando.")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="comando")
+
+    command = commands.add_parser("init", help="Cria um novo cofre com a senha mestra.")
+    command.set_defaults(handler=cmd_init)
+
+    command = commands.add_parser("unlock", help="Desbloqueia o agente, ou apenas confere a senha mestra sem agente.")
+    command.set_defaults(handler=cmd_unlock)
+
+    command = commands.add_parser("lock", help="Bloqueia o agente do cofre.")
+    command.set_defaults(handler=cmd_lock)
+
+    command = commands.add_parser("get", help="Mostra a senha de uma entrada.")
+    command.add_argument("name")
+    command.set_defaults(handler=cmd_get)
+
+    command = commands.add_parser("add", help="Salva uma senha (lida do terminal ou da entrada padrão).")
+    command.add_argument("name")
+    command.add_argument("--generate", action="store_true", help="Gera a senha com a política padrão e a mostra.")
+    command.add_argument("--overwrite", action="store_true", help="Substitui a senha de uma entrada existente.")
+    command.set_defaults(handler=cmd_add)
+
+    command = commands.add_parser("list", help="Lista os nomes das entradas, em ordem alfabética.")
+    command.add_argument("--limit", type=int)
+    command.set_defaults(handler=cmd_list)
+
+    command = commands.add_parser("search", help="Busca nomes por prefixo, trecho ou semelhança.")
+    command.add_argument("query")
+    command.add_argument("--limit", type=int, default=20)
+    command.set_defaults(handler=cmd_search)
+
+    command = commands.add_parser("import", help="Importa um arquivo CSV, JSON ou JSON Lines.")
+    command.add_argument("file")
+    command.set_defaults(handler=cmd_import)
+
+    command = commands.add_parser("export", help="Exporta um backup criptografado (ou CSV em texto puro).")
+    command.add_argument("file")
+    command.add_argument("--incremental", action="store_true", help="Apenas o que mudou desde o último backup.")
+    command.add_argument("--plaintext", action="store_true", help="CSV com as senhas em TEXTO PURO.")
+    command.set_defaults(handler=cmd_export)
+
+    command = commands.add_parser("generate", help="Gera senhas ou frases-senha (não abre o cofre).")
+    command.add_argument("--count", type=int, default=1)
+    command.add_argument("--length", type=int)
+    command.add_argument("--classes", help="Classes separadas por vírgula: upper,lower,digits,special.")
+    command.add_argument("--no-look-alikes", action="store_true", help="Exclui caracteres parecidos (Il1O0...).")
+    command.add_argument("--words", type=int, help="Gera uma frase-senha com esta quantidade de palavras.")
+    command.add_argument("--separator", default="-")
+    command.add_argument("--entropy", action="store_true", help="Mostra a entropia da política na saída de erro.")
+    command.set_defaults(handler=cmd_generate)
+    return parser
+
+def main(argv: list[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging()  # Desligado sem MY_VOULT_LOG; o log vai para a saída de erro
+    try:
+        return args.handler(args, sys.stdout)
+    except CliError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    except ConnectionError as e:
+        print(f"Erro: Falha na comunicação com o agente do cofre: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+if __name__ == "__main__":
+    sys.exit(main())
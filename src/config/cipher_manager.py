@@ -1,54 +1,105 @@
 # PasswordGenerate/src/config/cipher_manager.py
 
-from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
 import base64
 import os
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
+
+from src.config.kdf import KeyDerivationFunction, Pbkdf2Kdf
+from src.config.log_config import get_logger
+
+# O Fernet é importado nos métodos que o usam: a aplicação abre (tela de login)
+# sem carregar o 'cryptography', que só é necessário a partir do primeiro login
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+logger = get_logger("crypto")
+
+def invalid_token_error() -> type:
+    """
+    Classe InvalidToken do Fernet, para uso em 'except': a expressão só é avaliada
+    quando há uma exceção, e a descriptografia bem-sucedida não paga a importação.
+    """
+    from cryptography.fernet import InvalidToken
+
+    return InvalidToken
 
 class CipherManager:
     """
     Gerencia a criptografia e descriptografia de senhas usando Fernet (AES).
-    A chave Fernet é derivada de uma senha mestra e um salt usando PBKDF2.
+    A chave Fernet é derivada de uma senha mestra e um salt usando a KDF
+    registrada para o cofre (PBKDF2, scrypt ou Argon2id).
+    Os métodos *_bytes trabalham com o token em bytes brutos, como ele é guardado
+    no banco, economizando o terço extra da codificação base64.
     """
 
     def __init__(self):
         pass
 
-    def _derive_key(self, master_password: str, salt: bytes) -> bytes:
+    def _derive_key(self, master_password: str, salt: bytes, kdf: KeyDerivationFunction = None) -> bytes:
         """
-        Deriva uma chave criptográfica de uma senha mestra e um salt usando PBKDF2.
+        Deriva uma chave criptográfica de uma senha mestra e um salt usando a KDF informada.
+        Sem KDF, usa o PBKDF2 com 480.000 iterações dos cofres antigos.
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # Chave de 32 bytes para SHA256 para Fernet
-            salt=salt,
-            iterations=480000,  # Recomenda-se um alto número de iterações para PBKDF2
-            backend=default_backend()
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(master_password.encode('utf-8')))
+        kdf = kdf if kdf else Pbkdf2Kdf()
+        key = base64.urlsafe_b64encode(kdf.derive(master_password.encode('utf-8'), salt))
         return key
 
-    def generate_master_key_info(self, master_password: str) -> Tuple[str, str]:
+    def generate_master_key_info(self, master_password: str, kdf: KeyDerivationFunction = None) -> Tuple[str, str]:
         """
         Gera um salt para a senha mestra e deriva a chave Fernet.
         Retorna o salt (hex) e a chave Fernet (urlsafe_b64encoded).
         """
         salt_bytes = os.urandom(16)  # 16 bytes de salt para a chave mestra
-        fernet_key_bytes = self._derive_key(master_password, salt_bytes)
+        fernet_key_bytes = self._derive_key(master_password, salt_bytes, kdf)
         return salt_bytes.hex(), fernet_key_bytes.decode('utf-8')
 
-    def get_fernet_instance(self, master_password: str, master_salt_hex: str) -> Fernet:
+    def derive_fernet_key(self, master_password: str, master_salt_hex: str,
+                          kdf: KeyDerivationFunction = None) -> str:
         """
-        Recria a instância Fernet a partir da senha mestra e do salt armazenado.
+        Deriva a chave Fernet (urlsafe_b64encoded) a partir da senha mestra, do salt e da KDF.
         """
         master_salt_bytes = bytes.fromhex(master_salt_hex)
-        fernet_key_bytes = self._derive_key(master_password, master_salt_bytes)
-        return Fernet(fernet_key_bytes)
+        return self._derive_key(master_password, master_salt_bytes, kdf).decode('utf-8')
+
+    def get_fernet_instance(self, master_password: str, master_salt_hex: str,
+                            kdf: KeyDerivationFunction = None) -> "Fernet":
+        """
+        Recria a instância Fernet a partir da senha mestra, do salt e da KDF armazenados.
+        """
+        from cryptography.fernet import Fernet
+
+        return Fernet(self.derive_fernet_key(master_password, master_salt_hex, kdf).encode('utf-8'))
+
+    def generate_data_key(self) -> str:
+        """Gera uma nova chave de dados (DEK) aleatória, no formato de chave Fernet."""
+        from cryptography.fernet import Fernet
+
+        return Fernet.generate_key().decode('utf-8')
+
+    def wrap_data_key(self, key_encryption_fernet: "Fernet", data_key: str) -> str:
+        """
+        Cifra ("embrulha") uma chave de dados com a chave derivada da senha mestra (KEK).
+        Retorna o token Fernet em texto, próprio para 'app_settings'.
+        """
+        return key_encryption_fernet.encrypt(data_key.encode('utf-8')).decode('utf-8')
+
+    def unwrap_data_key(self, key_encryption_fernet: "Fernet", wrapped_data_key: str) -> str:
+        """
+        Recupera uma chave de dados embrulhada por wrap_data_key.
+        Levanta InvalidToken se a KEK não for a correta (senha mestra errada).
+        """
+        return key_encryption_fernet.decrypt(wrapped_data_key.encode('utf-8')).decode('utf-8')
+
+    def get_fernet_from_key(self, fernet_key: str) -> "Fernet":
+        """
+        Cria a instância Fernet a partir de uma chave já derivada (urlsafe_b64encoded),
+        evitando uma nova derivação PBKDF2.
+        """
+        from cryptography.fernet import Fernet
+
+        return Fernet(fernet_key.encode('utf-8'))
 
-    def encrypt_password(self, fernet_instance: Fernet, plain_password: str) -> str:
+    def encrypt_password(self, fernet_instance: "Fernet", plain_password: str) -> str:
         """
         Criptografa uma senha em texto puro usando a instância Fernet fornecida.
         Retorna o token cifrado (string).
@@ -56,7 +107,7 @@ class CipherManager:
         token = fernet_instance.encrypt(plain_password.encode('utf-8'))
         return token.decode('utf-8')
 
-    def decrypt_password(self, fernet_instance: Fernet, encrypted_password_token: str) -> str | None:
+    def decrypt_password(self, fernet_instance: "Fernet", encrypted_password_token: str) -> str | None:
         """
         Descriptografa um token de senha cifrado usando a instância Fernet fornecida.
         Retorna a senha em texto puro (string) ou None se o token for inválido.
@@ -64,10 +115,42 @@ class CipherManager:
         try:
             decrypted_bytes = fernet_instance.decrypt(encrypted_password_token.encode('utf-8'))
             return decrypted_bytes.decode('utf-8')
-        except InvalidToken:
-            print("Erro de descriptografia: Token inválido ou chave incorreta.")
+        except invalid_token_error():
+            logger.debug("Erro de descriptografia: token inválido ou chave incorreta.")
             return None
-        except Exception as e:
-            print(f"Erro inesperado na descriptografia: {e}")
+        except Exception:
+            logger.exception("Erro inesperado na descriptografia.")
             return None
 
+
+    @staticmethod
+    def token_to_bytes(token: str | bytes) -> bytes:
+        """Converte um token Fernet (base64 url-safe) para os bytes brutos guardados no banco."""
+        return base64.urlsafe_b64decode(token)
+
+    @staticmethod
+    def bytes_to_token(raw_token: bytes) -> str:
+        """Converte os bytes brutos de um token de volta para o token Fernet em texto."""
+        return base64.urlsafe_b64encode(raw_token).decode('utf-8')
+
+    def encrypt_password_bytes(self, fernet_instance: "Fernet", plain_password: str) -> bytes:
+        """
+        Como encrypt_password, mas retorna o token em bytes brutos (sem a codificação
+        base64), o formato armazenado na coluna BLOB 'encrypted_password'.
+        """
+        return base64.urlsafe_b64decode(fernet_instance.encrypt(plain_password.encode('utf-8')))
+
+    def decrypt_password_bytes(self, fernet_instance: "Fernet", raw_token: bytes) -> str | None:
+        """
+        Descriptografa um token em bytes brutos (ver encrypt_password_bytes).
+        Retorna a senha em texto puro (string) ou None se o token for inválido.
+        """
+        try:
+            decrypted_bytes = fernet_instance.decrypt(base64.urlsafe_b64encode(raw_token))
+            return decrypted_bytes.decode('utf-8')
+        except invalid_token_error():
+            logger.debug("Erro de descriptografia: token inválido ou chave incorreta.")
+            return None
+        except Exception:
+            logger.exception("Erro inesperado na descriptografia.")
+            return None
@@ -0,0 +1,200 @@
+# PasswordGenerate/src/config/kdf.py
+
+import functools
+import json
+import math
+import time
+
+# As primitivas do 'cryptography' são importadas apenas na primeira derivação:
+# a aplicação abre (tela de login) sem carregá-las
+
+KEY_LENGTH = 32  # Chave de 32 bytes, o tamanho exigido pelo Fernet
+
+LEGACY_PBKDF2_ITERATIONS = 480000  # Parâmetro fixo usado pelos cofres criados antes da calibração
+
+DEFAULT_TARGET_MS = 250  # Tempo de desbloqueio desejado ao calibrar os parâmetros
+
+@functools.cache
+def _argon2id_class():
+    """Retorna a classe Argon2id do cryptography, ou None em versões anteriores à 44."""
+    try:
+        from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
+    except ImportError:
+        return None
+    return Argon2id
+
+class KeyDerivationFunction:
+    """
+    Interface comum das funções de derivação de chave (KDF) suportadas.
+    Cada implementação conhece seus parâmetros de custo e sabe serializá-los
+    para o registro 'app_settings', ao lado do salt da senha mestra.
+    """
+    name = None
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        """Deriva KEY_LENGTH bytes a partir da senha e do salt."""
+        raise NotImplementedError
+
+    def params(self) -> dict:
+        """Retorna os parâmetros de custo da função."""
+        raise NotImplementedError
+
+    def scaled(self, factor: float) -> "KeyDerivationFunction":
+        """Retorna uma nova instância com o custo multiplicado (aproximadamente) por 'factor'."""
+        raise NotImplementedError
+
+    def to_setting(self) -> str:
+        """Serializa o nome e os parâmetros da função para armazenamento."""
+        return json.dumps({"name": self.name, **self.params()}, sort_keys=True)
+
+    def __repr__(self):
+        params = ", ".join(f"{key}={value}" for key, value in self.params().items())
+        return f"{type(self).__name__}({params})"
+
+class Pbkdf2Kdf(KeyDerivationFunction):
+    """PBKDF2-HMAC-SHA256. O custo é controlado pelo número de iterações."""
+    name = "pbkdf2"
+
+    def __init__(self, iterations: int = LEGACY_PBKDF2_ITERATIONS):
+        self.iterations = int(iterations)
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=KEY_LENGTH,
+            salt=salt,
+            iterations=self.iterations,
+            backend=default_backend()
+        )
+        return kdf.derive(password)
+
+    def params(self) -> dict:
+        return {"iterations": self.iterations}
+
+    def scaled(self, factor: float) -> "Pbkdf2Kdf":
+        return Pbkdf2Kdf(max(100000, int(self.iterations * factor)))
+
+class ScryptKdf(KeyDerivationFunction):
+    """
+    scrypt. O custo é controlado por 'n' (potência de 2); a memória usada
+    é de aproximadamente 128 * n * r bytes.
+    """
+    name = "scrypt"
+    MAX_LOG2_N = 20  # Limita a memória a ~1 GiB com r=8
+
+    def __init__(self, n: int = 2 ** 15, r: int = 8, p: int = 1):
+        self.n = int(n)
+        self.r = int(r)
+        self.p = int(p)
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+        kdf = Scrypt(salt=salt, length=KEY_LENGTH, n=self.n, r=self.r, p=self.p, backend=default_backend())
+        return kdf.derive(password)
+
+    def params(self) -> dict:
+        return {"n": self.n, "r": self.r, "p": self.p}
+
+    def scaled(self, factor: float) -> "ScryptKdf":
+        log2_n = round(math.log2(self.n * factor))
+        log2_n = min(max(log2_n, 14), self.MAX_LOG2_N)
+        return ScryptKdf(2 ** log2_n, self.r, self.p)
+
+class Argon2idKdf(KeyDerivationFunction):
+    """
+    Argon2id. A memória (memory_cost, em KiB) fica fixa e o custo é
+    controlado pelo número de iterações.
+    """
+    name = "argon2id"
+
+    def __init__(self, iterations: int = 3, memory_cost: int = 64 * 1024, lanes: int = 4):
+        self.iterations = int(iterations)
+        self.memory_cost = int(memory_cost)
+        self.lanes = int(lanes)
+
+    def derive(self, password: bytes, salt: bytes) -> bytes:
+        Argon2id = _argon2id_class()
+        if Argon2id is None:
+            raise RuntimeError("Argon2id requer cryptography >= 44.")
+        kdf = Argon2id(salt=salt, length=KEY_LENGTH, iterations=self.iterations,
+                       lanes=self.lanes, memory_cost=self.memory_cost)
+        return kdf.derive(password)
+
+    def params(self) -> dict:
+        return {"iterations": self.iterations, "memory_cost": self.memory_cost, "lanes": self.lanes}
+
+    def scaled(self, factor: float) -> "Argon2idKdf":
+        iterations = max(1, round(self.iterations * factor))
+        memory_cost = self.memory_cost
+        if self.iterations == 1 and factor < 1:
+            # Com uma única iteração, só resta reduzir a memória (mínimo recomendado de 19 MiB)
+            memory_cost = max(19 * 1024, int(memory_cost * factor))
+        return Argon2idKdf(iterations, memory_cost, self.lanes)
+
+KDF_BACKENDS = {
+    Pbkdf2Kdf.name: Pbkdf2Kdf,
+    ScryptKdf.name: ScryptKdf,
+    Argon2idKdf.name: Argon2idKdf,
+}
+
+def available_kdf_names() -> list[str]:
+    """Retorna os nomes das KDFs utilizáveis com a versão instalada do cryptography."""
+    return [name for name in KDF_BACKENDS if name != Argon2idKdf.name or _argon2id_class() is not None]
+
+def preferred_kdf_name() -> str:
+    """Retorna a KDF preferida para novos cofres: Argon2id se disponível, senão scrypt."""
+    return Argon2idKdf.name if _argon2id_class() is not None else ScryptKdf.name
+
+def create_kdf(name: str, **params) -> KeyDerivationFunction:
+    """Instancia a KDF pelo nome. Levanta ValueError para nomes desconhecidos."""
+    try:
+        backend = KDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"KDF desconhecida: '{name}'.")
+    return backend(**params)
+
+def kdf_from_setting(value: str | None) -> KeyDerivationFunction:
+    """
+    Reconstrói a KDF a partir do valor salvo em 'app_settings'.
+    Cofres antigos não possuem esse registro e continuam usando o PBKDF2
+    com 480.000 iterações com que foram criados.
+    """
+    if not value:
+        return Pbkdf2Kdf(LEGACY_PBKDF2_ITERATIONS)
+    params = json.loads(value)
+    return create_kdf(params.pop("name"), **params)
+
+def measure_kdf(kdf: KeyDerivationFunction, rounds: int = 1) -> float:
+    """Retorna o tempo médio, em segundos, de uma derivação com a KDF informada."""
+    salt = b"\x00" * 16
+    start = time.perf_counter()
+    for _ in range(rounds):
+        kdf.derive(b"calibration-password", salt)
+    return (time.perf_counter() - start) / rounds
+
+def calibrate_kdf(name: str = None, target_ms: float = DEFAULT_TARGET_MS) -> KeyDerivationFunction:
+    """
+    Mede esta máquina e escolhe parâmetros para que uma derivação leve
+    aproximadamente 'target_ms' milissegundos.
+    Parte de um custo baixo, extrapola linearmente e refina uma vez.
+    """
+    name = name or preferred_kdf_name()
+    probes = {
+        Pbkdf2Kdf.name: Pbkdf2Kdf(100000),
+        ScryptKdf.name: ScryptKdf(2 ** 14),
+        Argon2idKdf.name: Argon2idKdf(iterations=1),
+    }
+    kdf = probes.get(name) or create_kdf(name)
+    target_seconds = target_ms / 1000
+    for _ in range(2):
+        elapsed = measure_kdf(kdf)
+        if elapsed <= 0:
+            break
+        kdf = kdf.scaled(target_seconds / elapsed)
+    return kdf
@@ -0,0 +1,64 @@
+# PasswordGenerate/src/config/log_config.py
+#
+# Log da aplicação, com o módulo logging. Cada subsistema tem seu logger, abaixo de
+# "my_voult": security, crypto, storage, reencryption, agent, gui e generator.
+# O log vem desligado: o logger raiz da aplicação só tem um NullHandler, e as chamadas
+# abaixo do nível ativo custam apenas a verificação do nível (as mensagens usam
+# formatação preguiçosa, com %s). Para ativar, defina MY_VOULT_LOG, por exemplo:
+#
+#   MY_VOULT_LOG=INFO                      # tudo a partir de INFO
+#   MY_VOULT_LOG=WARNING,security=DEBUG    # avisos, e tudo do SecurityService
+#
+# Nenhuma mensagem traz senhas, chaves, salts, tokens ou nomes de entradas. Os ids das
+# chaves de dados aparecem apenas resumidos por key_label: no cofre convertido do formato
+# antigo, o id da chave é o próprio salt da senha mestra.
+
+import hashlib
+import logging
+import os
+import sys
+from typing import TextIO
+
+LOG_ENV = "MY_VOULT_LOG"
+ROOT_LOGGER_NAME = "my_voult"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+logging.getLogger(ROOT_LOGGER_NAME).addHandler(logging.NullHandler())
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """Retorna o logger de um subsistema da aplicação (ex.: 'security' -> 'my_voult.security')."""
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{subsystem}")
+
+def key_label(key_id: str | None) -> str:
+    """Identificação curta e não reversível de uma chave de dados, para as mensagens de log."""
+    if key_id is None:
+        return "-"
+    return hashlib.sha256(key_id.encode("utf-8")).hexdigest()[:8]
+
+def configure_logging(spec: str = None, stream: TextIO = None) -> bool:
+    """
+    Ativa o log a partir de 'spec' (padrão: a variável MY_VOULT_LOG), com saída em
+    'stream' (padrão: a saída de erro). 'spec' é uma lista separada por vírgulas de
+    níveis, para a aplicação inteira ('INFO') ou por subsistema ('agent=DEBUG').
+    Sem 'spec', nada muda e o log continua desligado. Retorna se o log foi ativado.
+    """
+    spec = spec if spec is not None else os.environ.get(LOG_ENV, "")
+    items = [item.strip() for item in spec.split(",") if item.strip()]
+    if not items:
+        return False
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    if not any(isinstance(handler, logging.StreamHandler) for handler in root.handlers):
+        handler = logging.StreamHandler(stream if stream else sys.stderr)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(handler)
+        root.propagate = False  # Evita mensagens em dobro se o processo também configurar o logger raiz
+
+    for item in items:
+        subsystem, _, level_name = item.rpartition("=")
+        level = logging.getLevelName(level_name.strip().upper())
+        if not isinstance(level, int):
+            root.warning("Nível de log desconhecido em %s: %r", LOG_ENV, item)
+            continue
+        (get_logger(subsystem.strip()) if subsystem else root).setLevel(level)
+    return True
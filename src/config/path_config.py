@@ -23,4 +23,6 @@ def get_resource_path(relative_path: str) -> str:
 
 DB_DIRECTORY_PATH = get_resource_path(DB_DIRECTORY_NAME)
 
-DB_FILE_PATH = os.path.join(DB_DIRECTORY_PATH, DB_FILENAME)
\ No newline at end of file
+DB_FILE_PATH = os.path.join(DB_DIRECTORY_PATH, DB_FILENAME)
+
+WORDLIST_FILE_PATH = os.path.join(DB_DIRECTORY_PATH, "wordlists", "palavras_pt_br.txt")
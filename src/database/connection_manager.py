@@ -0,0 +1,115 @@
+# PythonPasswordGenerate/src/database/connection_manager.py
+
+import atexit
+import sqlite3
+import threading
+
+# PRAGMAs aplicados a cada conexão aberta pelo gerenciador
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",      # Leitores não bloqueiam o escritor
+    "PRAGMA synchronous = NORMAL",    # Seguro com WAL e evita um fsync por commit
+    "PRAGMA cache_size = -16000",     # ~16 MB de cache de páginas por conexão
+    "PRAGMA mmap_size = 268435456",   # Até 256 MB do arquivo mapeados em memória
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA foreign_keys = ON",
+)
+
+class ConnectionManager:
+    """
+    Mantém uma conexão SQLite de longa duração por thread para um arquivo de banco.
+    Evita o custo de abrir uma conexão a cada operação e permite fechar as conexões
+    de forma explícita: a da thread atual no bloqueio e no logout (release_connections)
+    e todas na saída da aplicação (close_all).
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []  # Todas as conexões abertas, de qualquer thread
+        self._generation = 0  # Incrementado por close_all e release_connections para invalidar as conexões das threads
+        self.schema_lock = threading.Lock()
+        self.schema_ready = False  # True depois que as migrações do esquema rodaram (ver migrations.py)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        # check_same_thread=False apenas para que close_all possa fechar conexões de outras
+        # threads; cada conexão continua sendo usada somente pela thread que a abriu.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão da thread atual, abrindo-a na primeira chamada
+        (ou após um close_all ou release_connections).
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            if self._local.generation == self._generation:
+                return conn
+            self._discard(conn)  # Invalidada por release_connections: a própria thread a fecha
+
+        conn = self._open_connection()
+        with self._lock:
+            self._connections.append(conn)
+            self._local.connection = conn
+            self._local.generation = self._generation
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection):
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def release_connections(self):
+        """
+        Fecha a conexão da thread atual e invalida as das outras threads, que as fecham
+        no próximo uso: nenhuma conexão é fechada enquanto outra thread a está usando
+        (no meio de uma transação da recifragem ou de uma importação, por exemplo).
+        """
+        with self._lock:
+            self._generation += 1
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            self._local.connection = None
+            self._discard(conn)
+
+    def close_all(self):
+        """
+        Fecha todas as conexões abertas, de qualquer thread; só deve ser usado quando
+        nenhuma outra thread usa o banco (saída da aplicação). Elas são reabertas sob
+        demanda no próximo uso.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+def get_connection_manager(db_path: str) -> ConnectionManager:
+    """Retorna o gerenciador compartilhado do arquivo de banco informado."""
+    with _managers_lock:
+        manager = _managers.get(db_path)
+        if manager is None:
+            manager = _managers[db_path] = ConnectionManager(db_path)
+        return manager
+
+def close_all_connections():
+    """Fecha as conexões de todos os gerenciadores compartilhados."""
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.close_all()
+
+atexit.register(close_all_connections)
@@ -0,0 +1,175 @@
+# PythonPasswordGenerate/src/database/migrations.py
+
+import base64
+import binascii
+import sqlite3
+
+from src.database.connection_manager import ConnectionManager
+from src.config.log_config import get_logger
+
+logger = get_logger("storage")
+
+MASTER_SALT_SETTING_KEY = "master_password_salt"  # Mesma chave usada pelo SecurityService
+
+def _create_base_schema(conn: sqlite3.Connection):
+    """Versão 1: tabelas originais, incluindo bancos criados antes de 'updated_at' e 'row_version'."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS password_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            encrypted_password TEXT NOT NULL,
+            master_key_salt TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            row_version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS app_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            key TEXT NOT NULL UNIQUE,
+            value TEXT NOT NULL
+        )
+    """)
+    # Bancos criados antes da coluna 'updated_at' (usada pelos backups incrementais)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(password_entries)")}
+    if "updated_at" not in columns:
+        # ADD COLUMN não aceita CURRENT_TIMESTAMP como padrão; os INSERTs preenchem a coluna
+        conn.execute("ALTER TABLE password_entries ADD COLUMN updated_at TIMESTAMP")
+        conn.execute("UPDATE password_entries SET updated_at = created_at")
+    # Bancos criados antes de 'row_version' (marca dos backups incrementais): numerada pela ordem de id
+    if "row_version" not in columns:
+        conn.execute("ALTER TABLE password_entries ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0")
+        conn.execute("UPDATE password_entries SET row_version = id")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_password_entries_updated_at ON password_entries (updated_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_password_entries_row_version ON password_entries (row_version)")
+
+def _normalize_key_epochs(conn: sqlite3.Connection):
+    """
+    Versão 2: o salt da senha mestra, antes repetido em cada linha de 'password_entries',
+    passa para a tabela 'key_epochs'; as entradas guardam apenas o id da época de chave.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS key_epochs (
+            id INTEGER PRIMARY KEY,
+            salt TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("INSERT OR IGNORE INTO key_epochs (salt) "
+                 "SELECT value FROM app_settings WHERE key = ?", (MASTER_SALT_SETTING_KEY,))
+    conn.execute("INSERT OR IGNORE INTO key_epochs (salt) SELECT DISTINCT master_key_salt FROM password_entries")
+
+    # O SQLite não altera colunas no lugar: a tabela é recriada e os dados copiados
+    conn.execute("""
+        CREATE TABLE password_entries_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            encrypted_password TEXT NOT NULL,
+            key_epoch_id INTEGER NOT NULL REFERENCES key_epochs (id),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            row_version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        INSERT INTO password_entries_new (id, name, encrypted_password, key_epoch_id, created_at, updated_at,
+                                          row_version)
+        SELECT e.id, e.name, e.encrypted_password, k.id, e.created_at, e.updated_at, e.row_version
+        FROM password_entries AS e JOIN key_epochs AS k ON k.salt = e.master_key_salt
+    """)
+    conn.execute("DROP TABLE password_entries")
+    conn.execute("ALTER TABLE password_entries_new RENAME TO password_entries")
+    conn.execute("CREATE INDEX idx_password_entries_updated_at ON password_entries (updated_at)")
+    conn.execute("CREATE INDEX idx_password_entries_row_version ON password_entries (row_version)")
+
+def _token_to_blob(token):
+    # Tokens já em bytes (ou ausentes) são mantidos como estão
+    if not isinstance(token, str):
+        return token
+    try:
+        return base64.urlsafe_b64decode(token)
+    except binascii.Error:
+        # Valor que nunca foi um token válido: preservado byte a byte em vez de abortar a migração
+        return token.encode("utf-8")
+
+def _store_tokens_as_blobs(conn: sqlite3.Connection):
+    """
+    Versão 3: 'encrypted_password' deixa de guardar o token Fernet em base64 (TEXT)
+    e passa a guardar os bytes brutos do token (BLOB), cerca de 25% menores.
+    """
+    conn.create_function("token_to_blob", 1, _token_to_blob, deterministic=True)
+    conn.execute("""
+        CREATE TABLE password_entries_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            encrypted_password BLOB NOT NULL,
+            key_epoch_id INTEGER NOT NULL REFERENCES key_epochs (id),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            row_version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        INSERT INTO password_entries_new (id, name, encrypted_password, key_epoch_id, created_at, updated_at,
+                                          row_version)
+        SELECT id, name, token_to_blob(encrypted_password), key_epoch_id, created_at, updated_at, row_version
+        FROM password_entries
+    """)
+    conn.execute("DROP TABLE password_entries")
+    conn.execute("ALTER TABLE password_entries_new RENAME TO password_entries")
+    conn.execute("CREATE INDEX idx_password_entries_updated_at ON password_entries (updated_at)")
+    conn.execute("CREATE INDEX idx_password_entries_row_version ON password_entries (row_version)")
+
+def _rename_epoch_salt_to_key_id(conn: sqlite3.Connection):
+    """
+    Versão 4: com a criptografia de envelope, cada época identifica uma chave de dados
+    (DEK). Nos cofres antigos o identificador continua sendo o salt da época.
+    """
+    conn.execute("ALTER TABLE key_epochs RENAME COLUMN salt TO key_id")
+
+# Migrações em ordem; a posição na lista (a partir de 1) é a versão do esquema
+MIGRATIONS = (
+    _create_base_schema,
+    _normalize_key_epochs,
+    _store_tokens_as_blobs,
+    _rename_epoch_salt_to_key_id,
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn: sqlite3.Connection, target_version: int = SCHEMA_VERSION) -> int:
+    """
+    Aplica as migrações pendentes até 'target_version' (por padrão, a versão atual),
+    registrando a versão em PRAGMA user_version.
+    Tudo roda em uma única transação (BEGIN IMMEDIATE): ou o banco chega à versão
+    alvo, ou nada é alterado. Em um banco já atualizado, não faz nada.
+    Retorna a versão final do esquema.
+    """
+    if get_schema_version(conn) >= target_version:
+        return get_schema_version(conn)
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Relida dentro da transação: outro processo pode ter migrado o banco antes
+        version = get_schema_version(conn)
+        for migration_version, migration in enumerate(MIGRATIONS, start=1):
+            if version < migration_version <= target_version:
+                migration(conn)
+                conn.execute(f"PRAGMA user_version = {migration_version}")
+                logger.info("Esquema do banco migrado para a versão %d.", migration_version)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return get_schema_version(conn)
+
+def ensure_schema(connection_manager: ConnectionManager):
+    """Migra o banco do gerenciador informado uma única vez por processo."""
+    with connection_manager.schema_lock:
+        if not connection_manager.schema_ready:
+            migrate(connection_manager.get_connection())
+            connection_manager.schema_ready = True
@@ -3,18 +3,22 @@
 class PasswordEntry:
     """
     Representa o modelo de dados para uma entrada de senha.
-    Define a estrutura dos dados para uma senha no sistema (ID, Nome, Senha Cifrada, Salt da Chave Mestra, Data de Criação).
+    Define a estrutura dos dados para uma senha no sistema (ID, Nome, Senha Cifrada, Chave de Dados,
+    Data de Criação e Data da Última Alteração).
     """
-    def __init__(self, id: int = None, name: str = None, encrypted_password: str = None, master_key_salt: str = None, created_at: str = None):
+    def __init__(self, id: int = None, name: str = None, encrypted_password: bytes = None, key_id: str = None,
+                 created_at: str = None, updated_at: str = None):
         self.id = id
         self.name = name
-        self.encrypted_password = encrypted_password
-        self.master_key_salt = master_key_salt     # O salt usado para derivar a chave da senha mestra
+        self.encrypted_password = encrypted_password  # Token Fernet em bytes brutos
+        self.key_id = key_id     # Identificador da chave de dados (DEK) que cifrou a senha
         self.created_at = created_at
+        self.updated_at = updated_at
 
     def __repr__(self):
-        encrypted_preview = self.encrypted_password[:10] + '...' if self.encrypted_password else 'None'
-        salt_preview = self.master_key_salt[:10] + '...' if self.master_key_salt else 'None'
+        encrypted_preview = self.encrypted_password[:5].hex() + '...' if self.encrypted_password else 'None'
+        key_preview = self.key_id[:10] + '...' if self.key_id else 'None'
         return (f"PasswordEntry(id={self.id}, name='{self.name}', "
                 f"encrypted_password='{encrypted_preview}', "
-                f"master_key_salt='{salt_preview}', created_at='{self.created_at}')")
+                f"key_id='{key_preview}', created_at='{self.created_at}', "
+                f"updated_at='{self.updated_at}')")
@@ -0,0 +1,49 @@
+# PythonPasswordGenerate/src/database/models/model_import.py
+
+ROW_INSERTED = "inserted"    # Entrada gravada
+ROW_DUPLICATE = "duplicate"  # Já existia uma entrada com o mesmo nome
+ROW_FAILED = "failed"        # Entrada inválida ou erro ao gravar
+
+class ImportRowResult:
+    """
+    Resultado da importação de uma única linha em uma gravação em lote.
+    """
+    def __init__(self, index: int = None, name: str = None, status: str = None, error: str = None):
+        self.index = index  # Posição da linha na entrada (a partir de 0)
+        self.name = name
+        self.status = status
+        self.error = error
+
+    def __repr__(self):
+        return (f"ImportRowResult(index={self.index}, name='{self.name}', "
+                f"status='{self.status}', error={self.error!r})")
+
+class ImportReport:
+    """
+    Resumo de uma gravação em lote: contadores por status e o resultado de cada linha.
+    Com keep_rows=False apenas os contadores são mantidos, para importações muito grandes.
+    """
+    def __init__(self, keep_rows: bool = True):
+        self.keep_rows = keep_rows
+        self.inserted = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.rows = []
+
+    @property
+    def processed(self) -> int:
+        return self.inserted + self.duplicates + self.failed
+
+    def add(self, index: int, name: str, status: str, error: str = None):
+        if status == ROW_INSERTED:
+            self.inserted += 1
+        elif status == ROW_DUPLICATE:
+            self.duplicates += 1
+        else:
+            self.failed += 1
+        if self.keep_rows:
+            self.rows.append(ImportRowResult(index=index, name=name, status=status, error=error))
+
+    def __repr__(self):
+        return (f"ImportReport(inserted={self.inserted}, duplicates={self.duplicates}, "
+                f"failed={self.failed})")
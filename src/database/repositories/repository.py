@@ -2,73 +2,298 @@
 
 import sqlite3
 import os
+from itertools import islice
+from typing import Iterable, Iterator
 from src.database.models.model import PasswordEntry
+from src.database.models.model_import import ROW_INSERTED, ROW_DUPLICATE, ROW_FAILED
+from src.database.connection_manager import ConnectionManager, get_connection_manager
+from src.database.migrations import ensure_schema
 from src.config.path_config import DB_FILE_PATH, DB_FILENAME, DB_DIRECTORY_NAME, DB_DIRECTORY_PATH
+from src.config.log_config import get_logger
 
+logger = get_logger("storage")
+
+# As entradas referenciam a época de chave; o id da chave é lido de 'key_epochs' com um JOIN
+ENTRY_SELECT = ("SELECT e.id, e.name, e.encrypted_password, k.key_id, e.created_at, e.updated_at "
+                "FROM password_entries AS e JOIN key_epochs AS k ON k.id = e.key_epoch_id")
+KEY_EPOCH_ID_BY_KEY_ID = "(SELECT id FROM key_epochs WHERE key_id = ?)"
+# Próximo valor de 'row_version' (pelo índice): cresce a cada entrada criada ou alterada
+NEXT_ROW_VERSION = "(SELECT COALESCE(MAX(row_version), 0) + 1 FROM password_entries)"
+INSERT_QUERY = ("INSERT INTO password_entries (name, encrypted_password, key_epoch_id, updated_at, row_version) "
+                f"VALUES (?, ?, {KEY_EPOCH_ID_BY_KEY_ID}, CURRENT_TIMESTAMP, {NEXT_ROW_VERSION})")
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)  # DELETE ... RETURNING
+
+UPSERT_QUERY = INSERT_QUERY + f"""
+    ON CONFLICT (name) DO UPDATE SET
+        encrypted_password = excluded.encrypted_password,
+        key_epoch_id = excluded.key_epoch_id,
+        updated_at = CURRENT_TIMESTAMP,
+        row_version = {NEXT_ROW_VERSION}
+"""
 
 class PasswordRepository:
     """
     Gerencia as operações de CRUD para as entradas de senha (PasswordEntry)
     no banco de dados SQLite.
     """
-    def __init__(self):
-        self.db_path = DB_FILE_PATH
-        os.makedirs(DB_DIRECTORY_PATH, exist_ok=True)
+    def __init__(self, db_path: str = None, connection_manager: ConnectionManager = None):
+        self.db_path = db_path if db_path else DB_FILE_PATH
+        os.makedirs(os.path.dirname(self.db_path) or DB_DIRECTORY_PATH, exist_ok=True)
+        # Conexão persistente por thread, compartilhada com os demais repositórios do mesmo arquivo
+        self.connection_manager = connection_manager if connection_manager else get_connection_manager(self.db_path)
         self.create_table() # Chama a criação da tabela de senhas
 
     def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return self.connection_manager.get_connection()
 
     def create_table(self):
         """
-        Cria a tabela 'password_entries' no banco de dados, se ela ainda não existir.
+        Garante que o esquema do banco, incluindo a tabela 'password_entries', esteja
+        na versão atual (as migrações rodam uma única vez por arquivo).
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS password_entries (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    encrypted_password TEXT NOT NULL,
-                    master_key_salt TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-    def add(self, name: str, encrypted_password: str, master_key_salt: str) -> bool:
+        ensure_schema(self.connection_manager)
+
+    @staticmethod
+    def _ensure_key_epochs(conn: sqlite3.Connection, key_ids: Iterable[str]):
+        """Registra em 'key_epochs' as chaves ainda desconhecidas (as entradas guardam apenas o id da época)."""
+        conn.executemany("INSERT OR IGNORE INTO key_epochs (key_id) VALUES (?)",
+                         ((key_id,) for key_id in set(key_ids)))
+
+    @staticmethod
+    def _row_to_entry(row: tuple) -> PasswordEntry:
+        return PasswordEntry(id=row[0], name=row[1], encrypted_password=row[2], key_id=row[3],
+                             created_at=row[4], updated_at=row[5])
+
+    def add(self, name: str, encrypted_password: bytes, key_id: str) -> bool:
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO password_entries (name, encrypted_password, master_key_salt)
-                    VALUES (?, ?, ?)
-                """, (name, encrypted_password, master_key_salt))
-                conn.commit()
+                self._ensure_key_epochs(conn, [key_id])
+                conn.execute(INSERT_QUERY, (name, encrypted_password, key_id))
             return True
         except sqlite3.IntegrityError:
             return False
         except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em add: %s", e)
             return False
 
+    def add_many(self, entries: Iterable[tuple[str, str, str]], chunk_size: int = 500) -> Iterator[tuple[str, str, str | None]]:
+        """
+        Insere entradas (name, encrypted_password, key_id) consumindo o iterável em blocos
+        de 'chunk_size', cada bloco gravado com executemany na sua própria transação,
+        confirmada antes de gerar os resultados do bloco.
+        Gera (name, status, erro) para cada entrada, na ordem de entrada. Se o banco estiver
+        ocupado por outro escritor (OperationalError, ex.: "database is locked"), as entradas
+        do bloco ficam como ROW_FAILED e a importação segue no bloco seguinte.
+        """
+        conn = self._get_connection()
+        entries = iter(entries)
+        while chunk := list(islice(entries, chunk_size)):
+            try:
+                conn.execute("BEGIN IMMEDIATE")  # Reserva a escrita antes de procurar os nomes existentes
+                results = self._add_chunk(conn, chunk)
+                conn.commit()
+            except sqlite3.OperationalError as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                logger.warning("Bloco de %d entradas não gravado: %s", len(chunk), e)
+                results = [(entry[0], ROW_FAILED, str(e)) for entry in chunk]
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            yield from results
+
+    def _add_chunk(self, conn: sqlite3.Connection, chunk: list[tuple[str, str, str]]) -> list[tuple[str, str, str | None]]:
+        names = [entry[0] for entry in chunk]
+        placeholders = ", ".join("?" * len(names))
+        existing = {row[0] for row in conn.execute(
+            f"SELECT name FROM password_entries WHERE name IN ({placeholders})", names)}
+
+        results = []
+        to_insert = []
+        for entry in chunk:
+            if entry[0] in existing:
+                results.append((entry[0], ROW_DUPLICATE, None))
+            else:
+                existing.add(entry[0])  # Nomes repetidos dentro do próprio bloco
+                to_insert.append(entry)
+                results.append((entry[0], ROW_INSERTED, None))
+
+        insert_sql = INSERT_QUERY
+        self._ensure_key_epochs(conn, (entry[2] for entry in to_insert))
+        conn.execute("SAVEPOINT add_chunk")  # Apenas para desfazer o executemany antes da gravação linha a linha
+        try:
+            conn.executemany(insert_sql, to_insert)
+        except sqlite3.OperationalError:
+            raise  # Falha do banco (ex.: bloqueado), não de uma linha: o bloco inteiro é desfeito em add_many
+        except sqlite3.Error:
+            # Refaz o bloco linha a linha para isolar as entradas com problema
+            conn.execute("ROLLBACK TO add_chunk")
+            failures = {}
+            for entry in to_insert:
+                try:
+                    conn.execute(insert_sql, entry)
+                except sqlite3.OperationalError:
+                    raise
+                except sqlite3.Error as e:
+                    failures[entry[0]] = str(e)
+            results = [(name, ROW_FAILED, failures[name]) if status == ROW_INSERTED and name in failures
+                       else (name, status, error) for name, status, error in results]
+        conn.execute("RELEASE add_chunk")
+        return results
+
     def get_by_name(self, name: str) -> PasswordEntry | None:
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id, name, encrypted_password, master_key_salt, created_at FROM password_entries WHERE name = ?", (name,))
+            cursor.execute(f"{ENTRY_SELECT} WHERE e.name = ?", (name,))
             row = cursor.fetchone()
         if row:
-            return PasswordEntry(id=row[0], name=row[1], encrypted_password=row[2], master_key_salt=row[3], created_at=row[4])
+            return self._row_to_entry(row)
         return None
 
     def get_all(self) -> list[PasswordEntry]:
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id, name, encrypted_password, master_key_salt, created_at FROM password_entries ORDER BY name")
+            cursor.execute(f"{ENTRY_SELECT} ORDER BY e.name")
             rows = cursor.fetchall()
-        return [PasswordEntry(id=row[0], name=row[1], encrypted_password=row[2], master_key_salt=row[3], created_at=row[4]) for row in rows]
+        return [self._row_to_entry(row) for row in rows]
+
+    def get_metadata_page(self, after_name: str = None, limit: int = 200) -> list[PasswordEntry]:
+        """
+        Retorna até 'limit' entradas em ordem de nome, começando depois de 'after_name'
+        (paginação por chave, usando o índice único de 'name'). As entradas não trazem
+        a senha cifrada.
+        """
+        conn = self._get_connection()
+        if after_name is None:
+            rows = conn.execute("SELECT id, name, created_at, updated_at FROM password_entries "
+                                "ORDER BY name LIMIT ?", (limit,)).fetchall()
+        else:
+            rows = conn.execute("SELECT id, name, created_at, updated_at FROM password_entries "
+                                "WHERE name > ? ORDER BY name LIMIT ?", (after_name, limit)).fetchall()
+        return [PasswordEntry(id=row[0], name=row[1], created_at=row[2], updated_at=row[3]) for row in rows]
+
+    def iter_name_metadata(self, batch_size: int = 1000) -> Iterator[tuple[str, str]]:
+        """Percorre (name, created_at) de todas as entradas, sem ler as senhas cifradas."""
+        cursor = self._get_connection().cursor()
+        cursor.execute("SELECT name, created_at FROM password_entries")
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+        finally:
+            cursor.close()
 
-    def update(self, entry_id: int, new_name: str = None, new_encrypted_password: str = None, new_master_key_salt: str = None) -> bool:
+    def get_by_ids(self, entry_ids: list[int]) -> list[PasswordEntry]:
+        """Retorna as entradas com os ids informados (em blocos, respeitando o limite de parâmetros)."""
+        entries = []
         conn = self._get_connection()
-        cursor = conn.cursor()
+        for start in range(0, len(entry_ids), 500):
+            chunk = entry_ids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(f"{ENTRY_SELECT} WHERE e.id IN ({placeholders})",
+                                chunk).fetchall()
+            entries.extend(self._row_to_entry(row) for row in rows)
+        return entries
+
+    def get_by_names(self, names: list[str]) -> dict[str, PasswordEntry]:
+        """Retorna {nome: entrada} para os nomes informados que existirem (em blocos, como get_by_ids)."""
+        entries = {}
+        conn = self._get_connection()
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in conn.execute(f"{ENTRY_SELECT} WHERE e.name IN ({placeholders})", chunk):
+                entries[row[1]] = self._row_to_entry(row)
+        return entries
+
+    def iter_entries(self, after_version: int = None, up_to_version: int = None,
+                     batch_size: int = 500) -> Iterator[PasswordEntry]:
+        """
+        Percorre as entradas em ordem de id com um cursor, lendo 'batch_size' linhas por vez,
+        sem materializar a tabela inteira. Com 'after_version' e 'up_to_version', apenas as
+        entradas cujo row_version está no intervalo (after_version, up_to_version]: as
+        criadas ou alteradas depois de um backup e até o instante de get_max_row_version.
+        """
+        cursor = self._get_connection().cursor()
+        if after_version is not None or up_to_version is not None:
+            cursor.execute(f"{ENTRY_SELECT} WHERE e.row_version > ? AND e.row_version <= ? ORDER BY e.id",
+                           (after_version or 0, up_to_version if up_to_version is not None else 2 ** 63 - 1))
+        else:
+            cursor.execute(f"{ENTRY_SELECT} ORDER BY e.id")
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_entry(row)
+        finally:
+            cursor.close()
+
+    def get_entries_outside_key(self, key_id: str, after_id: int = 0, limit: int = 500) -> list[PasswordEntry]:
+        """
+        Retorna até 'limit' entradas, em ordem de id e com id maior que 'after_id',
+        que ainda não estão cifradas com a chave 'key_id' (usado na troca da chave de dados).
+        """
+        rows = self._get_connection().execute(
+            f"{ENTRY_SELECT} WHERE k.key_id != ? AND e.id > ? ORDER BY e.id LIMIT ?",
+            (key_id, after_id, limit)).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def get_sample_entry(self, key_id: str) -> PasswordEntry | None:
+        """Retorna uma entrada qualquer cifrada com a chave 'key_id', ou None se não houver."""
+        row = self._get_connection().execute(f"{ENTRY_SELECT} WHERE k.key_id = ? LIMIT 1", (key_id,)).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def count_entries_by_key(self) -> dict[str, int]:
+        """Retorna quantas entradas cada chave de dados cifra (chaves sem entradas não aparecem)."""
+        rows = self._get_connection().execute(
+            "SELECT k.key_id, COUNT(*) FROM password_entries AS e "
+            "JOIN key_epochs AS k ON k.id = e.key_epoch_id GROUP BY k.key_id").fetchall()
+        return dict(rows)
+
+    def replace_encrypted_passwords(self, rows: list[tuple[bytes, str, int, bytes]]) -> int:
+        """
+        Regrava, em uma única transação, a senha cifrada e a chave de dados de várias
+        entradas a partir de tuplas (novo encrypted_password, novo key_id, entry_id,
+        encrypted_password lido antes). Cada linha só é alterada se ainda tiver o token
+        lido antes, para não sobrescrever uma senha alterada nesse meio-tempo.
+        Não altera 'updated_at': o conteúdo das entradas continua o mesmo.
+        Retorna a quantidade de entradas regravadas (0 se a transação falhar).
+        """
+        conn = self._get_connection()
+        try:
+            with conn:
+                self._ensure_key_epochs(conn, (row[1] for row in rows))
+                cursor = conn.executemany(
+                    f"UPDATE password_entries SET encrypted_password = ?, key_epoch_id = {KEY_EPOCH_ID_BY_KEY_ID} "
+                    "WHERE id = ? AND encrypted_password = ?", rows)
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em replace_encrypted_passwords: %s", e)
+            return 0
+
+    def get_change_fingerprint(self) -> tuple:
+        """
+        Retorna (quantidade de entradas, maior id, maior updated_at): muda quando uma entrada
+        é criada, removida ou alterada (o id é AUTOINCREMENT e nunca é reaproveitado).
+        """
+        return tuple(self._get_connection().execute(
+            "SELECT COUNT(*), MAX(id), MAX(updated_at) FROM password_entries").fetchone())
+
+    def get_max_row_version(self) -> int:
+        """Retorna o maior row_version do banco (0 sem entradas): a marca de um backup."""
+        return self._get_connection().execute(
+            "SELECT COALESCE(MAX(row_version), 0) FROM password_entries").fetchone()[0]
+
+    def get_current_timestamp(self) -> str:
+        """Retorna o CURRENT_TIMESTAMP do SQLite, no mesmo formato de created_at/updated_at."""
+        return self._get_connection().execute("SELECT CURRENT_TIMESTAMP").fetchone()[0]
+
+    @staticmethod
+    def _update_assignments(new_name: str = None, new_encrypted_password: str = None,
+                            new_key_id: str = None) -> tuple[list[str], list]:
+        """Monta as atribuições do SET (e seus parâmetros) apenas para os campos informados."""
         update_fields = []
         params = []
 
@@ -78,26 +303,71 @@ class PasswordRepository:
         if new_encrypted_password is not None:
             update_fields.append("encrypted_password = ?")
             params.append(new_encrypted_password)
-        if new_master_key_salt is not None:
-            update_fields.append("master_key_salt = ?")
-            params.append(new_master_key_salt)
+        if new_key_id is not None:
+            update_fields.append(f"key_epoch_id = {KEY_EPOCH_ID_BY_KEY_ID}")
+            params.append(new_key_id)
+
+        if update_fields:
+            update_fields.append("updated_at = CURRENT_TIMESTAMP")
+            update_fields.append(f"row_version = {NEXT_ROW_VERSION}")
+        return update_fields, params
 
+    def _execute_update(self, key_column: str, key, update_fields: list[str], params: list,
+                        new_key_id: str = None) -> bool:
         if not update_fields:
             return False
-
-        params.append(entry_id)
-        query = f"UPDATE password_entries SET {', '.join(update_fields)} WHERE id = ?"
-
+        conn = self._get_connection()
+        query = f"UPDATE password_entries SET {', '.join(update_fields)} WHERE {key_column} = ?"
         try:
-            cursor.execute(query, params)
+            if new_key_id is not None:
+                self._ensure_key_epochs(conn, [new_key_id])
+            cursor = conn.execute(query, params + [key])
             conn.commit()
             return cursor.rowcount > 0
         except sqlite3.IntegrityError:
+            conn.rollback()
             return False
         except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em _execute_update: %s", e)
+            conn.rollback()
             return False
-        finally:
-            conn.close()
+
+    def update(self, entry_id: int, new_name: str = None, new_encrypted_password: str = None, new_key_id: str = None) -> bool:
+        update_fields, params = self._update_assignments(new_name, new_encrypted_password, new_key_id)
+        return self._execute_update("id", entry_id, update_fields, params, new_key_id)
+
+    def update_by_name(self, name: str, new_name: str = None, new_encrypted_password: str = None,
+                       new_key_id: str = None) -> bool:
+        """
+        Atualiza a entrada pelo nome em um único UPDATE, sem buscar o id antes.
+        Retorna False se o nome não existir ou se 'new_name' já estiver em uso.
+        """
+        update_fields, params = self._update_assignments(new_name, new_encrypted_password, new_key_id)
+        return self._execute_update("name", name, update_fields, params, new_key_id)
+
+    def upsert(self, name: str, encrypted_password: bytes, key_id: str) -> bool:
+        """
+        Insere a entrada ou, se o nome já existir, substitui sua senha cifrada,
+        em um único INSERT ... ON CONFLICT DO UPDATE (created_at é preservado).
+        """
+        return self.upsert_many([(name, encrypted_password, key_id)]) == 1
+
+    def upsert_many(self, entries: Iterable[tuple[str, str, str]]) -> int:
+        """
+        Versão em lote de upsert para entradas (name, encrypted_password, key_id),
+        gravadas em uma única transação. Retorna a quantidade de entradas gravadas
+        (0 se a transação falhar).
+        """
+        entries = list(entries)
+        conn = self._get_connection()
+        try:
+            with conn:
+                self._ensure_key_epochs(conn, (entry[2] for entry in entries))
+                cursor = conn.executemany(UPSERT_QUERY, entries)
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em upsert_many: %s", e)
+            return 0
 
     def delete(self, entry_id: int) -> bool:
         try:
@@ -107,4 +377,43 @@ class PasswordRepository:
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em delete: %s", e)
             return False
+
+    def delete_by_name(self, name: str) -> bool:
+        """Deleta a entrada pelo nome em um único DELETE, sem buscar o id antes."""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute("DELETE FROM password_entries WHERE name = ?", (name,))
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em delete_by_name: %s", e)
+            return False
+
+    def delete_many_by_name(self, names: Iterable[str]) -> list[str]:
+        """
+        Deleta as entradas com os nomes informados em uma única transação, em blocos
+        que respeitam o limite de parâmetros do SQLite. Retorna os nomes efetivamente
+        deletados (os inexistentes são ignorados).
+        """
+        names = list(dict.fromkeys(names))
+        deleted = []
+        conn = self._get_connection()
+        try:
+            with conn:
+                for start in range(0, len(names), 500):
+                    chunk = names[start:start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    if SUPPORTS_RETURNING:
+                        rows = conn.execute(f"DELETE FROM password_entries WHERE name IN ({placeholders}) "
+                                            "RETURNING name", chunk).fetchall()
+                    else:
+                        # SQLite anterior ao 3.35: lê os nomes dentro da mesma transação do DELETE
+                        rows = conn.execute(f"SELECT name FROM password_entries WHERE name IN ({placeholders})",
+                                            chunk).fetchall()
+                        conn.execute(f"DELETE FROM password_entries WHERE name IN ({placeholders})", chunk)
+                    deleted.extend(row[0] for row in rows)
+            return deleted
+        except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em delete_many_by_name: %s", e)
+            return []
@@ -2,36 +2,58 @@
 
 import sqlite3
 import os
+import threading
 from src.database.models.model_config import AppSetting
+from src.database.connection_manager import ConnectionManager, get_connection_manager
+from src.database.migrations import ensure_schema
 from src.config.path_config import DB_FILE_PATH, DB_DIRECTORY_PATH
+from src.config.log_config import get_logger
+
+logger = get_logger("storage")
 
 class ConfigRepository:
     """
     Gerencia as operações de CRUD para as configurações da aplicação (AppSetting)
     no banco de dados SQLite.
+    As configurações ficam em um cache em memória, carregado com um único SELECT
+    no primeiro acesso e mantido em sincronia pelas escritas (write-through).
     """
 
-    def __init__(self):
-        self.db_path = DB_FILE_PATH
-        os.makedirs(DB_DIRECTORY_PATH, exist_ok=True)
+    def __init__(self, db_path: str = None, connection_manager: ConnectionManager = None):
+        self.db_path = db_path if db_path else DB_FILE_PATH
+        os.makedirs(os.path.dirname(self.db_path) or DB_DIRECTORY_PATH, exist_ok=True)
+        # Conexão persistente por thread, compartilhada com os demais repositórios do mesmo arquivo
+        self.connection_manager = connection_manager if connection_manager else get_connection_manager(self.db_path)
+        self._settings_cache = None  # dict key -> value, carregado sob demanda
+        self._cache_lock = threading.Lock()
+        self.cache_loads = 0  # Quantas vezes o cache foi carregado do disco
         self.create_table()  # Chama a criação da tabela de configurações
 
     def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return self.connection_manager.get_connection()
 
     def create_table(self):
         """
-        Cria a tabela 'app_settings' no banco de dados, se ela ainda não existir.
+        Garante que o esquema do banco, incluindo a tabela 'app_settings', esteja
+        na versão atual (as migrações rodam uma única vez por arquivo).
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS app_settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    key TEXT NOT NULL UNIQUE,
-                    value TEXT NOT NULL
-                )
-            """)
+        ensure_schema(self.connection_manager)
+
+    def _load_settings(self) -> dict:
+        """Retorna o cache de configurações, carregando todas com um único SELECT se necessário."""
+        with self._cache_lock:
+            if self._settings_cache is None:
+                with self._get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT key, value FROM app_settings")
+                    self._settings_cache = dict(cursor.fetchall())
+                self.cache_loads += 1
+            return self._settings_cache
+
+    def clear_cache(self):
+        """Descarta o cache; o próximo acesso relê as configurações do disco."""
+        with self._cache_lock:
+            self._settings_cache = None
 
     def set_setting(self, key: str, value: str) -> bool:
         """
@@ -42,21 +64,38 @@ class ConfigRepository:
                 cursor = conn.cursor()
                 cursor.execute("INSERT OR REPLACE INTO app_settings (key, value) VALUES (?, ?)", (key, value))
                 conn.commit()
-            return True
         except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em set_setting: %s", e)
+            self.clear_cache()
+            return False
+        with self._cache_lock:
+            if self._settings_cache is not None:
+                self._settings_cache[key] = value
+        return True
+
+    def set_settings(self, settings: dict[str, str]) -> bool:
+        """
+        Insere ou atualiza várias configurações em uma única transação:
+        ou todas são gravadas, ou nenhuma.
+        """
+        try:
+            with self._get_connection() as conn:
+                conn.executemany("INSERT OR REPLACE INTO app_settings (key, value) VALUES (?, ?)",
+                                 list(settings.items()))
+        except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em set_settings: %s", e)
+            self.clear_cache()
             return False
+        with self._cache_lock:
+            if self._settings_cache is not None:
+                self._settings_cache.update(settings)
+        return True
 
     def get_setting(self, key: str) -> str | None:
         """
-        Recupera o valor de uma configuração da tabela 'app_settings'.
+        Recupera o valor de uma configuração da tabela 'app_settings' (via cache).
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM app_settings WHERE key = ?", (key,))
-            row = cursor.fetchone()
-        if row:
-            return row[0]
-        return None
+        return self._load_settings().get(key)
 
     def delete_setting(self, key: str) -> bool:
         """
@@ -67,7 +106,13 @@ class ConfigRepository:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM app_settings WHERE key = ?", (key,))
                 conn.commit()
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
         except sqlite3.Error as e:
+            logger.warning("Falha no SQLite em delete_setting: %s", e)
+            self.clear_cache()
             return False
+        with self._cache_lock:
+            if self._settings_cache is not None:
+                self._settings_cache.pop(key, None)
+        return deleted
 
@@ -0,0 +1,234 @@
+# PythonPasswordGenerate/src/database/services/async_security_service.py
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+
+from src.database.models.model import PasswordEntry
+from src.database.models.model_import import ImportReport
+from src.database.services.security_service import SecurityService, normalize_entry_name
+from src.config.log_config import get_logger
+
+logger = get_logger("security")
+
+DECRYPT_CHUNK_MIN = 64  # Abaixo disso, repartir o lote custa mais que descriptografá-lo em uma thread
+
+class AsyncSecurityService:
+    """
+    Fachada asyncio do SecurityService, para embutir o cofre em um serviço que atende
+    muitas consultas concorrentes sem bloquear o loop de eventos.
+
+    Nenhuma chamada bloqueante roda no loop:
+    - as escritas vão para uma única thread de escrita, com uma única conexão SQLite
+      (a conexão é por thread, ver ConnectionManager), e são executadas em ordem;
+    - as leituras rodam em threads de leitura próprias (o WAL permite ler enquanto
+      se escreve). Consultas por nome feitas no mesmo ciclo do loop são agrupadas em
+      um único SELECT ... IN, e consultas repetidas ao mesmo nome compartilham o resultado;
+    - a criptografia roda em um pool separado, e a derivação da senha mestra no
+      executor de KDF do próprio SecurityService.
+    A API síncrona do SecurityService continua disponível e compartilha a sessão.
+    """
+
+    def __init__(self, security_service: SecurityService, read_workers: int = 2, crypto_workers: int = None,
+                 max_batch: int = 500):
+        self.service = security_service
+        self.read_workers = read_workers
+        self.crypto_workers = crypto_workers if crypto_workers else (os.cpu_count() or 4)
+        self.max_batch = max_batch  # Nomes por SELECT agrupado
+        self._writer_executor = None  # Thread única de escrita, criada sob demanda
+        self._reader_executor = None
+        self._crypto_executor = None
+        self._pending_reads = {}  # Nome -> Future, à espera do próximo SELECT agrupado
+        self._flush_scheduled = False
+        self._tasks = set()  # Lotes de leitura em andamento (referências mantidas até o fim)
+        self.reads_requested = 0  # Consultas por nome recebidas
+        self.read_batches = 0  # SELECTs agrupados executados para atendê-las
+
+    @property
+    def repo(self):
+        return self.service.repo
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_writer_executor(self) -> ThreadPoolExecutor:
+        if self._writer_executor is None:
+            self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+        return self._writer_executor
+
+    def _get_reader_executor(self) -> ThreadPoolExecutor:
+        if self._reader_executor is None:
+            self._reader_executor = ThreadPoolExecutor(max_workers=self.read_workers,
+                                                       thread_name_prefix="sqlite-reader")
+        return self._reader_executor
+
+    def _get_crypto_executor(self) -> ThreadPoolExecutor:
+        if self._crypto_executor is None:
+            self._crypto_executor = ThreadPoolExecutor(max_workers=self.crypto_workers, thread_name_prefix="crypto")
+        return self._crypto_executor
+
+    async def _run_write(self, fn: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_writer_executor(), fn, *args)
+
+    async def _run_read(self, fn: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_reader_executor(), fn, *args)
+
+    async def _run_crypto(self, fn: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_crypto_executor(), fn, *args)
+
+    def is_unlocked(self) -> bool:
+        return self.service.active_data_key() is not None
+
+    async def is_master_password_set(self) -> bool:
+        return await self._run_read(self.service.is_master_password_set)
+
+    async def login_with_master_password(self, master_password: str) -> bool:
+        return await asyncio.wrap_future(self.service.login_with_master_password_async(master_password))
+
+    async def register_and_login(self, master_password: str) -> bool:
+        return await asyncio.wrap_future(self.service.register_and_login_async(master_password))
+
+    async def logout(self):
+        """Encerra a sessão depois das escritas já enfileiradas."""
+        await self._run_write(self.service.logout)
+
+    async def close(self):
+        """Espera as escritas pendentes e encerra as threads da fachada (o SecurityService continua aberto)."""
+        if self._writer_executor is not None:
+            await self._run_write(lambda: None)
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
+        for executor in (self._writer_executor, self._reader_executor, self._crypto_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._writer_executor = self._reader_executor = self._crypto_executor = None
+
+    async def retrieve_password_by_name(self, name: str) -> str | None:
+        """
+        Retorna a senha da entrada 'name', ou None se ela não existir.
+        Consultas concorrentes são agrupadas: o SELECT sai no próximo ciclo do loop
+        com todos os nomes pedidos até lá.
+        """
+        if not self.is_unlocked():
+            logger.warning("Faça login com a senha mestra primeiro para recuperar senhas.")
+            return None
+        self.reads_requested += 1
+        password_cache = self.service.password_cache
+        if password_cache is not None:
+            cached_pwd = password_cache.get(name)
+            if cached_pwd is not None:
+                return cached_pwd
+        future = self._pending_reads.get(name)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending_reads[name] = loop.create_future()
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._flush_reads)
+        # shield: o cancelamento de quem espera não cancela o resultado compartilhado
+        return await asyncio.shield(future)
+
+    async def retrieve_passwords_by_name(self, names: Iterable[str]) -> dict[str, str | None]:
+        """Retorna {nome: senha} para vários nomes (None para os inexistentes)."""
+        names = list(dict.fromkeys(names))
+        passwords = await asyncio.gather(*(self.retrieve_password_by_name(name) for name in names))
+        return dict(zip(names, passwords))
+
+    def _flush_reads(self):
+        self._flush_scheduled = False
+        pending, self._pending_reads = self._pending_reads, {}
+        names = list(pending)
+        for start in range(0, len(names), self.max_batch):
+            batch = {name: pending[name] for name in names[start:start + self.max_batch]}
+            task = asyncio.ensure_future(self._resolve_reads(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve_reads(self, batch: dict[str, asyncio.Future]):
+        self.read_batches += 1
+        password_cache = self.service.password_cache
+        cache_generation = password_cache.generation if password_cache is not None else None
+        try:
+            entries = await self._run_read(self.repo.get_by_names, list(batch))
+            passwords = await self._decrypt_entries_parallel(list(entries.values()))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for name, future in batch.items():
+            password = passwords.get(name)
+            if password is not None and password_cache is not None:
+                password_cache.put(name, password, cache_generation)
+            if not future.done():
+                future.set_result(password)
+
+    def _decrypt_entries(self, entries: list[PasswordEntry]) -> dict[str, str | None]:
+        decrypt_entry = self.service.decrypt_entry_password
+        return {entry.name: decrypt_entry(entry) for entry in entries}
+
+    async def _decrypt_entries_parallel(self, entries: list[PasswordEntry]) -> dict[str, str | None]:
+        """Descriptografa no pool de criptografia, repartindo lotes grandes entre as threads."""
+        if not entries:
+            return {}
+        chunk_size = max(DECRYPT_CHUNK_MIN, -(-len(entries) // self.crypto_workers))
+        chunks = [entries[start:start + chunk_size] for start in range(0, len(entries), chunk_size)]
+        passwords = {}
+        for result in await asyncio.gather(*(self._run_crypto(self._decrypt_entries, chunk) for chunk in chunks)):
+            passwords.update(result)
+        return passwords
+
+    async def search_password_names(self, query: str, limit: int = 50) -> List[str]:
+        # Na primeira busca o índice é construído a partir do banco: roda na thread de leitura
+        return await self._run_read(self.service.search_password_names, query, limit)
+
+    async def get_password_entries_metadata_page(self, after_name: str = None,
+                                                 limit: int = 200) -> List[PasswordEntry]:
+        return await self._run_read(self.service.get_password_entries_metadata_page, after_name, limit)
+
+    async def save_password_entry(self, name: str, plain_password: str, overwrite: bool = False) -> bool:
+        """Como SecurityService.save_password_entry: cifra no pool de criptografia e grava na thread de escrita."""
+        active = self.service.active_data_key()
+        if active is None:
+            logger.warning("Faça login com a senha mestra primeiro para salvar senhas.")
+            return False
+        name = normalize_entry_name(name)
+        key_id, fernet = active
+        encryption = self._get_crypto_executor().submit(self.service.cipher_manager.encrypt_password_bytes,
+                                                        fernet, plain_password)
+        save = self.repo.upsert if overwrite else self.repo.add
+
+        def write() -> str | None:
+            # A escrita entra na fila já na chamada, para respeitar a ordem das chamadas;
+            # a cifragem roda no pool de criptografia enquanto as escritas anteriores terminam
+            encrypted_pwd = encryption.result()
+            return self.repo.get_current_timestamp() if save(name, encrypted_pwd, key_id) else None
+
+        created_at = await self._run_write(write)
+        if created_at is None:
+            return False
+        if overwrite:
+            self.service._invalidate_cached_passwords([name])
+        self.service.name_index.add(name, created_at)
+        return True
+
+    async def save_password_entries_bulk(self, entries: Iterable[tuple[str, str]],
+                                         chunk_size: int = 500, keep_rows: bool = True) -> ImportReport | None:
+        """Importação em lote (SecurityService.save_password_entries_bulk) na thread de escrita."""
+        return await self._run_write(functools.partial(self.service.save_password_entries_bulk, entries,
+                                                       chunk_size, keep_rows=keep_rows))
+
+    async def update_password_by_name(self, name: str, new_plain_password: str = None,
+                                      new_name: str = None) -> bool:
+        return await self._run_write(self.service.update_password_by_name, name, new_plain_password, new_name)
+
+    async def delete_password_by_name(self, name: str) -> bool:
+        return await self._run_write(self.service.delete_password_by_name, name)
+
+    async def delete_passwords_by_name(self, names: Iterable[str]) -> List[str]:
+        return await self._run_write(self.service.delete_passwords_by_name, list(names))
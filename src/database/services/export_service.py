@@ -0,0 +1,251 @@
+# PythonPasswordGenerate/src/database/services/export_service.py
+
+import contextlib
+import csv
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from src.config.cipher_manager import CipherManager
+from src.config.kdf import kdf_from_setting
+from src.database.models.model import PasswordEntry
+from src.database.services.security_service import (SecurityService, MASTER_SALT_SETTING_KEY,
+                                                    MASTER_KDF_SETTING_KEY, DATA_KEYS_SETTING_KEY)
+
+ARCHIVE_FORMAT = "my_voult-backup"
+ARCHIVE_VERSION = 3
+# A versão 2 guarda as DEKs embrulhadas e o key_id de cada entrada; a 3, o key_id da DEK que cifra os blocos
+SUPPORTED_ARCHIVE_VERSIONS = (1, 2, 3)
+LAST_BACKUP_SETTING_KEY = "last_backup_at"  # Instante do último backup
+LAST_BACKUP_VERSION_SETTING_KEY = "last_backup_row_version"  # Maior row_version do último backup, base dos incrementais
+
+class ExportService:
+    """
+    Exporta as entradas do cofre em blocos, lendo-as com um cursor em vez de
+    materializar a tabela inteira.
+
+    O backup criptografado é um arquivo de texto: a primeira linha é um cabeçalho
+    JSON (versão, tipo do backup, salt, KDF e DEKs embrulhadas do cofre e o key_id da DEK
+    ativa) e cada linha seguinte é um token Fernet, gerado com essa DEK, contendo um bloco
+    de entradas em JSON.
+    A última linha é um token de encerramento com o total de entradas, o que permite
+    detectar arquivos truncados.
+    """
+
+    def __init__(self, security_service: SecurityService):
+        self.security_service = security_service
+        self._executor = None  # Executor criado sob demanda para exportações em segundo plano
+
+    def _require_session(self):
+        fernet_instance = self.security_service._current_fernet_instance
+        if not fernet_instance:
+            raise PermissionError("Faça login com a senha mestra primeiro para exportar senhas.")
+        return fernet_instance
+
+    def export_encrypted_archive(self, path: str, incremental: bool = False, batch_size: int = 500) -> int:
+        """
+        Grava um backup criptografado em 'path'. Com incremental=True, inclui apenas
+        as entradas criadas ou alteradas desde o último backup (ou todas, se não houver).
+        Cada backup vai até o maior row_version lido no início: o que for gravado durante
+        a exportação entra no próximo, e nenhuma entrada se repete entre os dois.
+        Retorna a quantidade de entradas gravadas.
+        """
+        self._require_session()
+        key_id, fernet_instance = self.security_service.active_data_key()
+        repo = self.security_service.repo
+        config_repo = self.security_service.config_repo
+
+        since_version = config_repo.get_setting(LAST_BACKUP_VERSION_SETTING_KEY) if incremental else None
+        since_version = int(since_version) if since_version is not None else None
+        up_to_version = repo.get_max_row_version()
+        snapshot_at = repo.get_current_timestamp()
+        header = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "kind": "incremental" if since_version is not None else "full",
+            "since": config_repo.get_setting(LAST_BACKUP_SETTING_KEY) if since_version is not None else None,
+            "snapshot_at": snapshot_at,
+            "since_row_version": since_version,
+            "row_version": up_to_version,
+            "master_password_salt": config_repo.get_setting(MASTER_SALT_SETTING_KEY),
+            "master_password_kdf": config_repo.get_setting(MASTER_KDF_SETTING_KEY),
+            "data_keys": config_repo.get_setting(DATA_KEYS_SETTING_KEY),
+            "archive_key_id": key_id,
+        }
+
+        count = 0
+        with _private_temp_file(path) as fp:
+            fp.write(json.dumps(header) + "\n")
+            batch = []
+            for entry in repo.iter_entries(since_version or 0, up_to_version, batch_size=batch_size):
+                batch.append(_entry_to_record(entry))
+                if len(batch) >= batch_size:
+                    fp.write(_seal(fernet_instance, {"entries": batch}) + "\n")
+                    count += len(batch)
+                    batch = []
+            if batch:
+                fp.write(_seal(fernet_instance, {"entries": batch}) + "\n")
+                count += len(batch)
+            fp.write(_seal(fernet_instance, {"end": True, "count": count}) + "\n")
+
+        config_repo.set_settings({LAST_BACKUP_SETTING_KEY: snapshot_at,
+                                  LAST_BACKUP_VERSION_SETTING_KEY: str(up_to_version)})
+        return count
+
+    def iter_archive_entries(self, path: str, master_password: str = None,
+                             decrypt_passwords: bool = False) -> Iterator[dict]:
+        """
+        Lê um backup criptografado bloco a bloco e gera cada entrada como um dict com
+        name, encrypted_password, key_id, created_at e updated_at (e password, com
+        decrypt_passwords=True).
+        As chaves de dados vêm da sessão; um backup cifrado com uma DEK já retirada do
+        cofre (após rotate_data_key e a recifragem) exige a senha mestra da época do
+        backup, que desembrulha as DEKs guardadas no próprio cabeçalho.
+        Levanta ValueError se o arquivo não for um backup válido, estiver truncado ou
+        não puder ser decifrado com as chaves disponíveis.
+        """
+        self._require_session()
+        with open(path, encoding="utf-8") as fp:
+            header = json.loads(fp.readline() or "{}")
+            if header.get("format") != ARCHIVE_FORMAT or header.get("version") not in SUPPORTED_ARCHIVE_VERSIONS:
+                raise ValueError("O arquivo não é um backup do cofre em um formato suportado.")
+            fernets = self._archive_fernets(header, master_password)
+            archive_fernet = _archive_block_fernet(header, fernets)
+            count = 0
+            for line in fp:
+                try:
+                    payload = json.loads(archive_fernet.decrypt(line.strip().encode("utf-8")))
+                except InvalidToken:
+                    raise ValueError("Backup corrompido ou cifrado com outra chave de dados.")
+                if payload.get("end"):
+                    if payload.get("count") != count:
+                        raise ValueError("Backup inconsistente: quantidade de entradas divergente.")
+                    return
+                for record in payload["entries"]:
+                    count += 1
+                    if decrypt_passwords:
+                        fernet_instance = fernets.get(record["key_id"])
+                        record["password"] = self.security_service.cipher_manager.decrypt_password(
+                            fernet_instance, record["encrypted_password"]) if fernet_instance else None
+                    yield record
+        raise ValueError("Backup incompleto: marcador de encerramento não encontrado.")
+
+    def _archive_fernets(self, header: dict, master_password: str = None) -> dict[str, Fernet]:
+        """
+        Chaves de dados para ler um backup ({key_id: Fernet}): as da sessão e, com a
+        senha mestra, as guardadas no cabeçalho, desembrulhadas com a KEK derivada do
+        salt e da KDF do backup (no formato 1, essa chave é a própria chave do cofre).
+        """
+        fernets = dict(self.security_service._data_fernets)
+        salt = header.get("master_password_salt")
+        if master_password is None or not salt:
+            return fernets
+        cipher_manager = self.security_service.cipher_manager
+        kek = cipher_manager.derive_fernet_key(master_password, salt, kdf_from_setting(header.get("master_password_kdf")))
+        if not header.get("data_keys"):
+            fernets.setdefault(salt, cipher_manager.get_fernet_from_key(kek))
+            return fernets
+        key_encryption_fernet = cipher_manager.get_fernet_from_key(kek)
+        try:
+            for key_id, wrapped in json.loads(header["data_keys"]).items():
+                if key_id not in fernets:
+                    fernets[key_id] = cipher_manager.get_fernet_from_key(
+                        cipher_manager.unwrap_data_key(key_encryption_fernet, wrapped))
+        except InvalidToken:
+            raise ValueError("Senha mestra incorreta para este backup.")
+        return fernets
+
+    def export_plaintext_csv(self, path: str, confirm_plaintext: bool = False, batch_size: int = 500) -> int:
+        """
+        Exporta as entradas com as senhas em TEXTO PURO para um CSV (name, password,
+        created_at, updated_at). Exige confirm_plaintext=True.
+        O arquivo é criado com permissão 0600 e só substitui 'path' quando está completo.
+        Levanta ValueError, sem gravar nada, se alguma senha não puder ser descriptografada.
+        Retorna a quantidade de entradas gravadas.
+        """
+        if not confirm_plaintext:
+            raise PermissionError("A exportação em texto puro precisa ser confirmada explicitamente.")
+        self._require_session()
+        decrypt_entry = self.security_service.decrypt_entry_password
+
+        count = 0
+        undecryptable = []
+        with _private_temp_file(path, newline="") as fp:
+            writer = csv.writer(fp)
+            writer.writerow(["name", "password", "created_at", "updated_at"])
+            for entry in self.security_service.repo.iter_entries(batch_size=batch_size):
+                plain_password = decrypt_entry(entry)
+                if plain_password is None:
+                    undecryptable.append(entry.name)
+                    continue
+                writer.writerow([entry.name, plain_password, entry.created_at, entry.updated_at])
+                count += 1
+            if undecryptable:
+                # Um CSV sem essas senhas pareceria um backup completo: a exportação é abortada
+                raise ValueError(f"{len(undecryptable)} senha(s) não puderam ser descriptografadas "
+                                 f"(ex.: '{undecryptable[0]}'); nada foi exportado.")
+        return count
+
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def export_encrypted_archive_async(self, path: str, incremental: bool = False) -> Future:
+        """Executa export_encrypted_archive em segundo plano."""
+        return self._submit(self.export_encrypted_archive, path, incremental)
+
+    def export_plaintext_csv_async(self, path: str, confirm_plaintext: bool = False) -> Future:
+        """Executa export_plaintext_csv em segundo plano."""
+        return self._submit(self.export_plaintext_csv, path, confirm_plaintext)
+
+@contextlib.contextmanager
+def _private_temp_file(path: str, newline: str = None):
+    """
+    Abre '<path>.tmp' para escrita, criado com permissão 0600 (apenas o dono lê), e o move
+    para 'path' ao final. Em caso de erro o temporário é removido e o destino fica intacto.
+    """
+    temp_path = path + ".tmp"
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(temp_path)  # Sobra de uma exportação interrompida (ou um link deixado no lugar)
+    fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    try:
+        with os.fdopen(fd, "w", newline=newline, encoding="utf-8") as fp:
+            yield fp
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+def _entry_to_record(entry: PasswordEntry) -> dict:
+    return {
+        "name": entry.name,
+        "encrypted_password": CipherManager.bytes_to_token(entry.encrypted_password),  # Token Fernet em texto
+        "key_id": entry.key_id,
+        "created_at": entry.created_at,
+        "updated_at": entry.updated_at,
+    }
+
+def _archive_block_fernet(header: dict, fernets: dict[str, Fernet]) -> MultiFernet:
+    """
+    Fernet que decifra os blocos: a DEK indicada no cabeçalho (formato 3) ou, nos formatos
+    anteriores, qualquer das DEKs do cabeçalho (2) ou a chave identificada pelo salt (1).
+    """
+    if header.get("archive_key_id"):
+        key_ids = [header["archive_key_id"]]
+    elif header.get("data_keys"):
+        key_ids = list(json.loads(header["data_keys"]))
+    else:
+        key_ids = [header.get("master_password_salt")]
+    candidates = [fernets[key_id] for key_id in key_ids if key_id in fernets]
+    if not candidates:
+        raise ValueError("O backup foi cifrado com uma chave de dados que não está mais no cofre: "
+                         "informe a senha mestra da época do backup.")
+    return MultiFernet(candidates)
+
+def _seal(fernet_instance, payload: dict) -> str:
+    return fernet_instance.encrypt(json.dumps(payload).encode("utf-8")).decode("utf-8")
@@ -0,0 +1,217 @@
+# PythonPasswordGenerate/src/database/services/import_service.py
+
+import csv
+import json
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, TextIO
+from urllib.parse import urlparse
+
+from src.database.models.model_import import ImportReport
+from src.database.services.security_service import SecurityService
+
+# Nomes de coluna (em minúsculas) usados pelas exportações mais comuns:
+# Chrome/Edge, Firefox, Bitwarden, LastPass, 1Password, KeePass/KeePassXC e Dashlane.
+NAME_COLUMNS = ("name", "title", "account")
+URL_COLUMNS = ("url", "login_uri", "web site", "website", "uri", "origin")
+USERNAME_COLUMNS = ("username", "login_username", "login name", "user name", "login", "email")
+PASSWORD_COLUMNS = ("password", "login_password", "pass")
+
+MALFORMED_ROW = None  # Registro que não é um objeto: contado como falha pelo relatório da importação
+JSON_READ_SIZE = 64 * 1024  # Tamanho dos blocos lidos ao percorrer arquivos JSON
+ITEMS_KEY_PATTERN = re.compile(r'"items"\s*:\s*\[')  # Início da lista "items" do Bitwarden
+
+class ImportService:
+    """
+    Importa senhas exportadas de navegadores e de outros gerenciadores de senhas.
+    Os arquivos são lidos como um fluxo de linhas e gravados em blocos por
+    SecurityService.save_password_entries_bulk, com uso de memória constante.
+    """
+
+    def __init__(self, security_service: SecurityService):
+        self.security_service = security_service
+        self._executor = None  # Executor criado sob demanda para importações em segundo plano
+
+    def import_file(self, path: str, chunk_size: int = 500,
+                    on_progress: Callable[[ImportReport], None] = None) -> ImportReport | None:
+        """
+        Importa um arquivo CSV, JSON ou JSON Lines (detectado pela extensão).
+        Retorna o ImportReport com os contadores, ou None se não houver sessão aberta.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        with open(path, newline="", encoding="utf-8-sig") as fp:
+            if extension == ".csv":
+                rows = self.iter_csv_entries(fp)
+            elif extension == ".json":
+                rows = self.iter_json_entries(fp)
+            elif extension == ".jsonl":
+                rows = self.iter_json_lines_entries(fp)
+            else:
+                raise ValueError(f"Formato de arquivo não suportado: '{extension}'.")
+            return self.security_service.save_password_entries_bulk(
+                rows, chunk_size=chunk_size, on_progress=on_progress, keep_rows=False)
+
+    def import_file_async(self, path: str, chunk_size: int = 500,
+                          on_progress: Callable[[ImportReport], None] = None) -> Future:
+        """
+        Executa import_file em segundo plano.
+        Retorna um Future cujo resultado é o ImportReport de import_file.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="import")
+        return self._executor.submit(self.import_file, path, chunk_size, on_progress)
+
+    @staticmethod
+    def iter_csv_entries(fp: TextIO) -> Iterator[tuple[str, str]]:
+        """Gera (name, password) a partir de um CSV com cabeçalho de um dos formatos conhecidos."""
+        reader = csv.reader(fp)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = [column.strip().lower() for column in header]
+
+        def find(candidates: tuple[str, ...]) -> int | None:
+            for candidate in candidates:
+                if candidate in columns:
+                    return columns.index(candidate)
+            return None
+
+        name_col, url_col = find(NAME_COLUMNS), find(URL_COLUMNS)
+        username_col, password_col = find(USERNAME_COLUMNS), find(PASSWORD_COLUMNS)
+        if password_col is None:
+            raise ValueError("Coluna de senha não encontrada no cabeçalho do CSV.")
+
+        def cell(row: list[str], index: int | None) -> str:
+            return row[index].strip() if index is not None and index < len(row) else ""
+
+        for row in reader:
+            if not row:
+                continue
+            password = row[password_col] if password_col < len(row) else ""
+            yield _entry_name(cell(row, name_col), cell(row, url_col), cell(row, username_col)), password
+
+    @staticmethod
+    def iter_json_entries(fp: TextIO) -> Iterator[tuple[str, str]]:
+        """
+        Gera (name, password) a partir de um JSON: uma lista de objetos ou um objeto
+        com a lista em "items" (formato do Bitwarden). Os itens são decodificados
+        um a um, sem carregar o arquivo inteiro.
+        """
+        for item in _iter_json_array_items(fp):
+            yield _json_item_entry(item)
+
+    @staticmethod
+    def iter_json_lines_entries(fp: TextIO) -> Iterator[tuple[str, str]]:
+        """
+        Gera (name, password) a partir de um arquivo JSON Lines (um objeto por linha).
+        Cada linha é independente: uma linha inválida vira uma linha malformada do relatório.
+        """
+        for line in fp:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                yield MALFORMED_ROW
+                continue
+            yield _json_item_entry(item)
+
+def _entry_name(name: str, url: str, username: str) -> str:
+    """Monta o nome da entrada: título (ou domínio da URL) seguido do usuário, se houver."""
+    base = name or (_url_hostname(url) or url if url else "")
+    if base and username:
+        return f"{base} ({username})"
+    return base or username
+
+def _url_hostname(url: str) -> str | None:
+    try:
+        return urlparse(url).hostname
+    except ValueError:
+        return None  # URL malformada (ex.: IPv6 sem ']'): o nome usa a URL como está
+
+def _json_item_entry(item: object) -> tuple[str, object] | None:
+    """
+    Extrai (name, password) de um objeto plano ou de um item do Bitwarden.
+    Retorna MALFORMED_ROW se o item não for um objeto; uma senha que não é texto segue
+    adiante para ser recusada, com o nome, por save_password_entries_bulk.
+    """
+    if not isinstance(item, dict):
+        return MALFORMED_ROW
+    lowered = {str(key).lower(): value for key, value in item.items()}
+    login = lowered.get("login") if isinstance(lowered.get("login"), dict) else {}
+
+    def first(source: dict, candidates: tuple[str, ...]) -> str:
+        for candidate in candidates:
+            value = source.get(candidate)
+            if isinstance(value, str) and value:
+                return value.strip()
+        return ""
+
+    url = first(lowered, URL_COLUMNS)
+    uris = login.get("uris")
+    if not url and isinstance(uris, list) and uris:
+        uri = uris[0].get("uri") if isinstance(uris[0], dict) else uris[0]
+        url = uri.strip() if isinstance(uri, str) else ""
+    username = first(login, USERNAME_COLUMNS) or first(lowered, USERNAME_COLUMNS)
+    password = login.get("password")
+    if not isinstance(password, str) or not password:
+        password = lowered.get("password", password)
+    return _entry_name(first(lowered, NAME_COLUMNS), url, username), "" if password is None else password
+
+def _iter_json_array_items(fp: TextIO) -> Iterator[object]:
+    """
+    Percorre os elementos da lista principal de um documento JSON lendo o arquivo
+    em blocos e decodificando um elemento por vez com JSONDecoder.raw_decode.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+
+    def read_more() -> bool:
+        nonlocal buffer, eof
+        data = fp.read(JSON_READ_SIZE)
+        if not data:
+            eof = True
+            return False
+        buffer += data
+        return True
+
+    def skip(chars: str) -> bool:
+        # Descarta os caracteres informados do início do buffer; False se o arquivo acabou
+        nonlocal buffer
+        while True:
+            buffer = buffer.lstrip(chars)
+            if buffer or not read_more():
+                return bool(buffer)
+
+    if not skip(" \t\r\n"):
+        return
+    if buffer[0] == "{":
+        # Objeto: procura a lista "items" mantendo apenas o final do trecho já lido
+        match = ITEMS_KEY_PATTERN.search(buffer)
+        while match is None:
+            buffer = buffer[-64:]
+            if not read_more():
+                raise ValueError('Lista "items" não encontrada no arquivo JSON.')
+            match = ITEMS_KEY_PATTERN.search(buffer)
+        buffer = buffer[match.end() - 1:]
+    if buffer[0] != "[":
+        raise ValueError("O arquivo JSON deve conter uma lista de entradas.")
+    buffer = buffer[1:]
+
+    while True:
+        if not skip(" \t\r\n,"):
+            raise ValueError("Arquivo JSON incompleto.")
+        if buffer[0] == "]":
+            return
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer)
+                break
+            except json.JSONDecodeError:
+                if eof or not read_more():
+                    raise ValueError("Arquivo JSON inválido ou incompleto.")
+        buffer = buffer[end:]
+        yield item
@@ -0,0 +1,114 @@
+# PythonPasswordGenerate/src/database/services/password_cache.py
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable
+
+DEFAULT_CACHE_TTL = 60.0  # Segundos que uma senha descriptografada pode ficar no cache
+
+class DecryptedPasswordCache:
+    """
+    Cache LRU limitado das senhas já descriptografadas, para que consultas repetidas
+    às mesmas entradas não refaçam a leitura no banco e a verificação HMAC + AES do Fernet.
+
+    Cada senha fica no máximo 'ttl' segundos (contados da inserção) e o cache guarda no
+    máximo 'max_entries' senhas, descartando as menos usadas. As senhas são guardadas
+    em bytearrays, que são zerados quando saem do cache (expiração, descarte, invalidação
+    ou clear). Isso limpa apenas a cópia do cache: as strings entregues a quem consulta
+    são imutáveis e seguem as regras normais de memória do Python.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = DEFAULT_CACHE_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0 or ttl <= 0:
+            raise ValueError("O tamanho e o TTL do cache devem ser positivos.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # Nome -> bytearray com a senha em UTF-8, do menos ao mais usado
+        self._expirations = deque()  # (instante de expiração, nome, bytearray), em ordem de inserção
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # Senhas descartadas por falta de espaço ou por expiração
+        self.generation = 0  # Incrementado a cada invalidação (ver put)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _wipe(buffer: bytearray):
+        buffer[:] = bytes(len(buffer))
+
+    def _discard(self, name: str):
+        buffer = self._entries.pop(name, None)
+        if buffer is not None:
+            self._wipe(buffer)
+
+    def _expire(self):
+        """Descarta as senhas vencidas. Como o TTL é fixo, a ordem de inserção é a de expiração."""
+        now = self._clock()
+        while self._expirations and self._expirations[0][0] <= now:
+            _, name, buffer = self._expirations.popleft()
+            if self._entries.get(name) is buffer:  # Ignora registros de senhas já substituídas
+                self._discard(name)
+                self.evictions += 1
+
+    def get(self, name: str) -> str | None:
+        with self._lock:
+            self._expire()
+            buffer = self._entries.get(name)
+            if buffer is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return buffer.decode("utf-8")
+
+    def put(self, name: str, password: str, generation: int = None):
+        """
+        Guarda a senha descriptografada de 'name'. Com 'generation' (o valor de
+        self.generation lido antes da leitura no banco), a senha é ignorada se houve uma
+        invalidação nesse meio-tempo: ela pode ter sido lida antes da alteração.
+        """
+        buffer = bytearray(password.encode("utf-8"))
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                self._wipe(buffer)
+                return
+            self._expire()
+            self._discard(name)
+            self._entries[name] = buffer
+            self._expirations.append((self._clock() + self.ttl, name, buffer))
+            while len(self._entries) > self.max_entries:
+                oldest_name = next(iter(self._entries))
+                self._discard(oldest_name)
+                self.evictions += 1
+            if len(self._expirations) > 2 * self.max_entries:
+                # Descarta registros de senhas que já saíram do cache, para a fila não crescer sem limite
+                self._expirations = deque(item for item in self._expirations if self._entries.get(item[1]) is item[2])
+
+    def invalidate(self, *names: str):
+        """Remove (e zera) as senhas dos nomes informados, após alteração ou exclusão."""
+        with self._lock:
+            self.generation += 1
+            for name in names:
+                self._discard(name)
+
+    def clear(self):
+        """Zera e remove todas as senhas do cache (logout)."""
+        with self._lock:
+            self.generation += 1
+            for buffer in self._entries.values():
+                self._wipe(buffer)
+            self._entries.clear()
+            self._expirations.clear()
+
+    def stats(self) -> dict:
+        """Contadores para dimensionar o cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"size": len(self._entries), "max_entries": self.max_entries, "ttl": self.ttl,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "hit_rate": self.hits / lookups if lookups else 0.0}
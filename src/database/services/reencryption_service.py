@@ -0,0 +1,164 @@
+# PythonPasswordGenerate/src/database/services/reencryption_service.py
+
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+from cryptography.fernet import Fernet
+
+from src.database.models.model import PasswordEntry
+from src.database.services.security_service import SecurityService
+from src.config.log_config import get_logger, key_label
+
+logger = get_logger("reencryption")
+
+CHECKPOINT_SETTING_KEY = "reencryption_checkpoint"  # JSON {key_id, last_id, reencrypted} do job em andamento
+
+class ReencryptionService:
+    """
+    Recifra o cofre inteiro com a chave de dados (DEK) ativa, em segundo plano.
+
+    As entradas ainda cifradas com DEKs anteriores são percorridas em lotes, em ordem
+    de id; cada lote é descriptografado e recifrado em paralelo e gravado em sua própria
+    transação, seguida de um checkpoint em 'app_settings'. Se a aplicação for fechada
+    (ou a sessão encerrada) no meio do job, ele continua do checkpoint no próximo login.
+    O cofre continua utilizável durante o job: novas senhas já usam a DEK ativa e uma
+    entrada alterada pelo usuário durante o lote não é sobrescrita.
+    """
+
+    def __init__(self, security_service: SecurityService, batch_size: int = 500, workers: int = None):
+        self.security_service = security_service
+        self.batch_size = batch_size
+        self.workers = workers if workers else (os.cpu_count() or 4)
+        self._executor = None  # Thread do job, criada sob demanda
+        self._crypto_executor = None  # Pool que descriptografa e recifra os lotes
+        self._cancel_event = threading.Event()
+        self._future = None
+
+    @property
+    def config_repo(self):
+        return self.security_service.config_repo
+
+    def _load_checkpoint(self) -> dict | None:
+        stored = self.config_repo.get_setting(CHECKPOINT_SETTING_KEY)
+        return json.loads(stored) if stored else None
+
+    def has_pending_job(self) -> bool:
+        """Indica se há um job interrompido (checkpoint gravado) esperando para continuar."""
+        return self._load_checkpoint() is not None
+
+    def is_running(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def rotate_and_reencrypt_async(self, master_password: str,
+                                   on_progress: Callable[[int], None] = None) -> Future:
+        """
+        Gera uma nova DEK (SecurityService.rotate_data_key) e inicia, em segundo plano,
+        a recifragem das entradas com ela. O resultado do Future é a quantidade de
+        entradas recifradas (ou None se a senha mestra estiver errada).
+        """
+        def rotate_and_run():
+            if not self.security_service.rotate_data_key(master_password):
+                return None
+            return self.run(on_progress)
+        return self._submit(rotate_and_run)
+
+    def resume_async(self, on_progress: Callable[[int], None] = None) -> Future:
+        """Continua em segundo plano um job interrompido (ou recifra o que faltar)."""
+        return self._submit(self.run, on_progress)
+
+    def _submit(self, fn, *args) -> Future:
+        if self.is_running():
+            return self._future
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reencryption")
+        self._cancel_event.clear()
+        self._future = self._executor.submit(fn, *args)
+        return self._future
+
+    def cancel(self):
+        """Interrompe o job ao fim do lote atual; o checkpoint permite retomá-lo depois."""
+        self._cancel_event.set()
+
+    def stop(self, timeout: float = None):
+        """Interrompe o job e espera o lote atual terminar (antes de bloquear ou encerrar a sessão)."""
+        self.cancel()
+        if self._future is not None:
+            wait([self._future], timeout)
+
+    def shutdown(self):
+        self.cancel()
+        for executor in (self._executor, self._crypto_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._crypto_executor = None
+
+    def run(self, on_progress: Callable[[int], None] = None) -> int:
+        """
+        Executa o job na thread atual. 'on_progress' recebe o total de entradas já
+        recifradas após cada lote. Retorna esse total (incluindo o de execuções
+        anteriores do mesmo job).
+        """
+        active = self.security_service.active_data_key()
+        if not active:
+            logger.warning("Faça login com a senha mestra primeiro para recifrar senhas.")
+            return 0
+        active_key_id, active_fernet = active
+
+        checkpoint = self._load_checkpoint()
+        if not checkpoint or checkpoint["key_id"] != active_key_id:
+            # Sem job anterior, ou ele era para uma DEK que já não é a ativa: recomeça do início
+            checkpoint = {"key_id": active_key_id, "last_id": 0, "reencrypted": 0}
+        logger.info("Recifrando a partir do id %d com a chave %s.", checkpoint["last_id"], key_label(active_key_id))
+
+        repo = self.security_service.repo
+        while not self._cancel_event.is_set():
+            if self.security_service.active_data_key() != active:
+                logger.info("Sessão encerrada ou chave trocada; job interrompido.")
+                return checkpoint["reencrypted"]
+            batch = repo.get_entries_outside_key(active_key_id, checkpoint["last_id"], self.batch_size)
+            if not batch:
+                break
+            rows = self._reencrypt_batch(batch, active_key_id, active_fernet)
+            checkpoint["reencrypted"] += repo.replace_encrypted_passwords(rows)
+            checkpoint["last_id"] = batch[-1].id
+            # Gravado após o commit do lote: se a aplicação cair entre os dois, o lote é
+            # apenas relido, pois as entradas já recifradas não são mais selecionadas
+            self.config_repo.set_setting(CHECKPOINT_SETTING_KEY, json.dumps(checkpoint))
+            if on_progress:
+                on_progress(checkpoint["reencrypted"])
+        else:
+            # Gravado também aqui: um job cancelado antes do primeiro lote ainda é retomado
+            self.config_repo.set_setting(CHECKPOINT_SETTING_KEY, json.dumps(checkpoint))
+            logger.info("Job cancelado; será retomado do checkpoint.")
+            return checkpoint["reencrypted"]
+
+        self.config_repo.delete_setting(CHECKPOINT_SETTING_KEY)
+        self.security_service.retire_unused_data_keys()
+        logger.info("%d entradas recifradas.", checkpoint["reencrypted"])
+        return checkpoint["reencrypted"]
+
+    def _reencrypt_batch(self, batch: list[PasswordEntry], active_key_id: str,
+                         active_fernet: Fernet) -> list[tuple[bytes, str, int, bytes]]:
+        decrypt_entry = self.security_service.decrypt_entry_password
+        encrypt = self.security_service.cipher_manager.encrypt_password_bytes
+
+        def reencrypt(chunk: list[PasswordEntry]) -> list[tuple[bytes, str, int, bytes]]:
+            rows = []
+            for entry in chunk:
+                plain_password = decrypt_entry(entry)
+                if plain_password is None:
+                    continue  # Chave desconhecida ou token corrompido: a entrada fica como está
+                rows.append((encrypt(active_fernet, plain_password), active_key_id, entry.id,
+                             entry.encrypted_password))
+            return rows
+
+        if self.workers <= 1:
+            return reencrypt(batch)
+        if self._crypto_executor is None:
+            self._crypto_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reencrypt")
+        chunk_size = -(-len(batch) // self.workers)
+        chunks = [batch[start:start + chunk_size] for start in range(0, len(batch), chunk_size)]
+        return [row for rows in self._crypto_executor.map(reencrypt, chunks) for row in rows]
@@ -0,0 +1,150 @@
+# PythonPasswordGenerate/src/database/services/search_index.py
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable
+
+FUZZY_MIN_SCORE = 0.3  # Fração mínima de trigramas em comum para um resultado aproximado
+FUZZY_MAX_POSTINGS = 8  # Quantos trigramas (os mais raros) da busca alimentam o ranking aproximado
+FUZZY_MAX_CANDIDATES = 20000  # Limite de nomes pontuados pela busca aproximada
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class NameIndex:
+    """
+    Índice em memória dos nomes das entradas, para busca enquanto o usuário digita.
+    Mantém uma lista ordenada dos nomes em minúsculas (busca por prefixo com bisect)
+    e um índice invertido de trigramas (busca por substring e busca aproximada).
+    Guarda apenas metadados (nome e data de criação), nunca senhas.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._created_at = {}  # Nome -> data de criação
+        self._sorted = []  # Lista ordenada de (nome em minúsculas, nome)
+        self._postings = {}  # Trigrama -> conjunto de nomes que o contêm
+        self.ready = False  # False até a primeira construção ou após invalidate()
+
+    def __len__(self):
+        return len(self._created_at)
+
+    def build(self, entries: Iterable[tuple[str, str]]):
+        """(Re)constrói o índice a partir de pares (nome, created_at)."""
+        with self._lock:
+            self._created_at = {}
+            self._postings = {}
+            for name, created_at in entries:
+                self._created_at[name] = created_at
+                self._index_trigrams(name)
+            self._sorted = sorted((name.lower(), name) for name in self._created_at)
+            self.ready = True
+
+    def invalidate(self):
+        """Marca o índice como desatualizado; ele será reconstruído no próximo uso."""
+        with self._lock:
+            self.ready = False
+
+    def clear(self):
+        with self._lock:
+            self._created_at = {}
+            self._sorted = []
+            self._postings = {}
+            self.ready = False
+
+    def _index_trigrams(self, name: str):
+        for trigram in _trigrams(name.lower()):
+            self._postings.setdefault(trigram, set()).add(name)
+
+    def add(self, name: str, created_at: str = None):
+        with self._lock:
+            if not self.ready or name in self._created_at:
+                return
+            self._created_at[name] = created_at
+            insort(self._sorted, (name.lower(), name))
+            self._index_trigrams(name)
+
+    def remove(self, name: str):
+        with self._lock:
+            if not self.ready or name not in self._created_at:
+                return
+            del self._created_at[name]
+            position = bisect_left(self._sorted, (name.lower(), name))
+            if position < len(self._sorted) and self._sorted[position][1] == name:
+                del self._sorted[position]
+            for trigram in _trigrams(name.lower()):
+                names = self._postings.get(trigram)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self._postings[trigram]
+
+    def rename(self, old_name: str, new_name: str):
+        with self._lock:
+            created_at = self._created_at.get(old_name)
+            self.remove(old_name)
+            self.add(new_name, created_at)
+
+    def created_at(self, name: str) -> str | None:
+        return self._created_at.get(name)
+
+    def search(self, query: str, limit: int = 50) -> list[str]:
+        """
+        Retorna até 'limit' nomes para a busca, nesta ordem de relevância:
+        prefixo, substring e, se ainda faltarem resultados, busca aproximada
+        por trigramas em comum.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        with self._lock:
+            results = self._prefix_matches(query, limit)
+            if len(query) < 3:
+                return results  # Buscas curtas demais para o índice de trigramas: apenas prefixo
+            if len(results) < limit:
+                seen = set(results)
+                results.extend(self._substring_matches(query, limit - len(results), seen))
+            if len(results) < limit:
+                seen = set(results)
+                results.extend(self._fuzzy_matches(query, limit - len(results), seen))
+            return results[:limit]
+
+    def _prefix_matches(self, query: str, limit: int) -> list[str]:
+        results = []
+        position = bisect_left(self._sorted, (query,))
+        while position < len(self._sorted) and len(results) < limit:
+            lowered, name = self._sorted[position]
+            if not lowered.startswith(query):
+                break
+            results.append(name)
+            position += 1
+        return results
+
+    def _substring_matches(self, query: str, limit: int, seen: set[str]) -> list[str]:
+        postings = sorted((self._postings.get(trigram, set()) for trigram in _trigrams(query)), key=len)
+        common = postings[0]
+        for names in postings[1:]:
+            if not common:
+                return []
+            common = common & names
+        # Trigramas em comum não garantem a substring: confirma todos os candidatos
+        # (a interseção já limita a busca) e devolve os 'limit' primeiros em ordem alfabética
+        matches = (name for name in common if name not in seen and query in name.lower())
+        return heapq.nsmallest(limit, matches, key=lambda name: (name.lower(), name))
+
+    def _fuzzy_matches(self, query: str, limit: int, seen: set[str]) -> list[str]:
+        postings = sorted((self._postings.get(trigram, set()) for trigram in _trigrams(query)), key=len)
+        scores = Counter()
+        used = scored = 0
+        for names in postings[:FUZZY_MAX_POSTINGS]:
+            if scored and scored + len(names) > FUZZY_MAX_CANDIDATES:
+                break  # Trigramas muito comuns pouco ajudam no ranking e custam caro
+            scores.update(names)
+            scored += len(names)
+            used += 1
+        minimum = max(1, int(used * FUZZY_MIN_SCORE))
+        candidates = ((name, count) for name, count in scores.items() if count >= minimum and name not in seen)
+        ranked = heapq.nsmallest(limit, candidates, key=lambda item: (-item[1], item[0].lower()))
+        return [name for name, _ in ranked]
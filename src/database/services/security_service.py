@@ -1,15 +1,42 @@
 # PythonPasswordGenerate/src/database/services/security_service.py
 
 import hashlib
+import json
 import os
-from typing import Tuple, List, Dict, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Tuple, List, Dict, Optional, Iterable, Iterator, Callable
 
 from src.database.repositories.repository import PasswordRepository
 from src.database.repositories.repository_config import ConfigRepository
 from src.database.models.model import PasswordEntry
-from src.config.cipher_manager import CipherManager
+from src.database.models.model_import import ImportReport, ROW_FAILED, ROW_INSERTED
+from src.database.services.search_index import NameIndex
+from src.database.services.password_cache import DecryptedPasswordCache, DEFAULT_CACHE_TTL
+
+from src.config.cipher_manager import CipherManager, invalid_token_error
+from src.config.kdf import KeyDerivationFunction, DEFAULT_TARGET_MS, calibrate_kdf, kdf_from_setting
+from src.config.log_config import get_logger, key_label
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet  # Importado sob demanda (ver src/config/cipher_manager.py)
+
+logger = get_logger("security")
 
 MASTER_SALT_SETTING_KEY = "master_password_salt"
+MASTER_KDF_SETTING_KEY = "master_password_kdf"  # Nome e parâmetros da KDF, ao lado do salt
+DATA_KEYS_SETTING_KEY = "data_keys"  # JSON {id da chave: DEK embrulhada pela KEK}
+ACTIVE_DATA_KEY_SETTING_KEY = "active_data_key"  # Id da DEK usada para cifrar novas senhas
+
+def normalize_entry_name(name) -> str:
+    """
+    Nome de uma entrada como é gravado, sem espaços nas pontas: o mesmo em todos os
+    caminhos de escrita (entrada única, lote, assíncrono). Levanta ValueError se vazio.
+    """
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("O nome da senha não pode ser vazio.")
+    return name.strip()
 
 class SecurityService:
     """
@@ -18,130 +45,671 @@ class SecurityService:
     """
 
     def __init__(self, password_repository: PasswordRepository, config_repository: ConfigRepository,
-                 cipher_manager: CipherManager = None):
+                 cipher_manager: CipherManager = None, kdf_target_ms: float = DEFAULT_TARGET_MS,
+                 build_index_on_login: bool = True, password_cache_size: int = 0,
+                 password_cache_ttl: float = DEFAULT_CACHE_TTL):
         self.repo = password_repository
         self.config_repo = config_repository
         self.cipher_manager = cipher_manager if cipher_manager else CipherManager()
-        self._current_fernet_instance = None  # Armazena a instância Fernet após login
-        print("DEBUG SecurityService: Instância de SecurityService criada.")
+        self.kdf_target_ms = kdf_target_ms  # Tempo de desbloqueio alvo para novos cofres
+        self._current_fernet_instance = None  # Instância Fernet da DEK ativa, após o login
+        self._data_fernets = {}  # Id da chave -> Fernet de cada DEK do cofre, após o login
+        self._active_key_id = None  # Id da DEK ativa, gravado em cada entrada cifrada
+        self._kdf_executor = None  # Executor criado sob demanda para a derivação de chave
+        self._decrypt_executor = None  # Pool criado sob demanda para a descriptografia em lote
+        self.decrypt_workers = os.cpu_count() or 4
+        self.name_index = NameIndex()  # Índice dos nomes para a busca, construído no login
+        self.build_index_on_login = build_index_on_login  # False: só na primeira busca (ex.: linha de comando)
+        self._index_fingerprint = None  # Estado do banco quando a sessão foi bloqueada com o índice pronto (ver lock)
+        # Cache opcional das senhas descriptografadas (desligado com password_cache_size=0)
+        self.password_cache = DecryptedPasswordCache(password_cache_size, password_cache_ttl) \
+            if password_cache_size else None
+        logger.debug("Instância de SecurityService criada.")
 
     def is_master_password_set(self) -> bool:
         """
         Verifica se a senha mestra já foi configurada (se o salt existe no DB de configurações).
+        Um cofre antigo sem nenhuma entrada conta como não configurado: não há como conferir
+        a senha mestra dele (ver _upgrade_legacy_vault), e ele é criado de novo no registro.
         """
-        is_set = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY) is not None
-        print(f"DEBUG SecurityService: is_master_password_set() retornou: {is_set}")
+        is_set = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY) is not None \
+            and not self._is_empty_legacy_vault()
+        logger.debug("is_master_password_set() retornou: %s", is_set)
         return is_set
 
-    def register_master_password(self, master_password: str) -> bool:
-        print("DEBUG SecurityService: Tentando registrar senha mestra.")
+    def _is_empty_legacy_vault(self) -> bool:
+        """Cofre anterior à criptografia de envelope (sem DEKs embrulhadas) e sem entradas."""
+        return not self._load_wrapped_data_keys() and not self.repo.count_entries_by_key()
+
+    def _new_master_kdf(self, kdf: KeyDerivationFunction = None) -> KeyDerivationFunction:
+        """Retorna a KDF de um novo cofre (ou nova senha mestra), calibrada para esta máquina quando não informada."""
+        kdf = kdf if kdf else calibrate_kdf(target_ms=self.kdf_target_ms)
+        logger.info("KDF escolhida para o cofre: %r.", kdf)
+        return kdf
+
+    def _create_vault_keys(self, master_password: str, kdf: KeyDerivationFunction = None) -> tuple[str, str] | None:
+        """
+        Cria as chaves de um novo cofre: deriva a KEK da senha mestra, gera uma chave de
+        dados (DEK) aleatória e grava salt, KDF e a DEK embrulhada em uma única transação.
+        Retorna (id da DEK, DEK), ou None se a senha mestra já existir ou a gravação falhar.
+        """
         if self.is_master_password_set():
-            print("DEBUG SecurityService: Senha mestra já configurada, não pode registrar novamente.")
-            return False
+            logger.warning("Senha mestra já configurada, não pode registrar novamente.")
+            return None
 
-        master_salt_hex, _ = self.cipher_manager.generate_master_key_info(master_password)
+        kdf = self._new_master_kdf(kdf)
+        master_salt_hex, kek = self.cipher_manager.generate_master_key_info(master_password, kdf)
+        key_encryption_fernet = self.cipher_manager.get_fernet_from_key(kek)
+        data_key_id, data_key = os.urandom(8).hex(), self.cipher_manager.generate_data_key()
 
-        if self.config_repo.set_setting(MASTER_SALT_SETTING_KEY, master_salt_hex):
-            print(f"DEBUG SecurityService: Salt da senha mestra '{master_salt_hex}' salvo no DB de configurações.")
-            return True
-        else:
-            print("DEBUG SecurityService: Falha ao salvar salt da senha mestra no DB de configurações.")
+        if not self.config_repo.set_settings({
+            MASTER_SALT_SETTING_KEY: master_salt_hex,
+            MASTER_KDF_SETTING_KEY: kdf.to_setting(),
+            DATA_KEYS_SETTING_KEY: json.dumps(
+                {data_key_id: self.cipher_manager.wrap_data_key(key_encryption_fernet, data_key)}),
+            ACTIVE_DATA_KEY_SETTING_KEY: data_key_id,
+        }):
+            logger.error("Falha ao salvar as chaves do cofre no DB de configurações.")
+            return None
+        logger.info("Senha mestra e chave de dados registradas no DB de configurações.")
+        return data_key_id, data_key
+
+    def register_master_password(self, master_password: str, kdf: KeyDerivationFunction = None) -> bool:
+        logger.debug("Tentando registrar senha mestra.")
+        return self._create_vault_keys(master_password, kdf) is not None
+
+    def register_and_login(self, master_password: str, kdf: KeyDerivationFunction = None) -> bool:
+        """
+        Registra a senha mestra e já abre a sessão com a chave de dados recém-criada.
+        Faz uma única derivação em vez de duas.
+        """
+        logger.debug("Tentando registrar senha mestra e abrir a sessão.")
+        created = self._create_vault_keys(master_password, kdf)
+        if not created:
+            self._clear_session_keys()
             return False
 
-    def login_with_master_password(self, master_password: str) -> bool:
-        print("DEBUG SecurityService: Tentando login com senha mestra.")
-        stored_master_salt_hex = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
-        print(f"DEBUG SecurityService: Salt da senha mestra recuperado do DB: {stored_master_salt_hex}")
+        data_key_id, data_key = created
+        self._open_session({data_key_id: self.cipher_manager.get_fernet_from_key(data_key)}, data_key_id)
+        logger.info("Senha mestra registrada e sessão aberta com sucesso.")
+        return True
 
+    def _derive_key_encryption_key(self, master_password: str) -> str | None:
+        """Deriva a KEK (chave Fernet) da senha mestra, com o salt e a KDF registrados no cofre."""
+        stored_master_salt_hex = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
         if not stored_master_salt_hex:
-            print("DEBUG SecurityService: Salt da senha mestra NÃO encontrado no DB. Login falhou.")
-            self._current_fernet_instance = None
-            return False
+            logger.warning("Salt da senha mestra não encontrado no DB.")
+            return None
+        # Cofres antigos não têm KDF registrada e continuam com o PBKDF2 original
+        kdf = kdf_from_setting(self.config_repo.get_setting(MASTER_KDF_SETTING_KEY))
+        return self.cipher_manager.derive_fernet_key(master_password, stored_master_salt_hex, kdf)
+
+    def _load_wrapped_data_keys(self) -> dict[str, str]:
+        """Retorna as DEKs embrulhadas do cofre ({id da chave: token}); vazio em cofres antigos."""
+        stored = self.config_repo.get_setting(DATA_KEYS_SETTING_KEY)
+        return json.loads(stored) if stored else {}
+
+    def _unwrap_data_keys(self, master_password: str) -> tuple["Fernet", dict[str, str]] | None:
+        """
+        Desembrulha todas as DEKs do cofre com a KEK derivada da senha mestra.
+        Retorna (KEK, {id da chave: DEK}), ou None se a senha mestra estiver errada.
+        Cofres anteriores à criptografia de envelope são convertidos aqui (ver _upgrade_legacy_vault).
+        """
+        kek = self._derive_key_encryption_key(master_password)
+        if not kek:
+            return None
+        key_encryption_fernet = self.cipher_manager.get_fernet_from_key(kek)
+        wrapped_data_keys = self._load_wrapped_data_keys()
+        if not wrapped_data_keys:
+            data_keys = self._upgrade_legacy_vault(kek)
+            return (key_encryption_fernet, data_keys) if data_keys else None
+        try:
+            return key_encryption_fernet, {key_id: self.cipher_manager.unwrap_data_key(key_encryption_fernet, wrapped)
+                                           for key_id, wrapped in wrapped_data_keys.items()}
+        except invalid_token_error():
+            logger.debug("DEK não pôde ser desembrulhada: senha mestra incorreta.")
+            return None
+
+    def _upgrade_legacy_vault(self, legacy_key: str) -> dict[str, str] | None:
+        """
+        Converte um cofre antigo, cujas entradas foram cifradas diretamente com a chave
+        derivada da senha mestra: essa chave passa a ser a DEK do cofre (identificada pelo
+        salt, como nas épocas já gravadas) e é embrulhada por ela mesma, sem recifrar nada.
+        Como esses cofres não guardam um verificador, a senha é conferida com uma entrada;
+        sem nenhuma, a conversão é recusada, pois gravaria a DEK sob qualquer senha digitada.
+        """
+        legacy_key_id = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
+        legacy_fernet = self.cipher_manager.get_fernet_from_key(legacy_key)
+        sample = self.repo.get_sample_entry(legacy_key_id)
+        if sample is None:
+            logger.warning("Cofre antigo sem entradas: a senha mestra não pode ser conferida.")
+            return None
+        if self.cipher_manager.decrypt_password_bytes(legacy_fernet, sample.encrypted_password) is None:
+            logger.debug("Entrada de teste não pôde ser descriptografada: senha mestra incorreta.")
+            return None
 
+        wrapped = self.cipher_manager.wrap_data_key(legacy_fernet, legacy_key)
+        if not self.config_repo.set_settings({DATA_KEYS_SETTING_KEY: json.dumps({legacy_key_id: wrapped}),
+                                              ACTIVE_DATA_KEY_SETTING_KEY: legacy_key_id}):
+            logger.error("Falha ao converter o cofre para chaves de dados embrulhadas.")
+            return None
+        logger.info("Cofre antigo convertido para criptografia de envelope.")
+        return {legacy_key_id: legacy_key}
+
+    def _open_session(self, data_fernets: dict[str, "Fernet"], active_key_id: str):
+        self._data_fernets = data_fernets
+        self._active_key_id = active_key_id
+        self._current_fernet_instance = data_fernets[active_key_id]
+
+    def _clear_session_keys(self):
+        self._current_fernet_instance = None
+        self._data_fernets = {}
+        self._active_key_id = None
+        if self.password_cache is not None:
+            self.password_cache.clear()  # Zera as senhas guardadas junto com as chaves
+
+    def _invalidate_cached_passwords(self, names: Iterable[str] = None):
+        """Remove do cache as senhas dos nomes informados (todas, se 'names' for None)."""
+        if self.password_cache is None:
+            return
+        if names is None:
+            self.password_cache.clear()
+        else:
+            self.password_cache.invalidate(*names)
+
+    def login_with_master_password(self, master_password: str) -> bool:
+        logger.debug("Tentando login com senha mestra.")
         try:
-            fernet_instance = self.cipher_manager.get_fernet_instance(master_password, stored_master_salt_hex)
-            test_token = fernet_instance.encrypt(b"test_string_for_fernet_key_validation")
-            fernet_instance.decrypt(test_token)
+            unwrapped = self._unwrap_data_keys(master_password)
+            if unwrapped is None:
+                logger.warning("Login falhou: senha mestra incorreta.")
+                self._clear_session_keys()
+                return False
+            _, data_keys = unwrapped
 
-            self._current_fernet_instance = fernet_instance
-            print("DEBUG SecurityService: Instância Fernet criada e armazenada com sucesso. Login BEM-SUCEDIDO.")
+            active_key_id = self.config_repo.get_setting(ACTIVE_DATA_KEY_SETTING_KEY)
+            self._open_session({key_id: self.cipher_manager.get_fernet_from_key(data_key)
+                                for key_id, data_key in data_keys.items()}, active_key_id)
+            logger.info("Chaves de dados desembrulhadas. Login bem-sucedido.")
+            self._revalidate_warm_index()
+            if self.build_index_on_login:
+                self._ensure_name_index()  # Ainda fora da thread da interface quando chamado via _async
             return True
-        except Exception as e:
-            print(f"DEBUG SecurityService: Login FAILED (Exceção: {e}). _current_fernet_instance definido como None.")
-            self._current_fernet_instance = None
+        except Exception:
+            logger.exception("Login falhou com uma exceção; sessão descartada.")
+            self._clear_session_keys()
             return False
 
-    def save_password_entry(self, name: str, plain_password: str) -> bool:
-        print(
-            f"DEBUG SecurityService: save_password_entry chamado. _current_fernet_instance é {'válido' if self._current_fernet_instance else 'NULO'}.")
-        if not self._current_fernet_instance:
-            print("Erro: Faça login com a senha mestra primeiro para salvar senhas.")
+    def change_master_password(self, current_master_password: str, new_master_password: str,
+                               kdf: KeyDerivationFunction = None) -> bool:
+        """
+        Troca a senha mestra reembrulhando as DEKs com uma KEK derivada da nova senha
+        (novo salt e KDF recalibrada). As entradas não são recifradas: o custo é o de
+        duas derivações, independente do tamanho do cofre.
+        Retorna False se a senha atual estiver errada ou a gravação falhar.
+        """
+        unwrapped = self._unwrap_data_keys(current_master_password)
+        if unwrapped is None:
+            return False
+        _, data_keys = unwrapped
+
+        kdf = self._new_master_kdf(kdf)
+        master_salt_hex, kek = self.cipher_manager.generate_master_key_info(new_master_password, kdf)
+        key_encryption_fernet = self.cipher_manager.get_fernet_from_key(kek)
+        wrapped_data_keys = {key_id: self.cipher_manager.wrap_data_key(key_encryption_fernet, data_key)
+                             for key_id, data_key in data_keys.items()}
+        # Salt, KDF e DEKs embrulhadas mudam juntos: nunca fica gravada uma combinação inválida
+        if not self.config_repo.set_settings({
+            MASTER_SALT_SETTING_KEY: master_salt_hex,
+            MASTER_KDF_SETTING_KEY: kdf.to_setting(),
+            DATA_KEYS_SETTING_KEY: json.dumps(wrapped_data_keys),
+        }):
+            logger.error("Falha ao gravar as chaves reembrulhadas.")
             return False
+        logger.info("Senha mestra alterada com sucesso.")
+        return True
+
+    def rotate_data_key(self, master_password: str) -> str | None:
+        """
+        Gera uma nova DEK e a torna a chave ativa: novas senhas passam a ser cifradas
+        com ela, e as existentes continuam legíveis pelas DEKs anteriores até que
+        o ReencryptionService as recifre. Retorna o id da nova chave, ou None em caso de falha.
+        """
+        unwrapped = self._unwrap_data_keys(master_password)
+        if unwrapped is None:
+            return None
+        key_encryption_fernet, _ = unwrapped
+
+        data_key_id, data_key = os.urandom(8).hex(), self.cipher_manager.generate_data_key()
+        wrapped_data_keys = self._load_wrapped_data_keys()
+        wrapped_data_keys[data_key_id] = self.cipher_manager.wrap_data_key(key_encryption_fernet, data_key)
+        if not self.config_repo.set_settings({DATA_KEYS_SETTING_KEY: json.dumps(wrapped_data_keys),
+                                              ACTIVE_DATA_KEY_SETTING_KEY: data_key_id}):
+            logger.error("Falha ao gravar a nova chave de dados.")
+            return None
+
+        if self._current_fernet_instance:
+            data_fernets = dict(self._data_fernets)
+            data_fernets[data_key_id] = self.cipher_manager.get_fernet_from_key(data_key)
+            self._open_session(data_fernets, data_key_id)
+        logger.info("Nova chave de dados %s ativada.", key_label(data_key_id))
+        return data_key_id
+
+    def active_data_key(self) -> tuple[str, "Fernet"] | None:
+        """Retorna (id, Fernet) da DEK ativa da sessão, ou None sem sessão aberta."""
+        if not self._current_fernet_instance:
+            return None
+        return self._active_key_id, self._current_fernet_instance
+
+    def retire_unused_data_keys(self):
+        """Remove do cofre as DEKs embrulhadas que não são a ativa e não cifram nenhuma entrada."""
+        if self._active_key_id is None:
+            return  # Sessão já bloqueada: sem a DEK ativa, todas seriam removidas
+        in_use = self.repo.count_entries_by_key()
+        wrapped_data_keys = self._load_wrapped_data_keys()
+        remaining = {key_id: wrapped for key_id, wrapped in wrapped_data_keys.items()
+                     if key_id == self._active_key_id or key_id in in_use}
+        if len(remaining) < len(wrapped_data_keys) and \
+                self.config_repo.set_settings({DATA_KEYS_SETTING_KEY: json.dumps(remaining)}):
+            self._data_fernets = {key_id: fernet for key_id, fernet in self._data_fernets.items()
+                                  if key_id in remaining}
+
+    def decrypt_entry_password(self, entry: PasswordEntry) -> str | None:
+        """Descriptografa a senha de uma entrada com a DEK indicada por ela."""
+        fernet_instance = self._data_fernets.get(entry.key_id)
+        if not fernet_instance:
+            logger.warning("Erro de descriptografia: chave de dados %s desconhecida.", key_label(entry.key_id))
+            return None
+        return self.cipher_manager.decrypt_password_bytes(fernet_instance, entry.encrypted_password)
+
+    def _get_kdf_executor(self) -> ThreadPoolExecutor:
+        """
+        Retorna o executor usado para a derivação de chave fora da thread da interface.
+        Um único worker garante que duas derivações nunca concorram entre si.
+        """
+        if self._kdf_executor is None:
+            self._kdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kdf")
+        return self._kdf_executor
+
+    def register_master_password_async(self, master_password: str) -> Future:
+        """
+        Executa register_master_password em segundo plano.
+        Retorna um Future cujo resultado é o bool de register_master_password.
+        """
+        return self._get_kdf_executor().submit(self.register_master_password, master_password)
+
+    def register_and_login_async(self, master_password: str) -> Future:
+        """
+        Executa register_and_login em segundo plano.
+        Retorna um Future cujo resultado é o bool de register_and_login.
+        """
+        return self._get_kdf_executor().submit(self.register_and_login, master_password)
+
+    def login_with_master_password_async(self, master_password: str) -> Future:
+        """
+        Executa login_with_master_password em segundo plano.
+        Retorna um Future cujo resultado é o bool de login_with_master_password.
+        """
+        return self._get_kdf_executor().submit(self.login_with_master_password, master_password)
+
+    def change_master_password_async(self, current_master_password: str, new_master_password: str) -> Future:
+        """
+        Executa change_master_password em segundo plano.
+        Retorna um Future cujo resultado é o bool de change_master_password.
+        """
+        return self._get_kdf_executor().submit(self.change_master_password, current_master_password,
+                                               new_master_password)
+
+    def _close_connections(self, all_threads: bool = False):
+        """
+        Fecha a conexão persistente da thread atual com o banco; as das outras threads
+        (recifragem, importação, escritor do AsyncSecurityService) são fechadas por elas
+        mesmas no próximo uso, nunca no meio de uma transação. Com all_threads=True
+        (shutdown, sem mais trabalhos em andamento), fecha todas. Elas são reabertas sob demanda.
+        """
+        for manager in (self.repo.connection_manager, self.config_repo.connection_manager):
+            if all_threads:
+                manager.close_all()
+            else:
+                manager.release_connections()
+
+    def logout(self):
+        """Encerra a sessão: descarta as chaves de dados e as senhas em cache e fecha as conexões com o banco."""
+        self._clear_session_keys()
+        self.config_repo.clear_cache()
+        self.name_index.clear()
+        self._index_fingerprint = None
+        self._close_connections()
+        logger.info("Sessão encerrada.")
+
+    def lock(self):
+        """
+        Bloqueia a sessão: como logout, descarta as chaves de dados e as senhas em cache e
+        fecha as conexões, mas mantém o índice de nomes (apenas metadados, nunca senhas).
+        O próximo desbloqueio reaproveita o índice se o banco não mudou nesse meio-tempo,
+        pagando apenas a derivação da senha mestra.
+        """
+        self._index_fingerprint = self.repo.get_change_fingerprint() if self.name_index.ready else None
+        self._clear_session_keys()
+        self.config_repo.clear_cache()
+        self._close_connections()
+        logger.info("Sessão bloqueada.")
 
-        if not isinstance(name, str) or not name.strip():
-            raise ValueError("O nome da senha não pode ser vazio.")
+    def _revalidate_warm_index(self):
+        """Após o desbloqueio, descarta o índice mantido por lock se outro processo alterou o banco."""
+        if self._index_fingerprint is None:
+            return
+        if self.repo.get_change_fingerprint() != self._index_fingerprint:
+            logger.info("Banco alterado durante o bloqueio; o índice de busca será refeito.")
+            self.name_index.invalidate()
+        self._index_fingerprint = None
 
-        encrypted_pwd = self.cipher_manager.encrypt_password(self._current_fernet_instance, plain_password)
-        master_salt_for_entry = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
+    def shutdown(self):
+        """Encerra o executor de derivação de chave e fecha as conexões com o banco."""
+        if self._kdf_executor is not None:
+            self._kdf_executor.shutdown(wait=False, cancel_futures=True)
+            self._kdf_executor = None
+        if self._decrypt_executor is not None:
+            self._decrypt_executor.shutdown(wait=False, cancel_futures=True)
+            self._decrypt_executor = None
+        self._clear_session_keys()
+        self._close_connections(all_threads=True)
 
-        if not master_salt_for_entry:
-            print("Erro interno: Salt da senha mestra não encontrado para salvar a entrada.")
+    def save_password_entry(self, name: str, plain_password: str, overwrite: bool = False) -> bool:
+        """
+        Cifra e salva uma entrada. Com overwrite=True, substitui a senha de uma entrada
+        de mesmo nome (upsert); caso contrário, um nome repetido faz o salvamento falhar.
+        """
+        if not self._current_fernet_instance:
+            logger.warning("Faça login com a senha mestra primeiro para salvar senhas.")
             return False
 
-        return self.repo.add(name, encrypted_pwd, master_salt_for_entry)
+        name = normalize_entry_name(name)
+        encrypted_pwd = self.cipher_manager.encrypt_password_bytes(self._current_fernet_instance, plain_password)
+
+        save = self.repo.upsert if overwrite else self.repo.add
+        if not save(name, encrypted_pwd, self._active_key_id):
+            return False
+        if overwrite:
+            self._invalidate_cached_passwords([name])
+        self.name_index.add(name, self.repo.get_current_timestamp())
+        return True
+
+    def save_password_entries_bulk(self, entries: Iterable[tuple[str, str]], chunk_size: int = 500,
+                                   on_progress: Callable[[ImportReport], None] = None,
+                                   keep_rows: bool = True) -> ImportReport | None:
+        """
+        Salva muitas entradas (name, plain_password) em transações por bloco
+        de 'chunk_size' (um bloco que falha não desfaz os anteriores).
+        As entradas são lidas do iterável em blocos, cifradas com a instância Fernet
+        da sessão e gravadas com executemany, sem manter toda a entrada em memória.
+        'on_progress' é chamado com o relatório parcial a cada bloco gravado; com
+        keep_rows=False o relatório guarda apenas os contadores.
+        Linhas malformadas (sem exatamente nome e senha, ou com valores que não são texto)
+        são registradas como ROW_FAILED, sem interromper a importação.
+        Retorna um ImportReport com o status de cada linha, ou None sem sessão aberta.
+        """
+        if not self._current_fernet_instance:
+            logger.warning("Faça login com a senha mestra primeiro para salvar senhas.")
+            return None
+
+        active_fernet, active_key_id = self._current_fernet_instance, self._active_key_id
+        report = ImportReport(keep_rows=keep_rows)
+        pending_indexes = deque()  # Índices das linhas entregues ao repositório, na mesma ordem
+
+        def encrypted_rows() -> Iterator[tuple[str, bytes, str]]:
+            for index, name, plain_password in self._valid_rows(entries, report):
+                encrypted_pwd = self.cipher_manager.encrypt_password_bytes(active_fernet, plain_password)
+                pending_indexes.append(index)
+                yield name, encrypted_pwd, active_key_id
+
+        last_progress = 0
+        created_at = self.repo.get_current_timestamp()  # Aproximação para o índice de nomes
+        for name, status, error in self.repo.add_many(encrypted_rows(), chunk_size):
+            report.add(pending_indexes.popleft(), name, status, error)
+            if status == ROW_INSERTED:
+                self.name_index.add(name, created_at)
+            if on_progress and report.processed - last_progress >= chunk_size:
+                last_progress = report.processed
+                on_progress(report)
+        if on_progress:
+            on_progress(report)
+
+        logger.info("Importação em lote concluída: %s.", report)
+        return report
+
+    @staticmethod
+    def _valid_rows(entries: Iterable[tuple[str, str]], report: ImportReport) -> Iterator[tuple[int, str, str]]:
+        """
+        Confere as linhas (name, plain_password) de uma gravação em lote: as malformadas
+        (sem exatamente nome e senha), com nome vazio ou senha vazia ou que não é texto
+        são registradas como ROW_FAILED em 'report'. Gera (índice, nome normalizado, senha)
+        das demais, lendo o iterável sob demanda.
+        """
+        for index, row in enumerate(entries):
+            try:
+                name, plain_password = row
+            except (TypeError, ValueError):
+                report.add(index, None, ROW_FAILED, "Linha malformada: esperado (nome, senha).")
+                continue
+            try:
+                name = normalize_entry_name(name)
+            except ValueError as e:
+                report.add(index, name if isinstance(name, str) else None, ROW_FAILED, str(e))
+                continue
+            if not isinstance(plain_password, str):
+                report.add(index, name, ROW_FAILED, "A senha deve ser um texto.")
+                continue
+            if not plain_password:
+                report.add(index, name, ROW_FAILED, "A senha não pode ser vazia.")
+                continue
+            yield index, name, plain_password
+
+    def save_password_entries_overwrite(self, entries: Iterable[tuple[str, str]]) -> ImportReport | None:
+        """
+        Salva várias entradas (name, plain_password) em uma única transação,
+        substituindo a senha das que já existirem. As linhas são conferidas como em
+        save_password_entries_bulk; as gravadas ficam como ROW_INSERTED e, se a transação
+        falhar, todas como ROW_FAILED. Cache e índice de nomes só mudam para as gravadas.
+        Retorna o ImportReport, ou None sem sessão aberta.
+        """
+        if not self._current_fernet_instance:
+            logger.warning("Faça login com a senha mestra primeiro para salvar senhas.")
+            return None
+
+        active_fernet, active_key_id = self._current_fernet_instance, self._active_key_id
+        report = ImportReport()
+        indexes, rows = [], []
+        for index, name, plain_password in self._valid_rows(entries, report):
+            indexes.append(index)
+            rows.append((name, self.cipher_manager.encrypt_password_bytes(active_fernet, plain_password), active_key_id))
+        if rows and not self.repo.upsert_many(rows):
+            for index, (name, _, _) in zip(indexes, rows):
+                report.add(index, name, ROW_FAILED, "Falha ao gravar no banco de dados.")
+            return report
+
+        written = [name for name, _, _ in rows]
+        self._invalidate_cached_passwords(written)
+        created_at = self.repo.get_current_timestamp()
+        for index, name in zip(indexes, written):
+            report.add(index, name, ROW_INSERTED)
+            self.name_index.add(name, created_at)
+        return report
 
     def retrieve_password_by_name(self, name: str) -> str | None:
-        print(
-            f"DEBUG SecurityService: retrieve_password_by_name chamado. _current_fernet_instance é {'válido' if self._current_fernet_instance else 'NULO'}.")
         if not self._current_fernet_instance:
-            print("Erro: Faça login com a senha mestra primeiro para recuperar senhas.")
+            logger.warning("Faça login com a senha mestra primeiro para recuperar senhas.")
             return None
 
+        if self.password_cache is not None:
+            cached_pwd = self.password_cache.get(name)
+            if cached_pwd is not None:
+                return cached_pwd
+            cache_generation = self.password_cache.generation
+
         entry = self.repo.get_by_name(name)
         if not entry:
-            print(f"DEBUG SecurityService: Entrada para '{name}' NÃO encontrada no repositório.")
+            logger.debug("Entrada não encontrada no repositório.")
             return None
 
-        decrypted_pwd = self.cipher_manager.decrypt_password(self._current_fernet_instance, entry.encrypted_password)
-        print(f"DEBUG SecurityService: Descriptografia de '{name}' resultou em: {decrypted_pwd is not None}.")
+        decrypted_pwd = self.decrypt_entry_password(entry)
+        logger.debug("Descriptografia da entrada bem-sucedida: %s.", decrypted_pwd is not None)
+        if decrypted_pwd is not None and self.password_cache is not None:
+            self.password_cache.put(name, decrypted_pwd, cache_generation)
         return decrypted_pwd
 
+    def _get_decrypt_executor(self) -> ThreadPoolExecutor:
+        """Retorna o pool usado na descriptografia em lote (HMAC e AES liberam o GIL)."""
+        if self._decrypt_executor is None:
+            self._decrypt_executor = ThreadPoolExecutor(max_workers=self.decrypt_workers, thread_name_prefix="decrypt")
+        return self._decrypt_executor
+
+    def decrypt_entries(self, entries: Iterable[PasswordEntry | int],
+                        chunk_size: int = 256) -> Iterator[tuple[PasswordEntry, str | None]]:
+        """
+        Descriptografa muitas entradas (PasswordEntry ou ids) em paralelo.
+        Gera (entrada, senha) na ordem de entrada; ids inexistentes são ignorados e a
+        senha é None quando o token não pode ser descriptografado.
+        A entrada é consumida em blocos e apenas alguns blocos ficam em andamento por vez,
+        de modo que o resultado pode ser consumido como um fluxo.
+        """
+        if not self._current_fernet_instance:
+            logger.warning("Faça login com a senha mestra primeiro para recuperar senhas.")
+            return
+
+        decrypt_entry = self.decrypt_entry_password
+
+        def resolve(chunk: list) -> list[PasswordEntry]:
+            ids = [item for item in chunk if isinstance(item, int)]
+            if not ids:
+                return chunk
+            by_id = {entry.id: entry for entry in self.repo.get_by_ids(ids)}
+            return [by_id.get(item) if isinstance(item, int) else item for item in chunk
+                    if not isinstance(item, int) or item in by_id]
+
+        def decrypt_chunk(chunk: list[PasswordEntry]) -> list[tuple[PasswordEntry, str | None]]:
+            return [(entry, decrypt_entry(entry)) for entry in chunk]
+
+        items = iter(entries)
+        if self.decrypt_workers <= 1:
+            # Sem paralelismo disponível, o pool só adicionaria custo de coordenação
+            while chunk := list(islice(items, chunk_size)):
+                yield from decrypt_chunk(resolve(chunk))
+            return
+
+        executor = self._get_decrypt_executor()
+        pending = deque()
+        window = self.decrypt_workers * 2  # Blocos em andamento ao mesmo tempo
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if chunk:
+                pending.append(executor.submit(decrypt_chunk, resolve(chunk)))
+            if pending and (len(pending) >= window or not chunk):
+                yield from pending.popleft().result()
+            elif not chunk:
+                return
+
     def get_all_password_entries_metadata(self) -> List[PasswordEntry]:
         return self.repo.get_all()
 
+    def get_password_entries_metadata_page(self, after_name: str = None, limit: int = 200) -> List[PasswordEntry]:
+        """Retorna uma página de metadados (sem senha cifrada), em ordem de nome, após 'after_name'."""
+        return self.repo.get_metadata_page(after_name, limit)
+
+    def _ensure_name_index(self):
+        """Constrói o índice de nomes a partir dos metadados, se ainda não estiver pronto."""
+        if not self.name_index.ready:
+            self.name_index.build(self.repo.iter_name_metadata())
+            logger.info("Índice de busca construído com %d nomes.", len(self.name_index))
+
+    def search_password_names(self, query: str, limit: int = 50) -> List[str]:
+        """
+        Busca nomes de entradas enquanto o usuário digita: primeiro os que começam
+        com 'query', depois os que a contêm e, por fim, os parecidos (erros de digitação).
+        """
+        if not self._current_fernet_instance:
+            logger.warning("Faça login com a senha mestra primeiro para buscar senhas.")
+            return []
+        self._ensure_name_index()
+        return self.name_index.search(query, limit)
+
+    def search_password_entries(self, query: str, limit: int = 50) -> List[PasswordEntry]:
+        """Como search_password_names, mas retorna metadados (nome e criação) das entradas."""
+        return [PasswordEntry(name=name, created_at=self.name_index.created_at(name))
+                for name in self.search_password_names(query, limit)]
+
     def update_password_entry(self, entry_id: int, new_plain_password: str = None, new_name: str = None) -> bool:
         if not self._current_fernet_instance:
-            print("Erro: Faça login com a senha mestra primeiro para atualizar senhas.")
+            logger.warning("Faça login com a senha mestra primeiro para atualizar senhas.")
             return False
 
+        new_name = normalize_entry_name(new_name) if new_name is not None else None
         new_encrypted_pwd = None
-        current_master_salt = self.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
+        new_key_id = None  # A chave da entrada só muda junto com a senha cifrada
 
         if new_plain_password:
-            new_encrypted_pwd = self.cipher_manager.encrypt_password(self._current_fernet_instance, new_plain_password)
+            new_encrypted_pwd = self.cipher_manager.encrypt_password_bytes(self._current_fernet_instance, new_plain_password)
+            new_key_id = self._active_key_id
 
-        return self.repo.update(entry_id, new_name=new_name, new_encrypted_password=new_encrypted_pwd,
-                                new_master_key_salt=current_master_salt)
+        success = self.repo.update(entry_id, new_name=new_name, new_encrypted_password=new_encrypted_pwd,
+                                   new_key_id=new_key_id)
+        if success:
+            self._invalidate_cached_passwords()  # Só o id é conhecido aqui: descarta o cache inteiro
+        if success and new_name:
+            self.name_index.invalidate()  # Só o id é conhecido aqui; o índice é refeito no próximo uso
+        return success
 
     def delete_password_entry(self, entry_id: int) -> bool:
         """Deleta uma entrada de senha diretamente pelo seu ID."""
-        return self.repo.delete(entry_id)
+        success = self.repo.delete(entry_id)
+        if success:
+            self._invalidate_cached_passwords()
+            self.name_index.invalidate()
+        return success
 
-    def delete_password_by_name(self, name: str) -> bool:
+    def update_password_by_name(self, name: str, new_plain_password: str = None, new_name: str = None) -> bool:
         """
-        Deleta uma entrada de senha com base no seu nome.
+        Atualiza a senha e/ou o nome de uma entrada identificada pelo nome,
+        com um único UPDATE no repositório.
         """
-        print(f"DEBUG SecurityService: Tentando deletar a senha com o nome: '{name}'")
-        entry_to_delete = self.repo.get_by_name(name)
-
-        if not entry_to_delete:
-            print(f"DEBUG SecurityService: Senha com o nome '{name}' não encontrada. A exclusão falhou.")
+        if not self._current_fernet_instance:
+            logger.warning("Faça login com a senha mestra primeiro para atualizar senhas.")
             return False
 
-        success = self.delete_password_entry(entry_to_delete.id)
+        new_name = normalize_entry_name(new_name) if new_name is not None else None
+        new_encrypted_pwd = None
+        new_key_id = None
+        if new_plain_password:
+            new_encrypted_pwd = self.cipher_manager.encrypt_password_bytes(self._current_fernet_instance, new_plain_password)
+            new_key_id = self._active_key_id
+
+        success = self.repo.update_by_name(name, new_name=new_name, new_encrypted_password=new_encrypted_pwd,
+                                           new_key_id=new_key_id)
+        if success:
+            self._invalidate_cached_passwords([name])
+        if success and new_name:
+            self.name_index.rename(name, new_name)
+        return success
+
+    def delete_password_by_name(self, name: str) -> bool:
+        """
+        Deleta uma entrada de senha com base no seu nome.
+        """
+        success = self.repo.delete_by_name(name)
 
         if success:
-            print(f"DEBUG SecurityService: Senha com ID {entry_to_delete.id} ('{name}') deletada com sucesso.")
+            self._invalidate_cached_passwords([name])
+            self.name_index.remove(name)
+            logger.debug("Entrada deletada pelo nome.")
         else:
-            print(f"DEBUG SecurityService: Falha ao deletar a senha com ID {entry_to_delete.id} no repositório.")
+            logger.debug("Exclusão pelo nome falhou: entrada não encontrada.")
         return success
+
+    def delete_passwords_by_name(self, names: Iterable[str]) -> List[str]:
+        """Deleta várias entradas pelo nome em uma única transação. Retorna os nomes deletados."""
+        deleted = self.repo.delete_many_by_name(names)
+        self._invalidate_cached_passwords(deleted)
+        for name in deleted:
+            self.name_index.remove(name)
+        logger.info("%d senhas deletadas em lote.", len(deleted))
+        return deleted
@@ -1,8 +1,10 @@
 # PasswordGenerate/src/gui/create_login_screen.py
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QHBoxLayout
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QHBoxLayout, QProgressBar
 from PyQt6.QtCore import Qt, pyqtSignal
 
+from src.gui.future_watcher import FutureWatcher
+
 class CreateLoginScreen(QWidget):
     """
     Tela para o usuário criar sua senha mestra.
@@ -13,6 +15,10 @@ class CreateLoginScreen(QWidget):
     def __init__(self, security_service):
         super().__init__()
         self.security_service = security_service # Injeção de dependência do serviço de segurança
+        self._creation_in_progress = False # Impede envios duplicados durante a derivação da chave
+        self._create_watcher = FutureWatcher(self)
+        self._create_watcher.finished.connect(self._on_create_finished)
+        self._create_watcher.failed.connect(self._on_create_failed)
         self.init_ui()
 
     def init_ui(self):
@@ -36,12 +42,19 @@ class CreateLoginScreen(QWidget):
         self.confirm_password_input.setFixedSize(250, 30)
         layout.addWidget(self.confirm_password_input, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0) # Modo indeterminado enquanto a chave é derivada
+        self.progress_bar.setFixedSize(250, 10)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar, alignment=Qt.AlignmentFlag.AlignCenter)
+
         btn_layout = QHBoxLayout()
         btn_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        create_button = QPushButton("Criar Login")
-        create_button.setFixedSize(120, 35)
-        create_button.setStyleSheet("""
+        self.create_button = QPushButton("Criar Login")
+        self.create_button.setFixedSize(120, 35)
+        self.create_button.setStyleSheet("""
             QPushButton {
                 background-color: #4CAF50;
                 color: white;
@@ -52,12 +65,12 @@ class CreateLoginScreen(QWidget):
                 background-color: #45a049;
             }
         """)
-        create_button.clicked.connect(self.create_login)
-        btn_layout.addWidget(create_button)
+        self.create_button.clicked.connect(self.create_login)
+        btn_layout.addWidget(self.create_button)
 
-        back_button = QPushButton("Voltar")
-        back_button.setFixedSize(120, 35)
-        back_button.setStyleSheet("""
+        self.back_button = QPushButton("Voltar")
+        self.back_button.setFixedSize(120, 35)
+        self.back_button.setStyleSheet("""
             QPushButton {
                 background-color: #f44336; /* Vermelho */
                 color: white;
@@ -69,8 +82,8 @@ class CreateLoginScreen(QWidget):
                 background-color: #da190b;
             }
         """)
-        back_button.clicked.connect(self.back_to_welcome.emit)
-        btn_layout.addWidget(back_button)
+        self.back_button.clicked.connect(self.back_to_welcome.emit)
+        btn_layout.addWidget(self.back_button)
 
         layout.addLayout(btn_layout)
         self.setLayout(layout)
@@ -80,7 +93,24 @@ class CreateLoginScreen(QWidget):
         self.password_input.clear()
         self.confirm_password_input.clear()
 
+    def _set_busy(self, busy: bool):
+        """Alterna o estado ocupado da tela enquanto a conta é criada."""
+        self._creation_in_progress = busy
+        self.password_input.setEnabled(not busy)
+        self.confirm_password_input.setEnabled(not busy)
+        self.create_button.setEnabled(not busy)
+        self.back_button.setEnabled(not busy)
+        self.create_button.setText("Criando..." if busy else "Criar Login")
+        self.progress_bar.setVisible(busy)
+        if busy:
+            self.setCursor(Qt.CursorShape.WaitCursor)
+        else:
+            self.unsetCursor()
+
     def create_login(self):
+        if self._creation_in_progress:
+            return # Já existe uma derivação de chave em andamento
+
         password = self.password_input.text()
         confirm_password = self.confirm_password_input.text()
 
@@ -92,17 +122,20 @@ class CreateLoginScreen(QWidget):
             QMessageBox.warning(self, "Erro", "As senhas não coincidem. Tente novamente.")
             return
 
-        # Tenta registrar a senha mestra
-        if self.security_service.register_master_password(password):
-            # Se o registro for bem-sucedido, TENTA FAZER O LOGIN AUTOMATICAMENTE
-            if self.security_service.login_with_master_password(password): # <--- ADICIONE ESTA LINHA
-                QMessageBox.information(self, "Sucesso", "Sua conta foi criada e você está logado!")
-                self.clear_fields()
-                self.login_success.emit() # Emite sinal para navegar para a tela de opções
-            else:
-                # Isso só deve acontecer se houver um erro inesperado no login logo após o registro
-                QMessageBox.critical(self, "Erro Crítico", "Conta criada, mas falha no login automático. Tente fazer login manualmente.")
-                self.clear_fields()
-                self.back_to_welcome.emit() # Volta para a tela de boas-vindas
+        # Registra a senha mestra e abre a sessão com uma única derivação de chave,
+        # executada em segundo plano para não congelar a janela
+        self._set_busy(True)
+        self._create_watcher.watch(self.security_service.register_and_login_async(password))
+
+    def _on_create_finished(self, success: bool):
+        self._set_busy(False)
+        if success:
+            QMessageBox.information(self, "Sucesso", "Sua conta foi criada e você está logado!")
+            self.clear_fields()
+            self.login_success.emit() # Emite sinal para navegar para a tela de opções
         else:
-            QMessageBox.critical(self, "Erro", "Não foi possível criar a conta. A senha mestra pode já estar definida.")
\ No newline at end of file
+            QMessageBox.critical(self, "Erro", "Não foi possível criar a conta. A senha mestra pode já estar definida.")
+
+    def _on_create_failed(self, error: Exception):
+        self._set_busy(False)
+        QMessageBox.critical(self, "Erro", f"Ocorreu um erro inesperado ao criar a conta: {error}")
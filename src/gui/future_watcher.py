@@ -0,0 +1,32 @@
+# PasswordGenerate/src/gui/future_watcher.py
+
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class FutureWatcher(QObject):
+    """
+    Converte a conclusão de um concurrent.futures.Future em sinais Qt.
+    O callback do Future roda na thread do worker; como os sinais são entregues
+    por conexão enfileirada, os slots conectados executam na thread da interface.
+    """
+    finished = pyqtSignal(object) # Sinal emitido com o resultado do Future
+    failed = pyqtSignal(object) # Sinal emitido com a exceção levantada pelo Future
+    progress = pyqtSignal(object) # Sinal emitido com o progresso informado pela tarefa
+
+    def watch(self, future: Future):
+        """Passa a observar o Future informado."""
+        future.add_done_callback(self._on_future_done)
+
+    def report_progress(self, value: object):
+        """Callback de progresso seguro para ser chamado da thread do worker."""
+        self.progress.emit(value)
+
+    def _on_future_done(self, future: Future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.failed.emit(error)
+        else:
+            self.finished.emit(future.result())
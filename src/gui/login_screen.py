@@ -1,8 +1,10 @@
 # PasswordGenerate/src/gui/login_screen.py
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QHBoxLayout
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QHBoxLayout, QProgressBar
 from PyQt6.QtCore import Qt, pyqtSignal
 
+from src.gui.future_watcher import FutureWatcher
+
 class LoginScreen(QWidget):
     """
     Tela para o usuário fazer login com sua senha mestra.
@@ -13,6 +15,10 @@ class LoginScreen(QWidget):
     def __init__(self, security_service):
         super().__init__()
         self.security_service = security_service # Injeção de dependência do serviço de segurança
+        self._login_in_progress = False # Impede envios duplicados durante a derivação da chave
+        self._login_watcher = FutureWatcher(self)
+        self._login_watcher.finished.connect(self._on_login_finished)
+        self._login_watcher.failed.connect(self._on_login_failed)
         self.init_ui()
 
     def init_ui(self):
@@ -30,12 +36,19 @@ class LoginScreen(QWidget):
         self.password_input.setFixedSize(250, 30)
         layout.addWidget(self.password_input, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0) # Modo indeterminado enquanto a chave é derivada
+        self.progress_bar.setFixedSize(250, 10)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar, alignment=Qt.AlignmentFlag.AlignCenter)
+
         btn_layout = QHBoxLayout()
         btn_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        login_button = QPushButton("Entrar")
-        login_button.setFixedSize(120, 35)
-        login_button.setStyleSheet("""
+        self.login_button = QPushButton("Entrar")
+        self.login_button.setFixedSize(120, 35)
+        self.login_button.setStyleSheet("""
             QPushButton {
                 background-color: #008CBA;
                 color: white;
@@ -46,12 +59,12 @@ class LoginScreen(QWidget):
                 background-color: #007bb5;
             }
         """)
-        login_button.clicked.connect(self.perform_login)
-        btn_layout.addWidget(login_button)
+        self.login_button.clicked.connect(self.perform_login)
+        btn_layout.addWidget(self.login_button)
 
-        back_button = QPushButton("Voltar")
-        back_button.setFixedSize(120, 35)
-        back_button.setStyleSheet("""
+        self.back_button = QPushButton("Voltar")
+        self.back_button.setFixedSize(120, 35)
+        self.back_button.setStyleSheet("""
             QPushButton {
                 background-color: #f44336;
                 color: white;
@@ -63,8 +76,8 @@ class LoginScreen(QWidget):
                 background-color: #da190b;
             }
         """)
-        back_button.clicked.connect(self.back_to_welcome.emit)
-        btn_layout.addWidget(back_button)
+        self.back_button.clicked.connect(self.back_to_welcome.emit)
+        btn_layout.addWidget(self.back_button)
 
         layout.addLayout(btn_layout)
         self.setLayout(layout)
@@ -73,18 +86,41 @@ class LoginScreen(QWidget):
         """Limpa o campo de entrada de senha."""
         self.password_input.clear()
 
+    def _set_busy(self, busy: bool):
+        """Alterna o estado ocupado da tela enquanto a senha mestra é verificada."""
+        self._login_in_progress = busy
+        self.password_input.setEnabled(not busy)
+        self.login_button.setEnabled(not busy)
+        self.back_button.setEnabled(not busy)
+        self.login_button.setText("Verificando..." if busy else "Entrar")
+        self.progress_bar.setVisible(busy)
+        if busy:
+            self.setCursor(Qt.CursorShape.WaitCursor)
+        else:
+            self.unsetCursor()
+
     def perform_login(self):
+        if self._login_in_progress:
+            return # Já existe uma derivação de chave em andamento
+
         password = self.password_input.text()
 
         if not password:
             QMessageBox.warning(self, "Erro", "Por favor, digite sua senha mestra.")
             return
 
-        # Tenta fazer login usando o SecurityService
-        # O SecurityService agora gerencia a leitura do salt da senha mestra do DB
-        if self.security_service.login_with_master_password(password):
+        # A derivação da chave roda em segundo plano para não congelar a janela
+        self._set_busy(True)
+        self._login_watcher.watch(self.security_service.login_with_master_password_async(password))
+
+    def _on_login_finished(self, success: bool):
+        self._set_busy(False)
+        if success:
             self.clear_fields()
             self.login_success.emit() # Emite sinal para navegar para a tela de opções
         else:
             QMessageBox.critical(self, "Erro de Login", "Senha mestra incorreta. Tente novamente.")
 
+    def _on_login_failed(self, error: Exception):
+        self._set_busy(False)
+        QMessageBox.critical(self, "Erro de Login", f"Ocorreu um erro inesperado ao fazer login: {error}")
@@ -2,12 +2,18 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox,
-    QInputDialog, QLineEdit, QHBoxLayout, QFormLayout, QTextEdit
+    QInputDialog, QLineEdit, QHBoxLayout, QFormLayout, QTableView,
+    QFileDialog, QProgressDialog, QHeaderView, QAbstractItemView, QComboBox, QApplication, QDialog
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from functools import partial
 
-from src.password_generate.password_generator import password_generator
+from src.database.services.export_service import ExportService
+from src.database.services.import_service import ImportService
+from src.database.services.reencryption_service import ReencryptionService
+from src.gui.future_watcher import FutureWatcher
+from src.gui.password_table_model import PasswordTableModel
+from src.password_generate.generator_engine import PRESET_POLICIES
 
 class OptionsScreen(QWidget):
     """
@@ -15,10 +21,31 @@ class OptionsScreen(QWidget):
     consultar, listar e deletar senhas, priorizando a acessibilidade.
     """
     logout_requested = pyqtSignal()
+    lock_requested = pyqtSignal()
 
     def __init__(self, security_service):
         super().__init__()
         self.security_service = security_service
+        self.import_service = ImportService(security_service)
+        self._import_progress_dialog = None
+        self._import_watcher = FutureWatcher(self)
+        self._import_watcher.progress.connect(self._on_import_progress)
+        self._import_watcher.finished.connect(self._on_import_finished)
+        self._import_watcher.failed.connect(self._on_import_failed)
+        self.export_service = ExportService(security_service)
+        self._export_in_progress = False
+        self._export_watcher = FutureWatcher(self)
+        self._export_watcher.finished.connect(self._on_export_finished)
+        self._export_watcher.failed.connect(self._on_export_failed)
+        self._change_password_in_progress = False
+        self._change_password_watcher = FutureWatcher(self)
+        self._change_password_watcher.finished.connect(self._on_change_password_finished)
+        self._change_password_watcher.failed.connect(self._on_change_password_failed)
+        self.reencryption_service = ReencryptionService(security_service)
+        self._reencryption_watcher = FutureWatcher(self)
+        self._reencryption_watcher.progress.connect(self._on_reencryption_progress)
+        self._reencryption_watcher.finished.connect(self._on_reencryption_finished)
+        self._reencryption_watcher.failed.connect(self._on_reencryption_failed)
         self.init_ui()
 
     def init_ui(self):
@@ -55,6 +82,11 @@ class OptionsScreen(QWidget):
             "Gerar e Salvar Nova Senha": self.show_generated_password,
             "Cadastrar Senha Manualmente": self.show_manual_entry_form,
             "Consultar Senha Existente": self.consult_password,
+            "Ver Todas as Senhas": self.show_all_passwords,
+            "Importar Senhas (CSV/JSON)": self.import_passwords,
+            "Exportar / Fazer Backup": self.export_passwords,
+            "Alterar Senha Mestra": self.change_master_password,
+            "Trocar Chave de Criptografia": self.rotate_data_key,
             "Deletar Senha Salva": self.delete_password
         }
         for text, func in buttons.items():
@@ -65,13 +97,26 @@ class OptionsScreen(QWidget):
             btn.clicked.connect(func)
             options_layout.addWidget(btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        btn_lock = QPushButton("Bloquear Cofre")
+        btn_lock.setFixedSize(280, 40)
+        btn_lock.setStyleSheet(
+            "background-color: #555; color: white; border-radius: 8px; font-size: 14px; margin-top: 30px;")
+        btn_lock.clicked.connect(self.lock_requested.emit)
+        options_layout.addWidget(btn_lock, alignment=Qt.AlignmentFlag.AlignCenter)
+
         btn_logout = QPushButton("Sair / Deslogar")
         btn_logout.setFixedSize(280, 40)
         btn_logout.setStyleSheet(
-            "background-color: #f44336; color: white; border-radius: 8px; font-size: 14px; margin-top: 30px;")
+            "background-color: #f44336; color: white; border-radius: 8px; font-size: 14px;")
         btn_logout.clicked.connect(self.logout_requested.emit)
         options_layout.addWidget(btn_logout, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        # Progresso da recifragem em segundo plano; o cofre continua utilizável enquanto ela roda
+        self.reencryption_status_label = QLabel()
+        self.reencryption_status_label.setStyleSheet("font-size: 12px; color: #555; margin-top: 10px;")
+        self.reencryption_status_label.hide()
+        options_layout.addWidget(self.reencryption_status_label, alignment=Qt.AlignmentFlag.AlignCenter)
+
         # --- 2. Widget de Exibição de Senha Única (Gerada/Consultada) ---
         self.password_display_widget = QWidget()
         display_layout = QVBoxLayout(self.password_display_widget)
@@ -79,11 +124,21 @@ class OptionsScreen(QWidget):
         self.display_title_label = QLabel()
         self.display_title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 5px;")
         display_layout.addWidget(self.display_title_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        # Política de geração (só aparece ao gerar senha); trocar a política gera outra senha
+        self.policy_combo = QComboBox()
+        self.policy_combo.setFixedWidth(420)
+        for policy in PRESET_POLICIES:
+            self.policy_combo.addItem(policy.label, policy)
+        self.policy_combo.currentIndexChanged.connect(self.generate_with_selected_policy)
+        display_layout.addWidget(self.policy_combo, alignment=Qt.AlignmentFlag.AlignCenter)
         self.password_output_field = QLineEdit()
         self.password_output_field.setReadOnly(True)
-        self.password_output_field.setFixedSize(320, 35)
+        self.password_output_field.setFixedSize(420, 35)
         self.password_output_field.setAlignment(Qt.AlignmentFlag.AlignCenter)
         display_layout.addWidget(self.password_output_field, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.entropy_label = QLabel()
+        self.entropy_label.setStyleSheet("font-size: 12px; color: #555;")
+        display_layout.addWidget(self.entropy_label, alignment=Qt.AlignmentFlag.AlignCenter)
         display_buttons_layout = QHBoxLayout()
         self.btn_save_password = QPushButton("Salvar Senha")
         self.btn_save_password.setStyleSheet(
@@ -132,12 +187,33 @@ class OptionsScreen(QWidget):
         all_passwords_title = QLabel("Todas as Senhas Salvas")
         all_passwords_title.setStyleSheet("font-size: 20px; font-weight: bold; margin-bottom: 10px;")
         all_passwords_layout.addWidget(all_passwords_title)
-        self.all_passwords_text_edit = QTextEdit()
-        self.all_passwords_text_edit.setReadOnly(True)
-        self.all_passwords_text_edit.setMinimumSize(450, 300)
-        self.all_passwords_text_edit.setStyleSheet(
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Buscar pelo nome...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setStyleSheet("font-size: 14px; padding: 6px; margin-bottom: 6px;")
+        self.search_input.textChanged.connect(self.filter_passwords)
+        all_passwords_layout.addWidget(self.search_input)
+        self.password_table_model = PasswordTableModel(self.security_service, self)
+        self.all_passwords_table = QTableView()
+        self.all_passwords_table.setModel(self.password_table_model)
+        self.all_passwords_table.setMinimumSize(450, 300)
+        self.all_passwords_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.all_passwords_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.all_passwords_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.all_passwords_table.verticalHeader().hide()
+        # Linhas de altura fixa: a tabela não precisa medir cada linha ao rolar
+        self.all_passwords_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.all_passwords_table.horizontalHeader().setSectionResizeMode(
+            PasswordTableModel.NAME_COLUMN, QHeaderView.ResizeMode.Stretch)
+        self.all_passwords_table.setStyleSheet(
             "font-size: 14px; font-family: 'Courier New'; background-color: #f0f0f0; border: 1px solid #ccc;")
-        all_passwords_layout.addWidget(self.all_passwords_text_edit)
+        self.all_passwords_table.doubleClicked.connect(lambda index: self.toggle_password_reveal(index.row()))
+        all_passwords_layout.addWidget(self.all_passwords_table)
+        btn_reveal = QPushButton("Mostrar / Ocultar Senha")
+        btn_reveal.setStyleSheet(
+            "background-color: #4CAF50; color: white; border-radius: 8px; padding: 8px 15px; margin-top: 10px;")
+        btn_reveal.clicked.connect(self.reveal_selected_password)
+        all_passwords_layout.addWidget(btn_reveal, alignment=Qt.AlignmentFlag.AlignCenter)
         btn_back_from_list = QPushButton("Voltar")
         btn_back_from_list.setStyleSheet(
             "background-color: #008CBA; color: white; border-radius: 8px; padding: 8px 15px; margin-top: 10px;")
@@ -157,13 +233,51 @@ class OptionsScreen(QWidget):
         self.password_output_field.clear()
         self.manual_name_input.clear()
         self.manual_password_input.clear()
-        self.all_passwords_text_edit.clear()
+        self.search_input.clear()
+        self.password_table_model.clear()
         self._switch_view(self.options_widget)
 
+    def has_background_work(self) -> bool:
+        """
+        Indica se há importação, exportação ou troca de senha mestra em andamento: o bloqueio,
+        explícito ou automático, espera que terminem. A recifragem não conta: ela é
+        interrompida no checkpoint (stop_background_work) e retomada após o desbloqueio.
+        """
+        return self._import_progress_dialog is not None or self._export_in_progress \
+            or self._change_password_in_progress
+
+    def stop_background_work(self):
+        """
+        Chamado antes de a sessão ser bloqueada ou encerrada: interrompe a recifragem e
+        espera o lote atual terminar, para que as chaves e as conexões não sejam descartadas
+        no meio dele. Ela continua do checkpoint no próximo desbloqueio.
+        """
+        self.reencryption_service.stop()
+
+    def clear_session_state(self):
+        """
+        Descarta o que a tela guarda da sessão ao bloquear ou sair: senhas exibidas ou
+        reveladas, campos preenchidos e diálogos abertos.
+        """
+        self.reencryption_status_label.hide()
+        for widget in QApplication.topLevelWidgets():
+            if isinstance(widget, QDialog) and widget.isVisible():
+                widget.reject()
+        self.show_main_options()
+
     def show_generated_password(self):
-        """Gera uma senha e a exibe na área de exibição para salvamento."""
-        generated_pwd = password_generator()
+        """Gera uma senha com a política selecionada e a exibe na área de exibição para salvamento."""
         self.display_title_label.setText("Senha Gerada:")
+        self.policy_combo.show()
+        self.entropy_label.show()
+        self.generate_with_selected_policy()
+        self._switch_view(self.password_display_widget)
+
+    def generate_with_selected_policy(self):
+        """Gera uma nova senha com a política escolhida na lista e mostra sua entropia."""
+        policy = self.policy_combo.currentData()
+        generated_pwd = policy.generate()
+        self.entropy_label.setText(f"Entropia: {policy.entropy_bits():.0f} bits")
         self.password_output_field.setText(generated_pwd)
         self.password_output_field.setStyleSheet("font-size: 18px; color: #008CBA; font-weight: bold;")
 
@@ -174,7 +288,34 @@ class OptionsScreen(QWidget):
 
         self.btn_save_password.clicked.connect(partial(self.save_password, generated_pwd))
         self.btn_save_password.show()
-        self._switch_view(self.password_display_widget)
+
+    def show_all_passwords(self):
+        """Mostra a lista de senhas salvas; as páginas são carregadas conforme a rolagem."""
+        self.password_table_model.reload()
+        self._switch_view(self.all_passwords_view_widget)
+        self.search_input.setFocus()
+
+    def filter_passwords(self, text: str):
+        """Busca enquanto o usuário digita; com o campo vazio, volta à lista completa."""
+        if not self.all_passwords_view_widget.isVisible():
+            return
+        if text.strip():
+            self.password_table_model.show_entries(self.security_service.search_password_entries(text))
+        else:
+            self.password_table_model.reload()
+
+    def reveal_selected_password(self):
+        """Revela ou oculta a senha da linha selecionada na lista."""
+        selected_rows = self.all_passwords_table.selectionModel().selectedRows()
+        if not selected_rows:
+            QMessageBox.warning(self, "Aviso", "Selecione uma senha na lista.")
+            return
+        self.toggle_password_reveal(selected_rows[0].row())
+
+    def toggle_password_reveal(self, row: int):
+        if not self.password_table_model.toggle_reveal(row):
+            QMessageBox.warning(self, "Erro",
+                                f"Não foi possível descriptografar a senha de '{self.password_table_model.entry_name(row)}'.")
 
     def consult_password(self):
         """Pede o nome da senha, a busca e exibe o resultado na tela."""
@@ -186,13 +327,23 @@ class OptionsScreen(QWidget):
                 self.password_output_field.setText(retrieved_pwd)
                 self.password_output_field.setStyleSheet("font-size: 18px; color: #4CAF50; font-weight: bold;")
                 self.btn_save_password.hide()
+                self.policy_combo.hide()
+                self.entropy_label.hide()
                 self._switch_view(self.password_display_widget)
             else:
                 QMessageBox.warning(self, "Não Encontrada",
-                                    f"Senha com o nome '{password_name.strip()}' não encontrada.")
+                                    f"Senha com o nome '{password_name.strip()}' não encontrada."
+                                    + self._suggestions_text(password_name))
         elif ok:
             QMessageBox.warning(self, "Aviso", "O nome da senha não pode ser vazio.")
 
+    def _suggestions_text(self, password_name: str) -> str:
+        """Monta a lista de nomes parecidos para as mensagens de senha não encontrada."""
+        suggestions = self.security_service.search_password_names(password_name, limit=5)
+        if not suggestions:
+            return ""
+        return "\n\nVocê quis dizer:\n" + "\n".join(f"• {name}" for name in suggestions)
+
     def save_password(self, password_to_save: str):
         """Pede um nome e salva a senha fornecida (usado pela geração de senha)."""
         password_name, ok = QInputDialog.getText(self, "Nome da Senha", "Digite um nome para esta senha:")
@@ -217,7 +368,8 @@ class OptionsScreen(QWidget):
                     QMessageBox.information(self, "Sucesso", f"A senha para '{password_name.strip()}' foi deletada.")
                 else:
                     QMessageBox.warning(self, "Erro",
-                                        f"A senha com o nome '{password_name.strip()}' não foi encontrada.")
+                                        f"A senha com o nome '{password_name.strip()}' não foi encontrada."
+                                        + self._suggestions_text(password_name))
         elif ok:
             QMessageBox.warning(self, "Aviso", "O nome da senha não pode ser vazio.")
 
@@ -239,3 +391,172 @@ class OptionsScreen(QWidget):
             QMessageBox.critical(self, "Erro ao Salvar",
                                  f"O nome '{name}' já existe ou ocorreu um erro ao salvar a senha.")
 
+    def import_passwords(self):
+        """Importa senhas de um arquivo exportado por outro gerenciador, em segundo plano."""
+        if self._import_progress_dialog is not None:
+            return # Já existe uma importação em andamento
+
+        path, _ = QFileDialog.getOpenFileName(self, "Importar Senhas", "",
+                                              "Exportações de senhas (*.csv *.json *.jsonl)")
+        if not path:
+            return
+
+        self._import_progress_dialog = QProgressDialog("Importando senhas...", None, 0, 0, self)
+        self._import_progress_dialog.setWindowTitle("Importar Senhas")
+        self._import_progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress_dialog.setMinimumDuration(0)
+        self._import_progress_dialog.show()
+        self._import_watcher.watch(
+            self.import_service.import_file_async(path, on_progress=self._import_watcher.report_progress))
+
+    def _close_import_progress(self):
+        if self._import_progress_dialog is not None:
+            self._import_progress_dialog.close()
+            self._import_progress_dialog = None
+
+    def _on_import_progress(self, report):
+        if self._import_progress_dialog is not None:
+            self._import_progress_dialog.setLabelText(f"Importando senhas... {report.processed} processadas")
+
+    def _on_import_finished(self, report):
+        self._close_import_progress()
+        if report is None:
+            QMessageBox.critical(self, "Erro", "Faça login com a senha mestra antes de importar senhas.")
+            return
+        QMessageBox.information(self, "Importação Concluída",
+                                f"{report.inserted} senha(s) importada(s).\n"
+                                f"{report.duplicates} ignorada(s) por nome já existente.\n"
+                                f"{report.failed} com erro.")
+
+    def _on_import_failed(self, error: Exception):
+        self._close_import_progress()
+        QMessageBox.critical(self, "Erro na Importação", f"Não foi possível importar o arquivo: {error}")
+
+    def export_passwords(self):
+        """Exporta o cofre como backup criptografado (completo ou incremental) ou CSV em texto puro."""
+        if self._export_in_progress:
+            return # Já existe uma exportação em andamento
+
+        options = ["Backup criptografado (completo)", "Backup criptografado (incremental)",
+                   "CSV com senhas em texto puro"]
+        choice, ok = QInputDialog.getItem(self, "Exportar Senhas", "Formato da exportação:", options, 0, False)
+        if not ok:
+            return
+
+        if choice == options[2]:
+            confirm_reply = QMessageBox.question(self, "Confirmar Exportação",
+                                                 "O arquivo CSV conterá TODAS as suas senhas sem criptografia.\n\n"
+                                                 "Qualquer pessoa com acesso ao arquivo poderá lê-las. Deseja continuar?",
+                                                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
+            if confirm_reply != QMessageBox.StandardButton.Yes:
+                return
+            path, _ = QFileDialog.getSaveFileName(self, "Exportar CSV", "senhas.csv", "CSV (*.csv)")
+            if not path:
+                return
+            future = self.export_service.export_plaintext_csv_async(path, confirm_plaintext=True)
+        else:
+            path, _ = QFileDialog.getSaveFileName(self, "Salvar Backup", "cofre.backup", "Backup do cofre (*.backup)")
+            if not path:
+                return
+            future = self.export_service.export_encrypted_archive_async(path, incremental=(choice == options[1]))
+
+        self._export_in_progress = True
+        self.setCursor(Qt.CursorShape.BusyCursor)
+        self._export_watcher.watch(future)
+
+    def _on_export_finished(self, count: int):
+        self._export_in_progress = False
+        self.unsetCursor()
+        QMessageBox.information(self, "Exportação Concluída", f"{count} senha(s) exportada(s).")
+
+    def _on_export_failed(self, error: Exception):
+        self._export_in_progress = False
+        self.unsetCursor()
+        QMessageBox.critical(self, "Erro na Exportação", f"Não foi possível exportar as senhas: {error}")
+
+    def change_master_password(self):
+        """Pede a senha mestra atual e a nova, e as troca em segundo plano (sem recifrar as senhas)."""
+        if self._change_password_in_progress:
+            return # Já existe uma troca em andamento
+
+        current_password, ok = QInputDialog.getText(self, "Alterar Senha Mestra", "Senha mestra atual:",
+                                                    QLineEdit.EchoMode.Password)
+        if not ok or not current_password:
+            return
+        new_password, ok = QInputDialog.getText(self, "Alterar Senha Mestra", "Nova senha mestra:",
+                                                QLineEdit.EchoMode.Password)
+        if not ok or not new_password:
+            return
+        confirm_password, ok = QInputDialog.getText(self, "Alterar Senha Mestra", "Confirme a nova senha mestra:",
+                                                    QLineEdit.EchoMode.Password)
+        if not ok:
+            return
+        if new_password != confirm_password:
+            QMessageBox.warning(self, "Aviso", "As novas senhas não coincidem.")
+            return
+
+        self._change_password_in_progress = True
+        self.setCursor(Qt.CursorShape.BusyCursor)
+        self._change_password_watcher.watch(
+            self.security_service.change_master_password_async(current_password, new_password))
+
+    def _on_change_password_finished(self, success: bool):
+        self._change_password_in_progress = False
+        self.unsetCursor()
+        if success:
+            QMessageBox.information(self, "Sucesso", "Senha mestra alterada com sucesso!")
+        else:
+            QMessageBox.critical(self, "Erro", "Senha mestra atual incorreta ou falha ao salvar a nova senha.")
+
+    def _on_change_password_failed(self, error: Exception):
+        self._change_password_in_progress = False
+        self.unsetCursor()
+        QMessageBox.critical(self, "Erro", f"Não foi possível alterar a senha mestra: {error}")
+
+    def rotate_data_key(self):
+        """Gera uma nova chave de dados e recifra todas as senhas com ela, em segundo plano."""
+        if self.reencryption_service.is_running():
+            QMessageBox.information(self, "Aviso", "A troca de chave já está em andamento.")
+            return
+
+        confirm_reply = QMessageBox.question(self, "Trocar Chave de Criptografia",
+                                             "Uma nova chave será gerada e todas as senhas serão recifradas com ela "
+                                             "em segundo plano. Você pode continuar usando o cofre enquanto isso.\n\n"
+                                             "Deseja continuar?",
+                                             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
+        if confirm_reply != QMessageBox.StandardButton.Yes:
+            return
+        master_password, ok = QInputDialog.getText(self, "Trocar Chave de Criptografia", "Senha mestra:",
+                                                   QLineEdit.EchoMode.Password)
+        if not ok or not master_password:
+            return
+
+        self._show_reencryption_status("Gerando nova chave...")
+        self._reencryption_watcher.watch(self.reencryption_service.rotate_and_reencrypt_async(
+            master_password, on_progress=self._reencryption_watcher.report_progress))
+
+    def resume_pending_reencryption(self):
+        """Retoma, após o login, uma recifragem interrompida (aplicação fechada no meio do job)."""
+        if self.reencryption_service.is_running() or not self.reencryption_service.has_pending_job():
+            return
+        self._show_reencryption_status("Retomando a recifragem das senhas...")
+        self._reencryption_watcher.watch(self.reencryption_service.resume_async(
+            on_progress=self._reencryption_watcher.report_progress))
+
+    def _show_reencryption_status(self, text: str):
+        self.reencryption_status_label.setText(text)
+        self.reencryption_status_label.show()
+
+    def _on_reencryption_progress(self, count: int):
+        self._show_reencryption_status(f"Recifrando senhas... {count} concluídas")
+
+    def _on_reencryption_finished(self, count):
+        self.reencryption_status_label.hide()
+        if count is None:
+            QMessageBox.critical(self, "Erro", "Senha mestra incorreta. A chave não foi trocada.")
+        elif not self.reencryption_service.has_pending_job():
+            QMessageBox.information(self, "Troca de Chave Concluída", f"{count} senha(s) recifrada(s) com a nova chave.")
+
+    def _on_reencryption_failed(self, error: Exception):
+        self.reencryption_status_label.hide()
+        QMessageBox.critical(self, "Erro", f"Não foi possível recifrar as senhas: {error}")
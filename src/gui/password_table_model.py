@@ -0,0 +1,146 @@
+# src/gui/password_table_model.py
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+MASKED_PASSWORD = "••••••••"
+
+class PasswordTableModel(QAbstractTableModel):
+    """
+    Modelo de tabela das entradas salvas, carregado sob demanda.
+    Busca páginas de metadados (nome e datas) conforme a lista é rolada, via
+    canFetchMore/fetchMore, e só descriptografa a senha das linhas reveladas.
+    Apenas as MAX_CACHED_PAGES páginas usadas mais recentemente ficam em memória;
+    as demais são descartadas e buscadas de novo (pelo nome que as precede) quando
+    voltam a ser exibidas.
+    """
+    COLUMNS = ("Nome", "Senha", "Criada em")
+    NAME_COLUMN, PASSWORD_COLUMN, CREATED_AT_COLUMN = range(3)
+    PAGE_SIZE = 200
+    MAX_CACHED_PAGES = 10
+
+    def __init__(self, security_service, parent=None):
+        super().__init__(parent)
+        self.security_service = security_service
+        self._pages = OrderedDict()  # Número da página -> metadados, da menos para a mais usada
+        self._page_starts = []  # Nome que precede cada página já descoberta (None na primeira)
+        self._row_count = 0  # Linhas descobertas até agora pelo fetchMore
+        self._last_name = None  # Último nome da última página descoberta
+        self._search_entries = None  # Resultado de uma busca (show_entries), exibido sem paginação
+        self._revealed = {}  # Linha -> senha em texto puro, apenas das linhas reveladas
+        self._exhausted = True  # Nada é carregado até a primeira chamada de reload()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._search_entries) if self._search_entries is not None else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        entry = self._entry(index.row())
+        if entry is None:
+            return None
+        column = index.column()
+        if column == self.NAME_COLUMN:
+            return entry.name
+        if column == self.PASSWORD_COLUMN:
+            return self._revealed.get(index.row(), MASKED_PASSWORD)
+        return entry.created_at
+
+    def _entry(self, row: int):
+        if self._search_entries is not None:
+            return self._search_entries[row]
+        page = self._page(row // self.PAGE_SIZE)
+        offset = row % self.PAGE_SIZE
+        return page[offset] if offset < len(page) else None  # A página pode ter encolhido ao ser relida
+
+    def _page(self, number: int) -> list:
+        """Retorna a página, buscando-a de novo se ela foi descartada."""
+        page = self._pages.get(number)
+        if page is None:
+            page = self.security_service.get_password_entries_metadata_page(self._page_starts[number], self.PAGE_SIZE)
+            self._cache_page(number, page)
+        else:
+            self._pages.move_to_end(number)
+        return page
+
+    def _cache_page(self, number: int, page: list):
+        self._pages[number] = page
+        while len(self._pages) > self.MAX_CACHED_PAGES:
+            evicted, _ = self._pages.popitem(last=False)
+            first_row = evicted * self.PAGE_SIZE
+            for row in range(first_row, first_row + self.PAGE_SIZE):
+                self._revealed.pop(row, None)  # Senhas reveladas saem da memória junto com a página
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        page = self.security_service.get_password_entries_metadata_page(self._last_name, self.PAGE_SIZE)
+        if len(page) < self.PAGE_SIZE:
+            self._exhausted = True
+        if not page:
+            return
+        first_row = self._row_count
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(page) - 1)
+        self._page_starts.append(self._last_name)
+        self._cache_page(len(self._page_starts) - 1, page)
+        self._last_name = page[-1].name
+        self._row_count += len(page)
+        self.endInsertRows()
+
+    def _reset(self, search_entries: list = None, exhausted: bool = True):
+        self.beginResetModel()
+        self._pages = OrderedDict()
+        self._page_starts = []
+        self._row_count = 0
+        self._last_name = None
+        self._search_entries = search_entries
+        self._revealed = {}
+        self._exhausted = exhausted
+        self.endResetModel()
+
+    def reload(self):
+        """Descarta as linhas carregadas e volta a buscar a partir da primeira página."""
+        self._reset(exhausted=False)
+
+    def show_entries(self, entries: list):
+        """Exibe apenas as entradas informadas (resultado de uma busca), sem paginação."""
+        self._reset(search_entries=list(entries))
+
+    def clear(self):
+        """Esvazia o modelo, descartando inclusive as senhas reveladas."""
+        self._reset()
+
+    def entry_name(self, row: int) -> str | None:
+        entry = self._entry(row)
+        return entry.name if entry is not None else None
+
+    def toggle_reveal(self, row: int) -> bool:
+        """
+        Revela (descriptografando) ou volta a ocultar a senha da linha.
+        Retorna False se a senha não pôde ser descriptografada.
+        """
+        if row in self._revealed:
+            del self._revealed[row]
+        else:
+            name = self.entry_name(row)
+            password = self.security_service.retrieve_password_by_name(name) if name is not None else None
+            if password is None:
+                return False
+            self._revealed[row] = password
+        password_index = self.index(row, self.PASSWORD_COLUMN)
+        self.dataChanged.emit(password_index, password_index)
+        return True
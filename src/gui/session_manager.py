@@ -0,0 +1,119 @@
+# src/gui/session_manager.py
+
+import time
+from typing import Callable
+
+from PyQt6.QtCore import QEvent, QObject, QTimer, Qt, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from src.config.log_config import get_logger
+
+logger = get_logger("gui")
+
+IDLE_LOCK_SECONDS = 300  # Sem teclado ou mouse por esse tempo, o cofre é bloqueado
+BACKGROUND_LOCK_SECONDS = 60  # Tempo com a aplicação minimizada ou sem foco até bloquear
+BUSY_RETRY_SECONDS = 5  # Nova tentativa de bloqueio automático enquanto houver trabalho em andamento
+
+# Eventos que contam como atividade do usuário
+ACTIVITY_EVENTS = frozenset({
+    QEvent.Type.KeyPress, QEvent.Type.MouseButtonPress, QEvent.Type.MouseMove,
+    QEvent.Type.Wheel, QEvent.Type.TouchBegin,
+})
+
+class SessionManager(QObject):
+    """
+    Controla a sessão desbloqueada da interface: bloqueio explícito (lock), bloqueio
+    automático por inatividade (sem eventos de teclado/mouse) e com a aplicação em
+    segundo plano, e logout.
+
+    O bloqueio descarta as chaves de dados, as senhas em cache e as conexões com o banco
+    (SecurityService.lock), mantendo o índice de nomes para o próximo desbloqueio.
+    O logout descarta também o índice. A interface reage aos sinais 'locked' e 'logged_out'.
+    """
+    locked = pyqtSignal()
+    logged_out = pyqtSignal()
+
+    def __init__(self, security_service, idle_timeout: float = IDLE_LOCK_SECONDS,
+                 background_timeout: float = BACKGROUND_LOCK_SECONDS, parent: QObject = None):
+        super().__init__(parent)
+        self.security_service = security_service
+        self.idle_timeout = idle_timeout  # 0 desativa o bloqueio por inatividade
+        self.background_timeout = background_timeout  # 0 desativa o bloqueio em segundo plano
+        self.is_busy: Callable[[], bool] = lambda: False  # Trabalhos que adiam o bloqueio automático
+        self.stop_background_work: Callable[[], None] = lambda: None  # Interrompe os trabalhos antes do bloqueio
+        self._last_activity = time.monotonic()
+        # O temporizador não é reiniciado a cada evento: ele confere o último instante de
+        # atividade quando dispara e, se houve atividade, volta a esperar o tempo restante
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._on_idle_timeout)
+        self._background_timer = QTimer(self)
+        self._background_timer.setSingleShot(True)
+        self._background_timer.timeout.connect(self._on_background_timeout)
+        app = QApplication.instance()
+        app.installEventFilter(self)
+        app.applicationStateChanged.connect(self._on_application_state_changed)
+
+    @property
+    def unlocked(self) -> bool:
+        return self.security_service.active_data_key() is not None
+
+    def session_started(self):
+        """Chamado quando a sessão é aberta: inicia a contagem de inatividade."""
+        self._last_activity = time.monotonic()
+        self._background_timer.stop()
+        self._start_idle_timer(self.idle_timeout)
+
+    def lock(self):
+        """Bloqueia a sessão agora; desbloquear exige a senha mestra de novo."""
+        self._stop_timers()
+        self.stop_background_work()  # Antes de descartar as chaves e as conexões
+        self.security_service.lock()
+        self.locked.emit()
+
+    def logout(self):
+        """Encerra a sessão, descartando também os metadados mantidos pelo bloqueio."""
+        self._stop_timers()
+        self.stop_background_work()
+        self.security_service.logout()
+        self.logged_out.emit()
+
+    def _stop_timers(self):
+        self._idle_timer.stop()
+        self._background_timer.stop()
+
+    def _start_idle_timer(self, seconds: float):
+        if self.idle_timeout:
+            self._idle_timer.start(max(1, int(seconds * 1000)))
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in ACTIVITY_EVENTS:
+            self._last_activity = time.monotonic()
+        return False
+
+    def _on_idle_timeout(self):
+        if not self.unlocked:
+            return
+        remaining = self.idle_timeout - (time.monotonic() - self._last_activity)
+        if remaining > 0:
+            self._start_idle_timer(remaining)
+        elif self.is_busy():
+            self._start_idle_timer(BUSY_RETRY_SECONDS)
+        else:
+            logger.info("Cofre bloqueado por inatividade.")
+            self.lock()
+
+    def _on_application_state_changed(self, state: Qt.ApplicationState):
+        if state == Qt.ApplicationState.ApplicationActive:
+            self._background_timer.stop()
+        elif self.background_timeout and self.unlocked and not self._background_timer.isActive():
+            self._background_timer.start(int(self.background_timeout * 1000))
+
+    def _on_background_timeout(self):
+        if not self.unlocked:
+            return
+        if self.is_busy():
+            self._background_timer.start(BUSY_RETRY_SECONDS * 1000)
+        else:
+            logger.info("Cofre bloqueado com a aplicação em segundo plano.")
+            self.lock()
@@ -1,19 +1,16 @@
 # PasswordGenerate/src/password_generate/generate_character.py
 
-from src.password_generate.generate_number import generate_random_number
+import secrets
 
 SPECIAL_CHARACTERS = ('/', ':', '!', '@', '#', '-', '+', '?', '$', '%', '&', '=', '*', '_')
 
 def get_character() -> str:
     """
     Retorna um caractere especial aleatório de uma tupla de constantes.
-    O índice para a seleção é gerado aleatoriamente e mapeado
-    para garantir que todos os caracteres da tupla tenham uma chance.
+    A escolha é feita diretamente sobre a tupla (secrets.choice), para que
+    todos os caracteres tenham a mesma chance, sem o viés do módulo.
 
     Returns:
         str: Um caractere especial aleatório.
     """
-
-    value_index = generate_random_number()
-    map_index = value_index % len(SPECIAL_CHARACTERS)
-    return SPECIAL_CHARACTERS[map_index]
\ No newline at end of file
+    return secrets.choice(SPECIAL_CHARACTERS)
\ No newline at end of file
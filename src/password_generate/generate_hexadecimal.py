@@ -1,14 +1,15 @@
 # PasswordGenerate/src/password_generate/generate_hexadecimal.py
 
-from src.password_generate.generate_number import generate_random_number
+import secrets
 
 def generate_hexadecimal_value() -> str:
     """
     Gera um valor hexadecimal de 2 dígitos a partir de um valor randômico.
-    O valor randômico (0-25) é convertido para sua representação hexadecimal.
+    O valor randômico (0-255, todo o intervalo de 2 dígitos) é convertido
+    para sua representação hexadecimal.
 
     Returns:
-        str: Uma string hexadecimal de 2 dígitos (ex: '0A', '19').
+        str: Uma string hexadecimal de 2 dígitos (ex: '0A', 'F3').
     """
-    decimal_value = generate_random_number()
+    decimal_value = secrets.randbelow(256)
     return f"{decimal_value:02X}"
\ No newline at end of file
@@ -1,10 +1,11 @@
 # PasswordGenerate/src/password_generate/generate_number.py
 
-import random
+import secrets
 
 def generate_random_number() -> int:
     """
-    Função que gera um número randomico de (0) até (25) incluido.
+    Função que gera um número randomico de (0) até (25) incluido,
+    usando o gerador criptográfico do módulo 'secrets'.
     :return:
     """
-    return random.randint(0, 25)
+    return secrets.randbelow(26)
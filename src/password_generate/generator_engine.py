@@ -0,0 +1,195 @@
+# PasswordGenerate/src/password_generate/generator_engine.py
+
+import math
+import os
+import re
+import secrets
+import string
+from itertools import combinations
+
+from src.password_generate.generate_character import SPECIAL_CHARACTERS
+from src.password_generate.wordlist import Wordlist, get_default_wordlist
+
+DEFAULT_LENGTH = 13
+CHUNK_PASSWORDS = 65536  # Senhas geradas por leitura do os.urandom em generate_many
+
+# Classes de caracteres disponíveis para as políticas
+CHARACTER_CLASSES = {
+    "upper": string.ascii_uppercase,
+    "lower": string.ascii_lowercase,
+    "digits": string.digits,
+    "special": "".join(SPECIAL_CHARACTERS),
+}
+DEFAULT_CLASSES = ("upper", "lower", "digits", "special")
+DEFAULT_ALPHABET = "".join(CHARACTER_CLASSES[name] for name in DEFAULT_CLASSES)
+LOOK_ALIKE_CHARACTERS = "Il1|O0oS5Z2B8"  # Facilmente confundidos ao ler ou digitar a senha
+
+class PasswordPolicy:
+    """
+    Regras de uma senha gerada: tamanho, classes de caracteres (ou um alfabeto
+    ASCII explícito), exigência de ao menos um caractere de cada classe e
+    exclusão de caracteres parecidos.
+    Pré-calcula a tabela de tradução usada pelo gerador, que converte cada byte
+    aleatório em um caractere do alfabeto sem viés de módulo: os bytes acima do
+    maior múltiplo do tamanho do alfabeto são descartados (amostragem por rejeição).
+    Senhas sem alguma classe exigida também são descartadas e geradas de novo,
+    de modo que todas as senhas válidas continuam igualmente prováveis.
+    """
+
+    def __init__(self, length: int = DEFAULT_LENGTH, alphabet: str = None, classes=DEFAULT_CLASSES,
+                 require_each_class: bool = True, exclude_look_alikes: bool = False, label: str = None):
+        if alphabet is not None:
+            class_alphabets = [alphabet]  # Alfabeto explícito: uma única classe, sem exigências
+            require_each_class = False
+        else:
+            unknown = [name for name in classes if name not in CHARACTER_CLASSES]
+            if unknown:
+                raise ValueError(f"Classes de caracteres desconhecidas: {', '.join(unknown)}.")
+            class_alphabets = [CHARACTER_CLASSES[name] for name in dict.fromkeys(classes)]
+        if exclude_look_alikes:
+            class_alphabets = ["".join(char for char in chars if char not in LOOK_ALIKE_CHARACTERS)
+                               for chars in class_alphabets]
+        alphabet = "".join(dict.fromkeys("".join(class_alphabets)))  # Remove repetidos, que enviesariam a escolha
+        if length < 1:
+            raise ValueError("O tamanho da senha deve ser de pelo menos 1 caractere.")
+        if not 2 <= len(alphabet) <= 256 or not alphabet.isascii():
+            raise ValueError("O alfabeto deve ter entre 2 e 256 caracteres ASCII distintos.")
+        self.length = length
+        self.alphabet = alphabet
+        self.label = label or f"{length} caracteres"
+        self.required_classes = [frozenset(chars) for chars in class_alphabets if chars] \
+            if require_each_class and len(class_alphabets) > 1 else []
+        if len(self.required_classes) > length:
+            raise ValueError("O tamanho da senha é menor que o número de classes exigidas.")
+        # Um lookahead por classe exigida: validar com uma única chamada em C por senha
+        # (filter(pattern.match, ...)) é bem mais rápido que testar as classes em Python
+        self._required_pattern = re.compile("".join(
+            f"(?=[^{re.escape(chars)}]*[{re.escape(chars)}])"
+            for chars in ("".join(sorted(required)) for required in self.required_classes)))
+
+        size = len(alphabet)
+        self._accept_limit = 256 - 256 % size  # Bytes a partir daqui são rejeitados
+        encoded = alphabet.encode("ascii")
+        self._table = bytes(encoded[value % size] for value in range(256))
+        self._rejected = bytes(range(self._accept_limit, 256))
+
+    def __repr__(self):
+        return f"PasswordPolicy(length={self.length}, alphabet={self.alphabet!r})"
+
+    def entropy_bits(self) -> float:
+        """
+        Entropia, em bits, de uma senha gerada com esta política: log2 do número
+        de senhas válidas. Com classes exigidas, as senhas sem alguma delas são
+        descontadas por inclusão-exclusão.
+        """
+        size = len(self.alphabet)
+        valid = 0
+        for excluded_count in range(len(self.required_classes) + 1):
+            for excluded in combinations(self.required_classes, excluded_count):
+                remaining = size - len(frozenset().union(*excluded))
+                valid += (-1) ** excluded_count * remaining ** self.length
+        return math.log2(valid)
+
+    def _random_characters(self, count: int) -> bytes:
+        """Retorna exatamente 'count' caracteres do alfabeto, lidos em bloco do os.urandom."""
+        result = b""
+        while len(result) < count:
+            missing = count - len(result)
+            # Lê o esperado para a taxa de aceitação mais uma folga, evitando novas leituras
+            request = missing * 256 // self._accept_limit + 64
+            result += os.urandom(request).translate(self._table, self._rejected)
+        return result[:count]
+
+    def generate(self) -> str:
+        while True:
+            password = self._random_characters(self.length).decode("ascii")
+            if self._required_pattern.match(password):
+                return password
+
+    def generate_many(self, n: int) -> list[str]:
+        length = self.length
+        passwords = []
+        while len(passwords) < n:
+            count = min(CHUNK_PASSWORDS, n - len(passwords))
+            text = self._random_characters(count * length).decode("ascii")
+            chunk = [text[offset:offset + length] for offset in range(0, count * length, length)]
+            passwords.extend(filter(self._required_pattern.match, chunk) if self.required_classes else chunk)
+        return passwords
+
+class PassphrasePolicy:
+    """
+    Frase-senha no estilo diceware: palavras sorteadas de uma lista (por padrão,
+    a lista em português distribuída com a aplicação) unidas por um separador.
+    A lista só é carregada quando a primeira frase é gerada.
+    """
+
+    def __init__(self, word_count: int = 6, separator: str = "-", wordlist: Wordlist = None, label: str = None):
+        if word_count < 1:
+            raise ValueError("A frase-senha deve ter pelo menos 1 palavra.")
+        self.word_count = word_count
+        self.separator = separator
+        self._wordlist = wordlist
+        self.label = label or f"Frase-senha ({word_count} palavras)"
+
+    def __repr__(self):
+        return f"PassphrasePolicy(word_count={self.word_count}, separator={self.separator!r})"
+
+    @property
+    def wordlist(self) -> Wordlist:
+        if self._wordlist is None:
+            self._wordlist = get_default_wordlist()
+        return self._wordlist
+
+    def entropy_bits(self) -> float:
+        """Entropia, em bits, de uma frase gerada: palavras × log2(tamanho da lista)."""
+        return self.word_count * math.log2(len(self.wordlist))
+
+    def generate(self) -> str:
+        wordlist = self.wordlist
+        size = len(wordlist)
+        if size < 2:
+            raise ValueError("A lista de palavras precisa de pelo menos 2 palavras.")
+        return self.separator.join(wordlist[secrets.randbelow(size)] for _ in range(self.word_count))
+
+    def generate_many(self, n: int) -> list[str]:
+        return [self.generate() for _ in range(n)]
+
+DEFAULT_POLICY = PasswordPolicy(label="Padrão (13 caracteres)")
+
+# Políticas oferecidas na tela de geração de senha, na ordem exibida
+PRESET_POLICIES = (
+    DEFAULT_POLICY,
+    PasswordPolicy(20, label="Forte (20 caracteres)"),
+    PasswordPolicy(16, exclude_look_alikes=True, label="Sem caracteres parecidos (16 caracteres)"),
+    PasswordPolicy(16, classes=("upper", "lower", "digits"), label="Letras e números (16 caracteres)"),
+    PasswordPolicy(6, classes=("digits",), label="PIN (6 dígitos)"),
+    PassphrasePolicy(5, label="Frase-senha (5 palavras)"),
+    PassphrasePolicy(7, label="Frase-senha (7 palavras)"),
+)
+
+def policy_from_options(length: int = None, classes=None, exclude_look_alikes: bool = False,
+                        words: int = None, separator: str = "-"):
+    """
+    Monta a política a partir de opções avulsas (linha de comando, agente):
+    'words' gera frases-senha; sem nenhuma opção, retorna a política padrão.
+    Levanta ValueError para opções inválidas.
+    """
+    if words:
+        return PassphrasePolicy(words, separator=separator)
+    if length or classes or exclude_look_alikes:
+        return PasswordPolicy(length or DEFAULT_LENGTH, classes=classes or DEFAULT_CLASSES,
+                              exclude_look_alikes=exclude_look_alikes)
+    return DEFAULT_POLICY
+
+def generate(policy=None) -> str:
+    """Gera uma única senha seguindo a política informada (ou a padrão)."""
+    return (policy or DEFAULT_POLICY).generate()
+
+def generate_many(n: int, policy=None) -> list[str]:
+    """
+    Gera 'n' senhas seguindo a política informada (ou a padrão).
+    Nas políticas de caracteres, os bytes aleatórios são lidos em blocos do
+    os.urandom (a mesma fonte do módulo 'secrets') e convertidos em caracteres
+    com bytes.translate, sem laço em Python por caractere.
+    """
+    return (policy or DEFAULT_POLICY).generate_many(n)
@@ -0,0 +1,72 @@
+# PasswordGenerate/src/password_generate/wordlist.py
+
+import mmap
+import threading
+from array import array
+
+from src.config.path_config import WORDLIST_FILE_PATH
+from src.config.log_config import get_logger
+
+logger = get_logger("generator")
+
+class Wordlist:
+    """
+    Lista de palavras (uma por linha, em UTF-8) usada nas frases-senha.
+    O arquivo só é aberto no primeiro acesso e fica mapeado em memória (mmap):
+    em vez de uma lista de strings, guarda apenas o deslocamento de cada linha,
+    e cada palavra é lida do mapeamento quando sorteada.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._mapping = None
+        self._offsets = None  # Início de cada palavra; o último item é o fim do arquivo
+
+    def _load(self):
+        with self._lock:
+            if self._offsets is not None:
+                return
+            self._file = open(self.path, "rb")
+            self._mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            offsets = array("L")
+            position, size = 0, len(self._mapping)
+            while position < size:
+                end = self._mapping.find(b"\n", position)
+                if end == -1:
+                    end = size
+                if end - position > 0 and not self._mapping[position:end].isspace():
+                    offsets.append(position)
+                position = end + 1
+            offsets.append(size)
+            self._offsets = offsets
+            logger.debug("%d palavras mapeadas de '%s'.", len(offsets) - 1, self.path)
+
+    def __len__(self):
+        if self._offsets is None:
+            self._load()
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if self._offsets is None:
+            self._load()
+        start = self._offsets[index]
+        end = self._mapping.find(b"\n", start, self._offsets[index + 1])
+        return self._mapping[start:end if end != -1 else self._offsets[index + 1]].decode("utf-8").strip()
+
+    def close(self):
+        with self._lock:
+            if self._mapping is not None:
+                self._mapping.close()
+                self._file.close()
+            self._file = self._mapping = self._offsets = None
+
+_default_wordlist = None
+
+def get_default_wordlist() -> Wordlist:
+    """Lista de palavras em português distribuída com a aplicação (carregada sob demanda)."""
+    global _default_wordlist
+    if _default_wordlist is None:
+        _default_wordlist = Wordlist(WORDLIST_FILE_PATH)
+    return _default_wordlist
@@ -0,0 +1,63 @@
+# PasswordGenerate/tests/conftest.py
+
+import sqlite3
+
+import pytest
+
+from src.config.cipher_manager import CipherManager
+from src.config.kdf import Pbkdf2Kdf, kdf_from_setting
+from src.database.repositories.repository import PasswordRepository
+from src.database.repositories.repository_config import ConfigRepository
+from src.database.services.security_service import SecurityService, MASTER_SALT_SETTING_KEY
+
+MASTER_PASSWORD = "senha-mestra"
+FAST_KDF = Pbkdf2Kdf(1000)  # Poucas iterações: os testes não medem o custo da derivação
+
+def open_service(db_path: str) -> SecurityService:
+    return SecurityService(PasswordRepository(db_path), ConfigRepository(db_path), build_index_on_login=False)
+
+def create_legacy_vault(db_path: str, entries: dict[str, str], master_password: str = MASTER_PASSWORD) -> str:
+    """
+    Cria um banco no esquema original (user_version 0): salt repetido em cada linha,
+    token Fernet em base64 (TEXT), sem 'updated_at' e sem DEKs embrulhadas.
+    As entradas são cifradas com a chave derivada da senha mestra. Retorna o salt (hex).
+    """
+    cipher_manager = CipherManager()
+    salt_hex, legacy_key = cipher_manager.generate_master_key_info(master_password, kdf_from_setting(None))
+    legacy_fernet = cipher_manager.get_fernet_from_key(legacy_key)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("""
+            CREATE TABLE password_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                encrypted_password TEXT NOT NULL,
+                master_key_salt TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE app_settings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                value TEXT NOT NULL
+            )
+        """)
+        conn.execute("INSERT INTO app_settings (key, value) VALUES (?, ?)", (MASTER_SALT_SETTING_KEY, salt_hex))
+        conn.executemany("INSERT INTO password_entries (name, encrypted_password, master_key_salt) VALUES (?, ?, ?)",
+                         [(name, cipher_manager.encrypt_password(legacy_fernet, password), salt_hex)
+                          for name, password in entries.items()])
+    conn.close()
+    return salt_hex
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    return str(tmp_path / "passwords.db")
+
+@pytest.fixture
+def service(db_path):
+    """Cofre novo, registrado com MASTER_PASSWORD e com a sessão aberta."""
+    security_service = open_service(db_path)
+    assert security_service.register_and_login(MASTER_PASSWORD, FAST_KDF)
+    yield security_service
+    security_service.shutdown()
@@ -0,0 +1,137 @@
+# PasswordGenerate/tests/test_agent.py
+
+import asyncio
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from src.agent.client import AgentClient, AgentError, connect_agent
+from src.agent.protocol import ERROR_BAD_REQUEST, ERROR_LOCKED, MAX_GENERATE_COUNT, MAX_GENERATE_LENGTH
+from src.agent.server import VaultAgent
+from tests.conftest import MASTER_PASSWORD
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="o agente usa sockets Unix")
+
+class RunningAgent:
+    """Agente servindo em uma thread própria, com o socket em um diretório privado curto."""
+
+    def __init__(self, service, idle_timeout: float = 0):
+        self.socket_dir = tempfile.mkdtemp(prefix="agente-")  # 0700; caminhos de socket têm limite de tamanho
+        self.socket_path = os.path.join(self.socket_dir, "agent.sock")
+        self.agent = VaultAgent(service, self.socket_path, idle_timeout)
+        self._loop = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._serve(),))
+        self._thread.start()
+        assert self._ready.wait(5)
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self.agent.serve(on_ready=self._ready.set)
+        finally:
+            self._ready.set()
+
+    def stop(self):
+        if self._loop is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self.agent.stop)
+        self._thread.join(5)
+        shutil.rmtree(self.socket_dir, ignore_errors=True)
+
+@pytest.fixture
+def agent(service):
+    assert service.save_password_entry("github", "segredo-github")
+    service.logout()  # O agente começa bloqueado
+    running = RunningAgent(service)
+    yield running
+    running.stop()
+
+@pytest.fixture
+def client(agent):
+    agent_client = AgentClient(agent.socket_path, timeout=5)
+    yield agent_client
+    agent_client.close()
+
+def test_desbloqueio_e_bloqueio(client):
+    assert client.status()["unlocked"] is False
+    with pytest.raises(AgentError) as error:
+        client.get("github")
+    assert error.value.code == ERROR_LOCKED
+
+    assert not client.unlock("senha-errada")
+    assert client.unlock(MASTER_PASSWORD)
+    assert client.get("github") == "segredo-github"
+    assert client.search("git") == ["github"]
+
+    client.lock()
+    assert client.status()["unlocked"] is False
+    with pytest.raises(AgentError):
+        client.get("github")
+
+def test_bloqueio_por_inatividade(service):
+    assert service.save_password_entry("github", "segredo-github")
+    running = RunningAgent(service, idle_timeout=0.2)
+    try:
+        agent_client = AgentClient(running.socket_path, timeout=5)
+        assert agent_client.status()["unlocked"] is True
+        time.sleep(0.6)
+        assert agent_client.status()["unlocked"] is False
+        agent_client.close()
+    finally:
+        running.stop()
+
+def test_socket_que_nao_e_privado_e_recusado(agent, monkeypatch):
+    os.chmod(agent.socket_dir, 0o755)
+    with pytest.raises(PermissionError):
+        AgentClient(agent.socket_path).status()
+    monkeypatch.setenv("MY_VOULT_AGENT_SOCK", agent.socket_path)
+    assert connect_agent() is None
+
+    os.chmod(agent.socket_dir, 0o700)
+    os.chmod(agent.socket_path, 0o666)
+    with pytest.raises(PermissionError):
+        AgentClient(agent.socket_path).status()
+
+def test_agente_nao_inicia_em_diretorio_compartilhado(service, tmp_path):
+    shared_dir = tmp_path / "compartilhado"
+    shared_dir.mkdir(mode=0o777)
+    os.chmod(shared_dir, 0o777)
+    agent = VaultAgent(service, str(shared_dir / "agent.sock"))
+    with pytest.raises(PermissionError):
+        asyncio.run(agent.serve())
+    assert not (shared_dir / "agent.sock").exists()
+
+def _raw_request(socket_path: str, line: bytes) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(socket_path)
+        sock.sendall(line)
+        return sock.makefile("rb").readline()
+
+@pytest.mark.parametrize("request_line", [b"isto nao e json\n", b"[1, 2]\n", b'{"op": "desconhecida"}\n'])
+def test_requisicao_invalida(agent, request_line):
+    assert b'"error":"bad_request"' in _raw_request(agent.socket_path, request_line)
+
+@pytest.mark.parametrize("options", [{"count": MAX_GENERATE_COUNT + 1}, {"length": MAX_GENERATE_LENGTH + 1},
+                                     {"words": 10 ** 6}, {"count": "muitas"}, {"separator": "-" * 100},
+                                     {"length": 0}])
+def test_geracao_fora_dos_limites(client, options):
+    with pytest.raises(AgentError) as error:
+        client.request("generate", **options)
+    assert error.value.code == ERROR_BAD_REQUEST
+
+def test_geracao_dentro_dos_limites(client):
+    passwords = client.generate(count=5, length=20)
+    assert len(passwords) == 5 and all(len(password) == 20 for password in passwords)
+    assert client.status()["unlocked"] is False  # Gerar senhas não exige o cofre desbloqueado
+
+def test_get_sem_nome_e_requisicao_invalida(client):
+    assert client.unlock(MASTER_PASSWORD)
+    with pytest.raises(AgentError) as error:
+        client.request("get")
+    assert error.value.code == ERROR_BAD_REQUEST
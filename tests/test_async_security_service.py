@@ -0,0 +1,90 @@
+# PasswordGenerate/tests/test_async_security_service.py
+
+import asyncio
+
+import pytest
+
+from src.database.services.async_security_service import AsyncSecurityService
+from tests.conftest import MASTER_PASSWORD
+
+def run(coroutine_function, service):
+    async def main():
+        async with AsyncSecurityService(service, crypto_workers=2) as async_service:
+            return await coroutine_function(async_service)
+    return asyncio.run(main())
+
+def test_consultas_concorrentes_viram_um_select(service):
+    for i in range(20):
+        assert service.save_password_entry(f"entrada-{i}", f"segredo-{i}")
+
+    async def scenario(async_service):
+        names = [f"entrada-{i % 20}" for i in range(60)] + ["inexistente"]
+        passwords = await asyncio.gather(*(async_service.retrieve_password_by_name(name) for name in names))
+        return async_service, names, passwords
+
+    async_service, names, passwords = run(scenario, service)
+    assert passwords[:60] == [f"segredo-{i % 20}" for i in range(60)]
+    assert passwords[60] is None
+    assert (async_service.reads_requested, async_service.read_batches) == (61, 1)
+
+def test_cancelar_uma_espera_nao_cancela_as_outras(service):
+    assert service.save_password_entry("email", "segredo")
+
+    async def scenario(async_service):
+        cancelled = asyncio.ensure_future(async_service.retrieve_password_by_name("email"))
+        waiting = asyncio.ensure_future(async_service.retrieve_password_by_name("email"))
+        await asyncio.sleep(0)  # Ambas aguardam o mesmo resultado compartilhado
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await waiting, await async_service.retrieve_password_by_name("email")
+
+    assert run(scenario, service) == ("segredo", "segredo")
+
+def test_erro_na_leitura_chega_a_todos(service, monkeypatch):
+    def failing_get_by_names(names):
+        raise RuntimeError("falha de leitura")
+    monkeypatch.setattr(service.repo, "get_by_names", failing_get_by_names)
+
+    async def scenario(async_service):
+        return await asyncio.gather(async_service.retrieve_password_by_name("a"),
+                                    async_service.retrieve_password_by_name("b"), return_exceptions=True)
+
+    results = run(scenario, service)
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+def test_escritas_em_ordem(service):
+    async def scenario(async_service):
+        operations = [async_service.save_password_entry("email", "v1"),
+                      async_service.update_password_by_name("email", "v2"),
+                      async_service.save_password_entry("email", "v3", overwrite=True),
+                      async_service.save_password_entry("banco", "b1"),
+                      async_service.delete_password_by_name("banco")]
+        results = await asyncio.gather(*operations)
+        return results, await async_service.retrieve_passwords_by_name(["email", "banco"])
+
+    results, passwords = run(scenario, service)
+    assert results == [True, True, True, True, True]
+    assert passwords == {"email": "v3", "banco": None}
+    assert service.search_password_names("emai") == ["email"]
+
+def test_login_e_logout_pela_fachada(service):
+    assert service.save_password_entry("email", "segredo")
+    service.logout()
+
+    async def scenario(async_service):
+        locked = (async_service.is_unlocked(), await async_service.retrieve_password_by_name("email"),
+                  await async_service.save_password_entry("novo", "x"))
+        assert not await async_service.login_with_master_password("senha-errada")
+        assert await async_service.login_with_master_password(MASTER_PASSWORD)
+        password = await async_service.retrieve_password_by_name("email")
+        await async_service.logout()
+        return locked, password, async_service.is_unlocked()
+
+    assert run(scenario, service) == ((False, None, False), "segredo", False)
+
+def test_api_sincrona_com_futures(service):
+    service.logout()
+    future = service.login_with_master_password_async(MASTER_PASSWORD)
+    assert future.result(timeout=10) is True
+    assert service.active_data_key() is not None
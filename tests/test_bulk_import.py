@@ -0,0 +1,54 @@
+# PasswordGenerate/tests/test_bulk_import.py
+
+import sqlite3
+
+from src.database.models.model_import import ROW_DUPLICATE, ROW_FAILED, ROW_INSERTED
+
+def test_status_de_cada_linha(service):
+    assert service.save_password_entry("existente", "segredo")
+    report = service.save_password_entries_bulk([
+        ("  nova  ", "segredo-1"),
+        ("existente", "segredo-2"),
+        ("", "segredo-3"),
+        ("sem-senha", ""),
+        ("nova", "segredo-4"),  # Repetida no próprio lote, depois de normalizada
+        ("incompleta",),
+        None,
+        ("outra", "segredo-5"),
+    ], chunk_size=3)
+
+    statuses = {row.index: row.status for row in report.rows}
+    assert statuses == {0: ROW_INSERTED, 1: ROW_DUPLICATE, 2: ROW_FAILED, 3: ROW_FAILED,
+                        4: ROW_DUPLICATE, 5: ROW_FAILED, 6: ROW_FAILED, 7: ROW_INSERTED}
+    assert (report.inserted, report.duplicates, report.failed) == (2, 2, 4)
+    assert all(row.error for row in report.rows if row.status == ROW_FAILED)
+
+    assert service.retrieve_password_by_name("nova") == "segredo-1"
+    assert service.retrieve_password_by_name("existente") == "segredo"
+
+def test_sem_sessao_nao_grava(service):
+    service.logout()
+    assert service.save_password_entries_bulk([("nome", "segredo")]) is None
+
+def test_bloco_com_banco_ocupado_falha_sem_desfazer_os_outros(service, db_path):
+    service.repo._get_connection().execute("PRAGMA busy_timeout = 50")  # Não espera os 5 s padrão
+    other_writer = sqlite3.connect(db_path, isolation_level=None)
+
+    def entries():
+        for i in range(6):
+            if i == 2:
+                other_writer.execute("BEGIN IMMEDIATE")  # Outro processo segura a escrita no 2º bloco
+            elif i == 4:
+                other_writer.execute("COMMIT")
+            yield f"nome-{i}", f"segredo-{i}"
+
+    report = service.save_password_entries_bulk(entries(), chunk_size=2)
+    other_writer.close()
+
+    statuses = {row.index: row.status for row in report.rows}
+    assert statuses == {0: ROW_INSERTED, 1: ROW_INSERTED, 2: ROW_FAILED,
+                        3: ROW_FAILED, 4: ROW_INSERTED, 5: ROW_INSERTED}
+    assert all("locked" in row.error for row in report.rows if row.status == ROW_FAILED)
+    assert service.retrieve_password_by_name("nome-0") == "segredo-0"
+    assert service.retrieve_password_by_name("nome-2") is None
+    assert service.retrieve_password_by_name("nome-5") == "segredo-5"
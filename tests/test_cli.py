@@ -0,0 +1,25 @@
+# PasswordGenerate/tests/test_cli.py
+
+import pytest
+
+from src import cli
+from tests.conftest import MASTER_PASSWORD
+
+@pytest.fixture
+def vault_db(service, db_path, monkeypatch):
+    """Cofre criado pelo serviço e aberto pela linha de comando com a senha mestra do ambiente."""
+    service.shutdown()
+    monkeypatch.setenv(cli.MASTER_PASSWORD_ENV, MASTER_PASSWORD)
+    return db_path
+
+def test_import_de_csv_malformado_e_reportado(vault_db, tmp_path, capsys):
+    path = tmp_path / "export.csv"
+    path.write_text("name,password\nemail," + "x" * 200000 + "\n", encoding="utf-8")  # Campo além do limite do csv
+    assert cli.main(["--db", vault_db, "--no-agent", "import", str(path)]) == 1
+    assert f"Não foi possível importar '{path}'" in capsys.readouterr().err
+
+def test_import_de_csv(vault_db, tmp_path, capsys):
+    path = tmp_path / "export.csv"
+    path.write_text("name,password\nemail,segredo\n", encoding="utf-8")
+    assert cli.main(["--db", vault_db, "--no-agent", "import", str(path)]) == 0
+    assert "1 importada(s)" in capsys.readouterr().out
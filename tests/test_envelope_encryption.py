@@ -0,0 +1,63 @@
+# PasswordGenerate/tests/test_envelope_encryption.py
+
+import json
+
+from src.database.services.security_service import DATA_KEYS_SETTING_KEY, MASTER_SALT_SETTING_KEY
+from tests.conftest import FAST_KDF, MASTER_PASSWORD, create_legacy_vault, open_service
+
+def _wrapped_key_ids(service) -> set[str]:
+    return set(json.loads(service.config_repo.get_setting(DATA_KEYS_SETTING_KEY)))
+
+def test_login_desembrulha_a_chave_de_dados(service, db_path):
+    assert service.save_password_entry("email", "segredo")
+    service.shutdown()
+
+    reopened = open_service(db_path)
+    try:
+        assert reopened.is_master_password_set()
+        assert not reopened.login_with_master_password("senha-errada")
+        assert reopened.retrieve_password_by_name("email") is None
+        assert reopened.login_with_master_password(MASTER_PASSWORD)
+        assert reopened.retrieve_password_by_name("email") == "segredo"
+    finally:
+        reopened.shutdown()
+
+def test_troca_da_senha_mestra_mantem_as_chaves_de_dados(service):
+    assert service.save_password_entry("email", "segredo")
+    key_ids = _wrapped_key_ids(service)
+    assert service.change_master_password(MASTER_PASSWORD, "nova-senha", FAST_KDF)
+    assert _wrapped_key_ids(service) == key_ids
+    service.logout()
+    assert not service.login_with_master_password(MASTER_PASSWORD)
+    assert service.login_with_master_password("nova-senha")
+    assert service.retrieve_password_by_name("email") == "segredo"
+
+def test_cofre_antigo_vazio_nao_aceita_qualquer_senha(db_path):
+    create_legacy_vault(db_path, {})
+    service = open_service(db_path)
+    try:
+        assert not service.is_master_password_set()
+        assert not service.login_with_master_password("senha-digitada-errado")
+        assert service.config_repo.get_setting(DATA_KEYS_SETTING_KEY) is None
+
+        # O cofre é criado de novo no registro, com a senha escolhida agora
+        assert service.register_and_login("nova-senha", FAST_KDF)
+        assert service.save_password_entry("email", "segredo")
+        service.logout()
+        assert not service.login_with_master_password("senha-digitada-errado")
+        assert service.login_with_master_password("nova-senha")
+        assert service.retrieve_password_by_name("email") == "segredo"
+    finally:
+        service.shutdown()
+
+def test_cofre_antigo_com_entradas_confere_a_senha(db_path):
+    salt_hex = create_legacy_vault(db_path, {"email": "segredo"})
+    service = open_service(db_path)
+    try:
+        assert not service.login_with_master_password("senha-errada")
+        assert service.config_repo.get_setting(DATA_KEYS_SETTING_KEY) is None
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        assert _wrapped_key_ids(service) == {salt_hex}  # A chave antiga vira a DEK, identificada pelo salt
+        assert service.config_repo.get_setting(MASTER_SALT_SETTING_KEY) == salt_hex
+    finally:
+        service.shutdown()
@@ -0,0 +1,68 @@
+# PasswordGenerate/tests/test_export_service.py
+
+import os
+import stat
+
+import pytest
+
+from src.database.services.export_service import ExportService
+
+def _names(export_service: ExportService, path) -> list[str]:
+    return sorted(record["name"] for record in export_service.iter_archive_entries(str(path)))
+
+def test_backups_incrementais_sem_repeticoes_nem_perdas(service, tmp_path):
+    export_service = ExportService(service)
+    for i in range(5):
+        assert service.save_password_entry(f"entrada-{i}", "segredo")
+
+    assert export_service.export_encrypted_archive(str(tmp_path / "completo.bak")) == 5
+    assert export_service.export_encrypted_archive(str(tmp_path / "vazio.bak"), incremental=True) == 0
+
+    # Alterações no mesmo segundo do backup anterior ainda entram no próximo incremental
+    assert service.update_password_entry(service.repo.get_by_name("entrada-1").id, "novo-segredo")
+    assert service.save_password_entry("entrada-5", "segredo")
+    assert export_service.export_encrypted_archive(str(tmp_path / "inc-1.bak"), incremental=True) == 2
+    assert _names(export_service, tmp_path / "inc-1.bak") == ["entrada-1", "entrada-5"]
+    assert export_service.export_encrypted_archive(str(tmp_path / "inc-2.bak"), incremental=True) == 0
+
+    assert _names(export_service, tmp_path / "completo.bak") == [f"entrada-{i}" for i in range(5)]
+
+def test_backup_truncado_e_rejeitado(service, tmp_path):
+    export_service = ExportService(service)
+    assert service.save_password_entry("email", "segredo")
+    path = tmp_path / "backup.bak"
+    export_service.export_encrypted_archive(str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    path.write_text("\n".join(lines[:-1]) + "\n", encoding="utf-8")  # Sem o marcador de encerramento
+    with pytest.raises(ValueError):
+        list(export_service.iter_archive_entries(str(path)))
+
+def test_exportacoes_criadas_apenas_para_o_dono(service, tmp_path):
+    export_service = ExportService(service)
+    assert service.save_password_entry("email", "segredo")
+    csv_path, archive_path = tmp_path / "senhas.csv", tmp_path / "backup.bak"
+    csv_path.write_text("conteúdo antigo", encoding="utf-8")  # Substituído apenas quando completo
+
+    assert export_service.export_plaintext_csv(str(csv_path), confirm_plaintext=True) == 1
+    assert export_service.export_encrypted_archive(str(archive_path)) == 1
+    for path in (csv_path, archive_path):
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert "email,segredo," in csv_path.read_text(encoding="utf-8")
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+def test_csv_nao_omite_senhas_ilegiveis(service, tmp_path):
+    export_service = ExportService(service)
+    assert service.save_password_entry("email", "segredo")
+    assert service.save_password_entry("banco", "segredo")
+    conn = service.repo._get_connection()
+    with conn:
+        conn.execute("UPDATE password_entries SET encrypted_password = ? WHERE name = ?", (b"corrompido", "banco"))
+
+    path = tmp_path / "senhas.csv"
+    with pytest.raises(ValueError, match="banco"):
+        export_service.export_plaintext_csv(str(path), confirm_plaintext=True)
+    assert not path.exists() and not os.path.exists(str(path) + ".tmp")
+
+def test_csv_em_texto_puro_exige_confirmacao(service, tmp_path):
+    with pytest.raises(PermissionError):
+        ExportService(service).export_plaintext_csv(str(tmp_path / "senhas.csv"))
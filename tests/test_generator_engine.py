@@ -0,0 +1,53 @@
+# PasswordGenerate/tests/test_generator_engine.py
+
+from collections import Counter
+
+from src.password_generate import generator_engine
+from src.password_generate.generator_engine import CHUNK_PASSWORDS, PasswordPolicy, generate, generate_many
+
+DIGITS = "0123456789"  # 256 não é múltiplo de 10: um mapeamento por módulo favoreceria 0-5
+
+class CyclicUrandom:
+    """Substituto determinístico do os.urandom: os valores de byte 0-255 em ciclo, entre chamadas."""
+
+    def __init__(self):
+        self.position = 0
+
+    def __call__(self, size: int) -> bytes:
+        data = bytes((self.position + i) % 256 for i in range(size))
+        self.position = (self.position + size) % 256
+        return data
+
+def test_senhas_com_o_tamanho_e_o_alfabeto_pedidos():
+    passwords = generate_many(1000)
+    alphabet = set(generator_engine.DEFAULT_ALPHABET)
+    assert len(passwords) == 1000
+    assert all(len(password) == generator_engine.DEFAULT_LENGTH for password in passwords)
+    assert set("".join(passwords)) <= alphabet
+    assert len(set(passwords)) == 1000
+
+    policy = PasswordPolicy(length=40, alphabet=DIGITS)
+    password = generate(policy)
+    assert len(password) == 40 and set(password) <= set(DIGITS)
+
+def test_quantidade_exata_entre_blocos():
+    policy = PasswordPolicy(length=4, alphabet=DIGITS)
+    assert len(generate_many(CHUNK_PASSWORDS + 3, policy)) == CHUNK_PASSWORDS + 3
+    assert generate_many(0, policy) == []
+
+def test_sem_vies_de_modulo(monkeypatch):
+    monkeypatch.setattr(generator_engine.os, "urandom", CyclicUrandom())
+    policy = PasswordPolicy(length=25, alphabet=DIGITS)
+    # Rejeitando 250-255, os bytes aceitos viram os dígitos 0-9 em ciclo: contagens iguais
+    # (a menos de 1). Um mapeamento por módulo desviaria ~6 caracteres a cada 256 bytes
+    counts = Counter("".join(generate_many(1000, policy)))
+    assert set(counts) == set(DIGITS)
+    assert max(counts.values()) - min(counts.values()) <= 1
+
+def test_distribuicao_uniforme():
+    policy = PasswordPolicy(length=100, alphabet=DIGITS)
+    text = "".join(generate_many(2000, policy))
+    expected = len(text) / len(DIGITS)
+    counts = Counter(text)
+    chi_square = sum((counts[digit] - expected) ** 2 / expected for digit in DIGITS)
+    assert chi_square < 35  # 9 graus de liberdade: p < 0,0001 de falha para um gerador uniforme
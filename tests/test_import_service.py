@@ -0,0 +1,74 @@
+# PasswordGenerate/tests/test_import_service.py
+
+import os
+import shutil
+
+from src.database.models.model_import import ROW_DUPLICATE, ROW_FAILED, ROW_INSERTED
+from src.database.services.import_service import ImportService
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+def _statuses(service, rows) -> list[tuple[str, str]]:
+    report = service.save_password_entries_bulk(rows)
+    return [(row.name, row.status) for row in sorted(report.rows, key=lambda row: row.index)]
+
+def test_itens_do_bitwarden(service):
+    with open(os.path.join(DATA_DIR, "bitwarden.json"), encoding="utf-8") as fp:
+        statuses = _statuses(service, ImportService.iter_json_entries(fp))
+    assert statuses == [
+        ("GitHub (ana)", ROW_INSERTED),
+        ("exemplo.com.br (bia)", ROW_INSERTED),
+        ("texto.org", ROW_INSERTED),
+        ("Uris como objeto", ROW_INSERTED),
+        ("Uris como texto", ROW_INSERTED),
+        ("Senha numérica", ROW_FAILED),
+        ("Senha objeto", ROW_FAILED),
+        ("Nota segura", ROW_FAILED),
+        (None, ROW_FAILED),
+        (None, ROW_FAILED),
+        ("GitHub (ana)", ROW_DUPLICATE),
+    ]
+    assert service.retrieve_password_by_name("GitHub (ana)") == "segredo-github"
+    assert service.retrieve_password_by_name("texto.org") == "segredo-texto"
+
+def test_linhas_malformadas_viram_falhas(service):
+    with open(os.path.join(DATA_DIR, "malformed.jsonl"), encoding="utf-8") as fp:
+        statuses = _statuses(service, ImportService.iter_json_lines_entries(fp))
+    assert statuses == [
+        ("email (ana)", ROW_INSERTED),
+        (None, ROW_FAILED),  # Lista
+        (None, ROW_FAILED),  # Texto
+        (None, ROW_FAILED),  # Número
+        (None, ROW_FAILED),  # JSON cortado
+        ("Banco", ROW_FAILED),  # Senha nula
+        ("http://[::1", ROW_INSERTED),  # URL que não pode ser interpretada
+        ("final", ROW_INSERTED),
+    ]
+
+def test_import_file_conta_os_status(service, tmp_path):
+    path = tmp_path / "bitwarden.json"
+    shutil.copy(os.path.join(DATA_DIR, "bitwarden.json"), path)
+    report = ImportService(service).import_file(str(path), chunk_size=4)
+    assert (report.inserted, report.duplicates, report.failed) == (5, 1, 5)
+    assert report.rows == []  # Importações de arquivo guardam apenas os contadores
+
+def test_importacao_de_csv(service, tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text("name,url,username,password\n"
+                    "email,,,segredo-1\n"
+                    ",https://exemplo.com,ana,segredo-2\n"
+                    "vazia,,,\n", encoding="utf-8")
+    report = ImportService(service).import_file(str(path))
+    assert (report.inserted, report.duplicates, report.failed) == (2, 0, 1)
+    assert service.retrieve_password_by_name("email") == "segredo-1"
+    assert service.retrieve_password_by_name("exemplo.com (ana)") == "segredo-2"
+
+def test_formato_desconhecido(service, tmp_path):
+    path = tmp_path / "senhas.xml"
+    path.write_text("<senhas/>", encoding="utf-8")
+    try:
+        ImportService(service).import_file(str(path))
+    except ValueError as e:
+        assert "xml" in str(e)
+    else:
+        raise AssertionError("formato desconhecido deveria levantar ValueError")
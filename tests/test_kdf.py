@@ -0,0 +1,74 @@
+# PasswordGenerate/tests/test_kdf.py
+
+import pytest
+
+from src.config import kdf as kdf_module
+from src.config.kdf import (LEGACY_PBKDF2_ITERATIONS, Argon2idKdf, Pbkdf2Kdf, ScryptKdf, calibrate_kdf,
+                            create_kdf, kdf_from_setting)
+from src.database.services.security_service import MASTER_KDF_SETTING_KEY
+from tests.conftest import FAST_KDF, MASTER_PASSWORD, open_service
+
+def fake_cost(kdf) -> float:
+    """Tempo simulado de uma derivação, proporcional ao custo dos parâmetros."""
+    if isinstance(kdf, Pbkdf2Kdf):
+        return kdf.iterations / 1_000_000
+    if isinstance(kdf, ScryptKdf):
+        return kdf.n / 100_000
+    return kdf.iterations * kdf.memory_cost / (64 * 1024) / 10
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    monkeypatch.setattr(kdf_module, "measure_kdf", lambda kdf, rounds=1: fake_cost(kdf))
+
+@pytest.mark.parametrize("name, expected", [
+    ("pbkdf2", Pbkdf2Kdf(250_000)),
+    ("scrypt", ScryptKdf(2 ** 15)),
+    ("argon2id", Argon2idKdf(iterations=2)),
+])
+def test_calibracao_atinge_o_tempo_alvo(fake_clock, name, expected):
+    kdf = calibrate_kdf(name, target_ms=250)
+    assert kdf.to_setting() == expected.to_setting()
+
+def test_calibracao_respeita_os_limites(fake_clock):
+    assert calibrate_kdf("pbkdf2", target_ms=1).iterations == 100_000
+    assert calibrate_kdf("scrypt", target_ms=1).n == 2 ** 14
+    assert calibrate_kdf("scrypt", target_ms=10 ** 6).n == 2 ** ScryptKdf.MAX_LOG2_N
+    argon2 = calibrate_kdf("argon2id", target_ms=1)
+    assert (argon2.iterations, argon2.memory_cost) == (1, 19 * 1024)
+
+def test_calibracao_real_mede_a_maquina():
+    kdf = calibrate_kdf("pbkdf2", target_ms=1)  # Abaixo do mínimo: fica no piso de iterações
+    assert kdf.iterations == 100_000
+    assert len(kdf.derive(b"senha", b"\x00" * 16)) == 32
+
+@pytest.mark.parametrize("kdf", [Pbkdf2Kdf(1000), ScryptKdf(2 ** 10, r=4, p=2), Argon2idKdf(1, 8 * 1024, 2)])
+def test_parametros_sobrevivem_ao_registro(kdf):
+    restored = kdf_from_setting(kdf.to_setting())
+    assert type(restored) is type(kdf)
+    assert restored.params() == kdf.params()
+
+def test_cofre_sem_registro_usa_o_pbkdf2_antigo():
+    kdf = kdf_from_setting(None)
+    assert isinstance(kdf, Pbkdf2Kdf)
+    assert kdf.iterations == LEGACY_PBKDF2_ITERATIONS
+
+def test_kdf_desconhecida():
+    with pytest.raises(ValueError):
+        create_kdf("md5")
+    with pytest.raises(ValueError):
+        kdf_from_setting('{"name": "md5"}')
+
+def test_derivacao_depende_dos_parametros():
+    salt = b"\x01" * 16
+    assert Pbkdf2Kdf(1000).derive(b"senha", salt) == Pbkdf2Kdf(1000).derive(b"senha", salt)
+    assert Pbkdf2Kdf(1000).derive(b"senha", salt) != Pbkdf2Kdf(1001).derive(b"senha", salt)
+    assert ScryptKdf(2 ** 10).derive(b"senha", salt) != ScryptKdf(2 ** 11).derive(b"senha", salt)
+
+def test_cofre_guarda_a_kdf_usada_no_registro(service, db_path):
+    assert service.config_repo.get_setting(MASTER_KDF_SETTING_KEY) == FAST_KDF.to_setting()
+    service.shutdown()
+    reopened = open_service(db_path)
+    try:
+        assert reopened.login_with_master_password(MASTER_PASSWORD)
+    finally:
+        reopened.shutdown()
@@ -0,0 +1,44 @@
+# PasswordGenerate/tests/test_logging.py
+
+import logging
+
+from src.config.log_config import ROOT_LOGGER_NAME, key_label
+from src.database.services.export_service import ExportService
+from src.database.services.reencryption_service import ReencryptionService
+from tests.conftest import FAST_KDF, MASTER_PASSWORD, create_legacy_vault, open_service
+
+def test_log_sem_senhas_salts_nem_chaves(db_path, tmp_path, caplog):
+    caplog.set_level(logging.DEBUG, logger=ROOT_LOGGER_NAME)
+    # No cofre antigo convertido, o id da primeira chave de dados é o salt da senha mestra
+    salt_hex = create_legacy_vault(db_path, {"email": "segredo-antigo"})
+    service = open_service(db_path)
+    reencryption = ReencryptionService(service, batch_size=2)
+    try:
+        assert not service.login_with_master_password("senha-errada")
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        legacy_key_id, _ = service.active_data_key()
+        assert legacy_key_id == salt_hex
+        assert service.save_password_entry("banco", "segredo-novo")
+
+        new_key_id = service.rotate_data_key(MASTER_PASSWORD)
+        _, data_keys = service._unwrap_data_keys(MASTER_PASSWORD)
+        assert reencryption.run() == 2
+        assert service.repo.add("orfa", b"token", legacy_key_id)  # Entrada de uma chave já retirada
+        assert service.retrieve_password_by_name("orfa") is None
+        assert service.delete_password_by_name("orfa")
+
+        export_service = ExportService(service)
+        assert export_service.export_encrypted_archive(str(tmp_path / "backup.bak")) == 2
+        assert export_service.export_plaintext_csv(str(tmp_path / "senhas.csv"), confirm_plaintext=True) == 2
+        assert service.change_master_password(MASTER_PASSWORD, "nova-senha-mestra", FAST_KDF)
+    finally:
+        reencryption.shutdown()
+        service.shutdown()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(key_label(new_key_id) in message for message in messages)
+    assert any(key_label(legacy_key_id) in message for message in messages)
+    secrets = [MASTER_PASSWORD, "nova-senha-mestra", "senha-errada", "segredo-antigo", "segredo-novo",
+               salt_hex, legacy_key_id, new_key_id, *data_keys.values()]
+    leaked = [(secret, message) for message in messages for secret in secrets if secret in message]
+    assert leaked == []
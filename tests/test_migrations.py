@@ -0,0 +1,57 @@
+# PasswordGenerate/tests/test_migrations.py
+
+import sqlite3
+
+from src.database.migrations import SCHEMA_VERSION, get_schema_version, migrate
+from src.database.services.security_service import DATA_KEYS_SETTING_KEY
+from tests.conftest import MASTER_PASSWORD, create_legacy_vault, open_service
+
+def _columns(conn: sqlite3.Connection, table: str) -> dict[str, str]:
+    return {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+def test_banco_original_migra_ate_a_versao_atual(db_path):
+    salt_hex = create_legacy_vault(db_path, {"email": "segredo-1", "banco": "segredo-2"})
+    conn = sqlite3.connect(db_path)
+    try:
+        assert get_schema_version(conn) == 0
+        assert migrate(conn) == SCHEMA_VERSION
+
+        columns = _columns(conn, "password_entries")
+        assert "master_key_salt" not in columns
+        assert columns["encrypted_password"] == "BLOB"
+        assert {"key_epoch_id", "updated_at", "row_version"} <= set(columns)
+        assert conn.execute("SELECT key_id FROM key_epochs").fetchall() == [(salt_hex,)]
+
+        rows = conn.execute("SELECT id, name, typeof(encrypted_password), updated_at, row_version "
+                            "FROM password_entries ORDER BY id").fetchall()
+        assert [(row[1], row[2]) for row in rows] == [("email", "blob"), ("banco", "blob")]
+        assert all(row[3] is not None and row[4] == row[0] for row in rows)
+
+        assert migrate(conn) == SCHEMA_VERSION  # Banco já atualizado: nada a fazer
+    finally:
+        conn.close()
+
+def test_migracao_parcial_para_versao_alvo(db_path):
+    create_legacy_vault(db_path, {"email": "segredo"})
+    conn = sqlite3.connect(db_path)
+    try:
+        assert migrate(conn, target_version=2) == 2
+        assert "key_epoch_id" in _columns(conn, "password_entries")
+        assert _columns(conn, "password_entries")["encrypted_password"] == "TEXT"
+        assert migrate(conn) == SCHEMA_VERSION
+    finally:
+        conn.close()
+
+def test_cofre_original_abre_depois_da_migracao(db_path):
+    create_legacy_vault(db_path, {"email": "segredo-1", "banco": "segredo-2"})
+    service = open_service(db_path)
+    try:
+        assert service.is_master_password_set()
+        assert not service.login_with_master_password("senha-errada")
+        assert service.config_repo.get_setting(DATA_KEYS_SETTING_KEY) is None
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        assert service.retrieve_password_by_name("email") == "segredo-1"
+        assert service.retrieve_password_by_name("banco") == "segredo-2"
+        assert service.config_repo.get_setting(DATA_KEYS_SETTING_KEY) is not None  # Convertido para envelope
+    finally:
+        service.shutdown()
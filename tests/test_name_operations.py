@@ -0,0 +1,80 @@
+# PasswordGenerate/tests/test_name_operations.py
+
+import pytest
+
+from src.database.models.model_import import ROW_FAILED, ROW_INSERTED
+
+@pytest.fixture
+def named_service(service):
+    """Sessão com duas entradas e o índice de nomes pronto."""
+    assert service.save_password_entry("email", "segredo-email")
+    assert service.save_password_entry("banco", "segredo-banco")
+    service.search_password_names("email")  # Constrói o índice
+    return service
+
+def indexed(service, *names: str) -> list[str]:
+    """Dos nomes dados, os que estão no índice de busca."""
+    return [name for name in names if service.name_index.created_at(name) is not None]
+
+def test_atualiza_senha_pelo_nome(named_service):
+    assert named_service.update_password_by_name("email", new_plain_password="nova-senha")
+    assert named_service.retrieve_password_by_name("email") == "nova-senha"
+
+def test_renomeia_pelo_nome(named_service):
+    assert named_service.update_password_by_name("email", new_name="  correio  ")
+    assert named_service.retrieve_password_by_name("email") is None
+    assert named_service.retrieve_password_by_name("correio") == "segredo-email"
+    assert named_service.search_password_names("corr") == ["correio"]
+    assert named_service.search_password_names("emai") == []
+
+def test_atualizacao_pelo_nome_recusada(named_service):
+    assert not named_service.update_password_by_name("inexistente", new_plain_password="x")
+    assert not named_service.update_password_by_name("email", new_name="banco")  # Nome já usado
+    with pytest.raises(ValueError):
+        named_service.update_password_by_name("email", new_name="   ")
+    assert named_service.retrieve_password_by_name("email") == "segredo-email"
+    assert indexed(named_service, "banco", "email") == ["banco", "email"]
+
+def test_deleta_pelo_nome(named_service):
+    assert named_service.delete_password_by_name("email")
+    assert not named_service.delete_password_by_name("email")
+    assert named_service.retrieve_password_by_name("email") is None
+    assert indexed(named_service, "banco", "email") == ["banco"]
+
+def test_deleta_varios_pelo_nome(named_service):
+    deleted = named_service.delete_passwords_by_name(["email", "inexistente", "banco"])
+    assert sorted(deleted) == ["banco", "email"]
+    assert named_service.retrieve_password_by_name("email") is None
+    assert indexed(named_service, "banco", "email") == []
+
+def test_sobrescrita_confere_as_linhas(named_service):
+    report = named_service.save_password_entries_overwrite([
+        ("email", "trocada"),
+        (" novo ", "segredo-novo"),
+        ("", "sem-nome"),
+        ("sem-senha", ""),
+        ("incompleta",),
+        ("banco", 123),
+    ])
+
+    statuses = {row.index: row.status for row in report.rows}
+    assert statuses == {0: ROW_INSERTED, 1: ROW_INSERTED, 2: ROW_FAILED,
+                        3: ROW_FAILED, 4: ROW_FAILED, 5: ROW_FAILED}
+    assert (report.inserted, report.failed) == (2, 4)
+    assert named_service.retrieve_password_by_name("email") == "trocada"
+    assert named_service.retrieve_password_by_name("novo") == "segredo-novo"
+    assert named_service.retrieve_password_by_name("banco") == "segredo-banco"
+    assert indexed(named_service, "banco", "email", "novo") == ["banco", "email", "novo"]
+
+def test_sobrescrita_que_falha_nao_mexe_no_indice(named_service, monkeypatch):
+    monkeypatch.setattr(named_service.repo, "upsert_many", lambda rows: 0)  # Transação desfeita
+    report = named_service.save_password_entries_overwrite([("email", "trocada"), ("novo", "segredo")])
+
+    assert (report.inserted, report.failed) == (0, 2)
+    assert all(row.error for row in report.rows)
+    assert named_service.retrieve_password_by_name("email") == "segredo-email"
+    assert indexed(named_service, "email", "novo") == ["email"]
+
+def test_sobrescrita_sem_sessao(service):
+    service.logout()
+    assert service.save_password_entries_overwrite([("nome", "segredo")]) is None
@@ -0,0 +1,120 @@
+# PasswordGenerate/tests/test_password_cache.py
+
+import pytest
+
+from src.database.services.password_cache import DecryptedPasswordCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def is_wiped(buffer: bytearray) -> bool:
+    return not any(buffer)
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+def test_senha_expira_depois_do_ttl(clock):
+    cache = DecryptedPasswordCache(max_entries=4, ttl=10, clock=clock)
+    cache.put("email", "segredo")
+    buffer = cache._entries["email"]
+
+    clock.now = 9.9
+    assert cache.get("email") == "segredo"  # O uso não prolonga o TTL
+    clock.now = 10
+    assert cache.get("email") is None
+    assert is_wiped(buffer)
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+def test_substituida_nao_expira_pelo_registro_antigo(clock):
+    cache = DecryptedPasswordCache(max_entries=4, ttl=10, clock=clock)
+    cache.put("email", "antiga")
+    old_buffer = cache._entries["email"]
+    clock.now = 5
+    cache.put("email", "nova")
+    assert is_wiped(old_buffer)
+
+    clock.now = 12  # Venceu o registro da senha antiga, não o da nova
+    assert cache.get("email") == "nova"
+    clock.now = 15
+    assert cache.get("email") is None
+
+def test_descarta_a_menos_usada_e_zera(clock):
+    cache = DecryptedPasswordCache(max_entries=2, ttl=60, clock=clock)
+    cache.put("a", "senha-a")
+    cache.put("b", "senha-b")
+    buffer_b = cache._entries["b"]
+    assert cache.get("a") == "senha-a"  # "b" passa a ser a menos usada
+    cache.put("c", "senha-c")
+
+    assert cache.get("b") is None
+    assert is_wiped(buffer_b)
+    assert cache.get("a") == "senha-a"
+    assert cache.get("c") == "senha-c"
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+def test_invalidacao_e_clear_zeram_as_senhas(clock):
+    cache = DecryptedPasswordCache(max_entries=4, ttl=60, clock=clock)
+    for name in ("a", "b", "c"):
+        cache.put(name, f"senha-{name}")
+    buffers = dict(cache._entries)
+
+    cache.invalidate("a")
+    assert is_wiped(buffers["a"]) and not is_wiped(buffers["b"])
+    cache.clear()
+    assert all(is_wiped(buffer) for buffer in buffers.values())
+    assert len(cache) == 0
+
+def test_leitura_anterior_a_invalidacao_e_ignorada(clock):
+    cache = DecryptedPasswordCache(max_entries=4, ttl=60, clock=clock)
+    generation = cache.generation  # Lido antes da consulta ao banco
+    cache.invalidate("email")  # Alteração concorrente
+    cache.put("email", "senha-velha", generation)
+    assert cache.get("email") is None
+
+def test_fila_de_expiracao_nao_cresce_sem_limite(clock):
+    cache = DecryptedPasswordCache(max_entries=2, ttl=60, clock=clock)
+    for i in range(100):
+        cache.put("email", f"senha-{i}")
+    assert len(cache._expirations) <= 2 * cache.max_entries + 1
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        DecryptedPasswordCache(max_entries=0)
+    with pytest.raises(ValueError):
+        DecryptedPasswordCache(ttl=0)
+
+def test_servico_consulta_o_cache(service):
+    service.password_cache = DecryptedPasswordCache(8, 60)
+    assert service.save_password_entry("email", "segredo")
+    assert service.retrieve_password_by_name("email") == "segredo"
+    assert service.retrieve_password_by_name("email") == "segredo"
+    assert (service.password_cache.misses, service.password_cache.hits) == (1, 1)
+
+    service.logout()
+    assert len(service.password_cache) == 0
+
+def test_alteracoes_pelo_nome_invalidam_o_cache(service, monkeypatch):
+    service.password_cache = DecryptedPasswordCache(8, 60)
+    for name in ("email", "banco", "loja"):
+        assert service.save_password_entry(name, f"segredo-{name}")
+        assert service.retrieve_password_by_name(name) == f"segredo-{name}"  # Guarda no cache
+
+    assert service.update_password_by_name("email", "email-novo")
+    assert service.retrieve_password_by_name("email") == "email-novo"
+    assert service.delete_password_by_name("banco")
+    assert service.retrieve_password_by_name("banco") is None
+
+    monkeypatch.setattr(service.repo, "upsert_many", lambda rows: 0)  # Transação desfeita
+    report = service.save_password_entries_overwrite([("loja", "loja-nova")])
+    assert report.failed == 1
+    assert service.password_cache.get("loja") == "segredo-loja"  # Nada foi gravado: o cache continua válido
+    monkeypatch.undo()
+    report = service.save_password_entries_overwrite([("loja", "loja-nova")])
+    assert report.inserted == 1
+    assert service.retrieve_password_by_name("loja") == "loja-nova"
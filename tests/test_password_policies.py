@@ -0,0 +1,73 @@
+# PasswordGenerate/tests/test_password_policies.py
+
+import math
+import string
+
+import pytest
+
+from src.password_generate.generator_engine import (CHARACTER_CLASSES, LOOK_ALIKE_CHARACTERS, PRESET_POLICIES,
+                                                    PassphrasePolicy, PasswordPolicy, policy_from_options)
+from src.password_generate.wordlist import Wordlist, get_default_wordlist
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "palavras.txt"
+    path.write_text("abacate\nbanana\n\n   \ncaju\ndamasco", encoding="utf-8")  # Linhas em branco são ignoradas
+    words = Wordlist(str(path))
+    yield words
+    words.close()
+
+def test_toda_senha_tem_cada_classe_exigida():
+    policy = PasswordPolicy(4)  # Quatro classes em quatro caracteres: a exigência mais apertada
+    for password in policy.generate_many(2000):
+        assert len(password) == 4
+        for chars in CHARACTER_CLASSES.values():
+            assert any(char in chars for char in password)
+
+def test_classes_escolhidas_e_caracteres_parecidos():
+    policy = PasswordPolicy(30, classes=("upper", "digits"), exclude_look_alikes=True)
+    text = "".join(policy.generate_many(500))
+    assert set(text) <= set(string.ascii_uppercase + string.digits) - set(LOOK_ALIKE_CHARACTERS)
+    assert not set(text) & set(LOOK_ALIKE_CHARACTERS)
+
+@pytest.mark.parametrize("kwargs", [
+    {"length": 0},
+    {"classes": ("upper", "emoji")},
+    {"length": 3},  # Menor que as quatro classes exigidas
+    {"alphabet": "a"},
+    {"alphabet": "ção"},
+])
+def test_politicas_invalidas(kwargs):
+    with pytest.raises(ValueError):
+        PasswordPolicy(**kwargs)
+
+def test_entropia_desconta_as_senhas_sem_alguma_classe():
+    assert PasswordPolicy(6, classes=("digits",)).entropy_bits() == pytest.approx(6 * math.log2(10))
+    # Dois caracteres de letras minúsculas e dígitos, com ao menos um de cada: 36² - 26² - 10²
+    assert PasswordPolicy(2, classes=("lower", "digits")).entropy_bits() == pytest.approx(math.log2(520))
+    assert PasswordPolicy(2, classes=("lower", "digits"), require_each_class=False).entropy_bits() == \
+        pytest.approx(2 * math.log2(36))
+
+def test_lista_de_palavras_carregada_sob_demanda(wordlist):
+    assert wordlist._offsets is None
+    assert len(wordlist) == 4
+    assert [wordlist[i] for i in range(4)] == ["abacate", "banana", "caju", "damasco"]
+
+def test_frase_senha(wordlist):
+    policy = PassphrasePolicy(5, separator=".", wordlist=wordlist)
+    assert policy.entropy_bits() == pytest.approx(5 * math.log2(4))
+    phrases = policy.generate_many(200)
+    assert all(len(phrase.split(".")) == 5 for phrase in phrases)
+    assert {word for phrase in phrases for word in phrase.split(".")} == {"abacate", "banana", "caju", "damasco"}
+
+def test_lista_distribuida_com_a_aplicacao():
+    assert len(get_default_wordlist()) >= 2048
+    assert PassphrasePolicy(6).entropy_bits() >= 6 * 11
+
+def test_politica_a_partir_de_opcoes():
+    assert isinstance(policy_from_options(words=4, separator=" "), PassphrasePolicy)
+    policy = policy_from_options(length=24, classes=["lower"])
+    assert (policy.length, policy.alphabet) == (24, string.ascii_lowercase)
+    assert policy_from_options() is PRESET_POLICIES[0]
+    with pytest.raises(ValueError):
+        policy_from_options(classes=["emoji"])
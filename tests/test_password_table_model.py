@@ -0,0 +1,71 @@
+# PasswordGenerate/tests/test_password_table_model.py
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from src.gui.password_table_model import MASKED_PASSWORD, PasswordTableModel
+
+@pytest.fixture
+def model(service, monkeypatch):
+    for i in range(23):
+        assert service.save_password_entry(f"entrada-{i:02d}", f"segredo-{i:02d}")
+    table_model = PasswordTableModel(service)
+    table_model.PAGE_SIZE = 5
+    table_model.MAX_CACHED_PAGES = 2
+
+    fetched = []
+    fetch_page = service.get_password_entries_metadata_page
+    def counting_fetch(after_name=None, limit=200):
+        fetched.append(after_name)
+        return fetch_page(after_name, limit)
+    monkeypatch.setattr(service, "get_password_entries_metadata_page", counting_fetch)
+    table_model.fetched = fetched
+    table_model.reload()
+    return table_model
+
+def name_at(table_model, row: int):
+    return table_model.data(table_model.index(row, PasswordTableModel.NAME_COLUMN))
+
+def test_paginas_descobertas_pelo_fetch_more(model):
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 23
+    assert len(model.fetched) == 5
+    assert [name_at(model, row) for row in (0, 4, 5, 22)] == \
+        ["entrada-00", "entrada-04", "entrada-05", "entrada-22"]
+
+def test_guarda_apenas_as_paginas_recentes(model):
+    while model.canFetchMore():
+        model.fetchMore()
+    assert len(model._pages) == model.MAX_CACHED_PAGES
+
+    model.fetched.clear()
+    assert name_at(model, 7) == "entrada-07"  # Página 1, descartada e buscada de novo
+    assert model.fetched == ["entrada-04"]
+    assert name_at(model, 8) == "entrada-08"
+    assert model.fetched == ["entrada-04"]  # Já está em memória
+    assert len(model._pages) == model.MAX_CACHED_PAGES
+
+def test_senha_revelada_sai_com_a_pagina(model):
+    model.fetchMore()
+    password_index = model.index(1, PasswordTableModel.PASSWORD_COLUMN)
+    assert model.toggle_reveal(1)
+    assert model.data(password_index) == "segredo-01"
+
+    model.fetchMore()
+    model.fetchMore()  # Três páginas descobertas: a primeira é descartada
+    assert 0 not in model._pages
+    assert model.data(password_index) == MASKED_PASSWORD
+    assert model.entry_name(1) == "entrada-01"
+
+def test_entradas_avulsas_sem_paginacao(model, service):
+    model.show_entries(service.get_password_entries_metadata_page("entrada-09", 10))
+    model.fetched.clear()
+    assert model.rowCount() == 10
+    assert not model.canFetchMore()
+    assert name_at(model, 9) == "entrada-19"
+    assert model.fetched == []
@@ -0,0 +1,102 @@
+# PasswordGenerate/tests/test_reencryption.py
+
+import json
+
+import pytest
+
+from src.database.services.export_service import ExportService
+from src.database.services.reencryption_service import ReencryptionService
+from src.database.services.security_service import ACTIVE_DATA_KEY_SETTING_KEY, DATA_KEYS_SETTING_KEY
+from tests.conftest import MASTER_PASSWORD
+
+@pytest.fixture
+def reencryption(service):
+    reencryption_service = ReencryptionService(service, batch_size=2, workers=2)
+    yield reencryption_service
+    reencryption_service.shutdown()
+
+def _wrapped_key_ids(service) -> set[str]:
+    return set(json.loads(service.config_repo.get_setting(DATA_KEYS_SETTING_KEY)))
+
+def _passwords(export_service: ExportService, path, master_password: str = None) -> dict[str, str]:
+    return {record["name"]: record["password"] for record in export_service.iter_archive_entries(
+        str(path), master_password=master_password, decrypt_passwords=True)}
+
+def test_rotacao_recifra_e_retira_a_chave_antiga(service, reencryption):
+    for i in range(10):
+        assert service.save_password_entry(f"entrada-{i}", f"segredo-{i}")
+    old_key_id, _ = service.active_data_key()
+
+    assert service.rotate_data_key("senha-errada") is None
+    new_key_id = service.rotate_data_key(MASTER_PASSWORD)
+    assert new_key_id and new_key_id != old_key_id
+    assert _wrapped_key_ids(service) == {old_key_id, new_key_id}
+    assert service.retrieve_password_by_name("entrada-0") == "segredo-0"  # Ainda pela DEK antiga
+
+    assert reencryption.run() == 10
+    assert service.repo.count_entries_by_key() == {new_key_id: 10}
+    assert _wrapped_key_ids(service) == {new_key_id}
+    assert not reencryption.has_pending_job()
+
+    service.logout()
+    assert service.login_with_master_password(MASTER_PASSWORD)
+    assert service.config_repo.get_setting(ACTIVE_DATA_KEY_SETTING_KEY) == new_key_id
+    assert [service.retrieve_password_by_name(f"entrada-{i}") for i in range(10)] == \
+        [f"segredo-{i}" for i in range(10)]
+
+def test_retirar_chaves_sem_sessao_nao_altera_o_cofre(service):
+    assert service.rotate_data_key(MASTER_PASSWORD)
+    key_ids = _wrapped_key_ids(service)
+    service.logout()
+    service.retire_unused_data_keys()
+    assert _wrapped_key_ids(service) == key_ids
+
+def test_backup_anterior_a_rotacao_continua_legivel(service, reencryption, tmp_path):
+    for i in range(5):
+        assert service.save_password_entry(f"entrada-{i}", f"segredo-{i}")
+    export_service = ExportService(service)
+    old_backup = tmp_path / "antes.bak"
+    assert export_service.export_encrypted_archive(str(old_backup)) == 5
+
+    old_key_id, _ = service.active_data_key()
+    assert service.rotate_data_key(MASTER_PASSWORD)
+    assert reencryption.run() == 5
+    assert old_key_id not in service._data_fernets  # A DEK do backup saiu do cofre
+
+    with pytest.raises(ValueError):
+        _passwords(export_service, old_backup)
+    with pytest.raises(ValueError):
+        _passwords(export_service, old_backup, master_password="senha-errada")
+    expected = {f"entrada-{i}": f"segredo-{i}" for i in range(5)}
+    assert _passwords(export_service, old_backup, MASTER_PASSWORD) == expected
+
+    new_backup = tmp_path / "depois.bak"
+    assert export_service.export_encrypted_archive(str(new_backup)) == 5
+    assert _passwords(export_service, new_backup) == expected  # Chave atual: sem a senha mestra
+
+def test_job_cancelado_e_retomado_do_checkpoint(service, reencryption):
+    for i in range(7):
+        assert service.save_password_entry(f"entrada-{i}", f"segredo-{i}")
+    new_key_id = service.rotate_data_key(MASTER_PASSWORD)
+
+    def cancel_after_first_batch(count: int):
+        reencryption.cancel()
+    assert reencryption.run(on_progress=cancel_after_first_batch) == 2
+    assert reencryption.has_pending_job()
+    assert service.repo.count_entries_by_key()[new_key_id] == 2
+
+    assert reencryption.resume_async().result(timeout=10) == 7
+    assert not reencryption.has_pending_job()
+    assert service.repo.count_entries_by_key() == {new_key_id: 7}
+    assert [service.retrieve_password_by_name(f"entrada-{i}") for i in range(7)] == \
+        [f"segredo-{i}" for i in range(7)]
+
+def test_senha_alterada_durante_a_recifragem_nao_e_sobrescrita(service, reencryption):
+    assert service.save_password_entry("email", "antiga")
+    service.rotate_data_key(MASTER_PASSWORD)
+    batch = service.repo.get_entries_outside_key(service.active_data_key()[0], 0, 10)
+
+    assert service.update_password_by_name("email", "nova")  # Depois da leitura do lote
+    rows = reencryption._reencrypt_batch(batch, *service.active_data_key())
+    assert service.repo.replace_encrypted_passwords(rows) == 0
+    assert service.retrieve_password_by_name("email") == "nova"
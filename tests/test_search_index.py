@@ -0,0 +1,49 @@
+# PasswordGenerate/tests/test_search_index.py
+
+import random
+
+from src.database.services.search_index import NameIndex
+
+def build_index(names) -> NameIndex:
+    index = NameIndex()
+    index.build((name, "2024-01-01 00:00:00") for name in names)
+    return index
+
+def test_prefixo_vem_antes_da_substring():
+    index = build_index(["Gmail pessoal", "gmail trabalho", "conta gmail", "Banco", "GMAILX"])
+    assert index.search("gmail") == ["Gmail pessoal", "gmail trabalho", "GMAILX", "conta gmail"]
+    assert index.search("gm", limit=2) == ["Gmail pessoal", "gmail trabalho"]
+    assert index.search("  ") == []
+
+def test_substring_em_ordem_alfabetica():
+    index = build_index(["zz-banco", "aa-banco", "mm-banco", "bancoxx"])
+    assert index.search("banco") == ["bancoxx", "aa-banco", "mm-banco", "zz-banco"]
+    assert index.search("banco", limit=2) == ["bancoxx", "aa-banco"]
+
+def test_aproximada_tolera_erro_de_digitacao():
+    index = build_index(["facebook", "netflix", "github"])
+    assert index.search("facebok") == ["facebook"]
+    assert index.search("xyzw") == []
+
+def test_muitos_candidatos_com_poucas_substrings():
+    # Milhares de nomes têm todos os trigramas de "abcabc" sem conter a substring;
+    # as poucas substrings verdadeiras precisam aparecer, sempre na mesma ordem
+    decoys = [f"abca-{i:05d}-cabc-bcab" for i in range(5000)]
+    matches = [f"x{i}-abcabc" for i in (7, 3, 9)]
+    names = decoys + matches
+    random.Random(1).shuffle(names)
+
+    index = build_index(names)
+    expected = ["x3-abcabc", "x7-abcabc", "x9-abcabc"]
+    assert index.search("abcabc", limit=3) == expected
+    assert build_index(reversed(names)).search("abcabc", limit=3) == expected
+
+def test_atualizacoes_incrementais():
+    index = build_index(["email", "banco"])
+    index.add("email secundario", "2024-01-02 00:00:00")
+    index.rename("banco", "cartao")
+    index.remove("email")
+    assert index.search("email") == ["email secundario"]
+    assert index.search("banco") == []
+    assert index.search("cartao") == ["cartao"]
+    assert index.created_at("cartao") == "2024-01-01 00:00:00"
@@ -0,0 +1,85 @@
+# PasswordGenerate/tests/test_session_manager.py
+
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from src.gui.session_manager import SessionManager
+from tests.conftest import MASTER_PASSWORD, open_service
+
+@pytest.fixture(scope="module")
+def qt_app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+def _process_events_until(qt_app, condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+def test_bloqueio_por_inatividade_interrompe_a_recifragem(qt_app, service):
+    from src.gui.options_screen import OptionsScreen
+
+    for i in range(100):
+        assert service.save_password_entry(f"entrada-{i}", f"segredo-{i}")
+    options_screen = OptionsScreen(service)
+    session_manager = SessionManager(service, idle_timeout=0.1, background_timeout=0)
+    session_manager.is_busy = options_screen.has_background_work  # Como em main_app.MainWindow
+    session_manager.stop_background_work = options_screen.stop_background_work
+    locked = []
+    session_manager.locked.connect(lambda: locked.append(True))
+    try:
+        reencryption = options_screen.reencryption_service
+        reencryption.batch_size = 1
+        new_key_id = service.rotate_data_key(MASTER_PASSWORD)
+        future = reencryption.resume_async(on_progress=lambda count: time.sleep(0.02))  # Cerca de 2 s
+        session_manager.session_started()
+
+        assert _process_events_until(qt_app, lambda: locked, timeout=1.5)
+        assert not session_manager.unlocked and future.done()
+        assert 0 < future.result() < 100  # Interrompida no meio, não adiada até o fim
+        assert reencryption.has_pending_job()
+
+        # Depois do desbloqueio, o job continua do checkpoint
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        assert reencryption.resume_async().result(timeout=10) == 100
+        assert service.repo.count_entries_by_key() == {new_key_id: 100}
+    finally:
+        options_screen.reencryption_service.shutdown()
+        options_screen.deleteLater()
+        session_manager.deleteLater()
+
+def test_desbloqueio_reaproveita_o_indice(qt_app, service, db_path):
+    session_manager = SessionManager(service, idle_timeout=0, background_timeout=0)
+    try:
+        assert service.save_password_entry("github", "segredo")
+        assert service.search_password_names("git") == ["github"]  # Constrói o índice
+        session_manager.lock()
+        assert service.active_data_key() is None and service.name_index.ready
+
+        builds = []
+        original_build = service.name_index.build
+        service.name_index.build = lambda entries: (builds.append(True), original_build(entries))
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        assert service.search_password_names("git") == ["github"]
+        assert builds == []  # Índice mantido pelo bloqueio
+
+        # Banco alterado por outro processo durante o bloqueio: o índice é refeito
+        session_manager.lock()
+        other_service = open_service(db_path)
+        assert other_service.login_with_master_password(MASTER_PASSWORD)
+        assert other_service.save_password_entry("gitlab", "segredo")
+        other_service.shutdown()
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        assert service.search_password_names("git") == ["github", "gitlab"]
+        assert builds == [True]
+
+        session_manager.logout()
+        assert not service.name_index.ready
+    finally:
+        session_manager.deleteLater()
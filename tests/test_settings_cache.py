@@ -0,0 +1,33 @@
+# PasswordGenerate/tests/test_settings_cache.py
+
+from src.database.services.security_service import MASTER_SALT_SETTING_KEY
+from tests.conftest import MASTER_PASSWORD
+
+def test_configuracoes_lidas_uma_vez_por_sessao(service):
+    service.logout()  # Nova sessão: o cache começa vazio
+    cache_loads = service.config_repo.cache_loads
+    settings_selects = []
+    conn = service.config_repo._get_connection()
+    conn.set_trace_callback(
+        lambda sql: settings_selects.append(sql) if sql.lstrip().upper().startswith("SELECT")
+        and "app_settings" in sql else None)
+    try:
+        assert service.is_master_password_set()
+        assert service.login_with_master_password(MASTER_PASSWORD)
+        for i in range(20):
+            assert service.save_password_entry(f"entrada-{i}", "segredo")
+        entry = service.get_all_password_entries_metadata()[0]
+        assert service.update_password_entry(entry.id, "novo-segredo")
+        for _ in range(100):
+            service.config_repo.get_setting(MASTER_SALT_SETTING_KEY)
+    finally:
+        conn.set_trace_callback(None)
+
+    assert len(settings_selects) == 1
+    assert service.config_repo.cache_loads == cache_loads + 1
+
+def test_gravacao_atualiza_o_cache(service):
+    assert service.config_repo.set_setting("tema", "escuro")
+    assert service.config_repo.get_setting("tema") == "escuro"
+    service.config_repo.clear_cache()
+    assert service.config_repo.get_setting("tema") == "escuro"  # Relido do disco